@@ -0,0 +1 @@
+"""Performance benchmarks of the calculator hot paths (run with ``python -m benchmarks``)"""
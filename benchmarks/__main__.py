@@ -0,0 +1,80 @@
+"""
+Run the benchmarks or compare them against a stored baseline
+
+Usage examples:
+  python -m benchmarks run                       # print the measurements
+  python -m benchmarks run --output benchmarks/baseline.json
+  python -m benchmarks compare                   # measure now, compare with benchmarks/baseline.json
+  python -m benchmarks compare old.json new.json --threshold 0.1
+"""
+
+import argparse
+import os
+import sys
+
+from . import suite
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog='python -m benchmarks', description="Calculator benchmarks")
+    commands = p.add_subparsers(dest='command', required=True)
+
+    def add_run_options(command):
+        command.add_argument('-k', '--filter', action='append', metavar='PATTERN',
+                             help="Only benchmarks matching a shell pattern, e.g. 'cost.*' (repeatable)")
+        command.add_argument('--scale', type=float, default=1.0, help='Multiply the items per benchmark')
+        command.add_argument('--repeat', type=int, default=5, help='Timed runs per benchmark (best is kept)')
+
+    run = commands.add_parser('run', help='Measure the benchmarks')
+    add_run_options(run)
+    run.add_argument('--output', help='Write the measurements as a baseline JSON file')
+
+    compare = commands.add_parser('compare', help='Flag regressions against a baseline (exit status 1)')
+    compare.add_argument('baseline', nargs='?', default=DEFAULT_BASELINE, help='Baseline JSON file')
+    compare.add_argument('current', nargs='?', help='Measurements to check (default: measure now)')
+    compare.add_argument('--threshold', type=float, default=suite.DEFAULT_THRESHOLD,
+                         help='Allowed growth of time and peak memory per item (0.2 = 20 percent)')
+    add_run_options(compare)
+    return p
+
+
+def print_result(name: str, result) -> None:
+    print(f"{name:<18} {result['items']:>9,d} items {result['seconds'] * 1e3:>10.2f} ms "
+          f"{result['items_per_second']:>14,.0f} items/s {result['peak_bytes'] / 2**20:>9.2f} MiB peak",
+          flush=True)
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    benchmarks = suite.select(args.filter)
+    if not benchmarks:
+        print(f"No benchmark matches {args.filter}", file=sys.stderr)
+        return 2
+
+    if args.command == 'run':
+        document = suite.run(benchmarks, args.scale, args.repeat, print_result)
+        if args.output:
+            suite.save(document, args.output)
+            print(f"Saved {args.output}")
+        return 0
+
+    baseline = suite.load(args.baseline)
+    if args.current:
+        current = suite.load(args.current)
+    else:
+        current = suite.run(benchmarks, args.scale, args.repeat, print_result)
+    regressions = suite.compare(baseline, current, args.threshold)
+    for r in regressions:
+        print(f"REGRESSION {r.name} {r.metric}: {r.baseline:.4g} -> {r.current:.4g} ({r.ratio:.2f}x)")
+    missing = sorted(set(current['results']) - set(baseline['results']))
+    if missing:
+        print(f"Not in the baseline: {', '.join(missing)}")
+    print(f"{len(regressions)} regressions beyond {args.threshold:.0%} "
+          f"({len(current['results'])} benchmarks against {args.baseline})")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Seeded synthetic rooms, materials and patterns for the benchmarks"""
+
+from typing import List, NamedTuple
+
+import numpy as np
+from src.models import (EstimateResult, FlooringMaterial, LayingPattern, MaterialTable, PatternLibrary,
+                        PatternTable, PatternType, RoomSpecification)
+
+MATERIAL_TYPES = ('tile', 'wood', 'laminate', 'stone', 'vinyl')
+
+
+class Portfolio(NamedTuple):
+    """Rooms with a material and pattern index each, plus the candidate tables"""
+    rooms: List[RoomSpecification]
+    areas: np.ndarray
+    materials: List[FlooringMaterial]
+    patterns: List[LayingPattern]
+    material_indices: np.ndarray
+    pattern_indices: np.ndarray
+    material_table: MaterialTable
+    pattern_table: PatternTable
+
+
+def rooms(n: int, seed: int = 0) -> List[RoomSpecification]:
+    """Rectangular rooms of 2-12 m by 2-9 m, every fourth with an alcove area"""
+    rng = np.random.default_rng(seed)
+    lengths = rng.uniform(2.0, 12.0, n).round(2)
+    widths = rng.uniform(2.0, 9.0, n).round(2)
+    extra = np.where(np.arange(n) % 4 == 0, rng.uniform(0.5, 4.0, n).round(2), 0.0)
+    return [RoomSpecification(length_m=float(l), width_m=float(w), room_name=f"Room {i}",
+                              additional_area_m2=float(a))
+            for i, (l, w, a) in enumerate(zip(lengths, widths, extra))]
+
+
+def materials(n: int, seed: int = 1) -> List[FlooringMaterial]:
+    """Catalog-like materials: per-m2 and per-piece, some sold in boxes"""
+    rng = np.random.default_rng(seed)
+    result = []
+    for i in range(n):
+        material_type = MATERIAL_TYPES[i % len(MATERIAL_TYPES)]
+        per_piece = i % 3 == 0
+        result.append(FlooringMaterial(
+            name=f"{material_type.title()} {i}",
+            material_type=material_type,
+            unit_cost=round(float(rng.uniform(8.0, 90.0)), 2),
+            unit_measurement='piece' if per_piece else 'm2',
+            units_per_box=int(rng.integers(6, 24)) if per_piece else None,
+            width_cm=float(rng.choice([10, 15, 20, 30, 60])),
+            length_cm=float(rng.choice([30, 60, 90, 120, 180])),
+            waste_factor=round(float(rng.uniform(0.05, 0.15)), 3),
+        ))
+    return result
+
+
+def patterns() -> List[LayingPattern]:
+    """The library pattern of every PatternType, with grout"""
+    return [PatternLibrary.pattern(pattern_type).thaw() for pattern_type in PatternType]
+
+
+def portfolio(n: int, n_materials: int = 200, seed: int = 2) -> Portfolio:
+    """``n`` rooms, each assigned one of ``n_materials`` materials and one pattern"""
+    rng = np.random.default_rng(seed)
+    room_list = rooms(n, seed)
+    material_list = materials(n_materials, seed + 1)
+    pattern_list = patterns()
+    return Portfolio(
+        rooms=room_list,
+        areas=np.array([room.get_total_area() for room in room_list]),
+        materials=material_list,
+        patterns=pattern_list,
+        material_indices=rng.integers(0, len(material_list), n),
+        pattern_indices=rng.integers(0, len(pattern_list), n),
+        material_table=MaterialTable.from_materials(material_list),
+        pattern_table=PatternTable.from_patterns(pattern_list),
+    )
+
+
+def results(n: int, seed: int = 3) -> List[EstimateResult]:
+    """Estimate records with realistic field values, for the report benchmarks"""
+    rng = np.random.default_rng(seed)
+    areas = rng.uniform(4.0, 100.0, n).round(2)
+    costs = areas * rng.uniform(20.0, 120.0, n)
+    return [EstimateResult(f"Room {i}", float(a), "Oak plank", float(a * 1.1), "m2", 10.0, "straight",
+                           "Simple straight laying pattern", float(c * 0.7), float(a * 15), float(a * 3.2),
+                           float(c), float(c / a), 1)
+            for i, (a, c) in enumerate(zip(areas, costs))]
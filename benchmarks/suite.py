@@ -0,0 +1,250 @@
+"""Benchmarks of the calculator hot paths, with baseline comparison"""
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+import fnmatch
+import io
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+from src.calculators import AreaCalculator, CostCalculator, MaterialCalculator, WasteCalculator
+from src.models import RoomTable
+from src.utils.report_generator import ReportGenerator
+
+from . import generators
+
+BASELINE_VERSION = 1
+
+# Slowdown (and peak memory growth) over the baseline reported as a regression
+DEFAULT_THRESHOLD = 0.20
+# Peak memory differences below this are noise, whatever the ratio
+MEMORY_FLOOR_BYTES = 256 * 1024
+
+# Setup: number of items -> (function timed, items it processes)
+Setup = Callable[[int], Tuple[Callable[[], Any], int]]
+
+
+class Benchmark(NamedTuple):
+    """One measured code path"""
+    name: str
+    size: int  # items per run at scale 1
+    setup: Setup
+
+
+class Regression(NamedTuple):
+    """A metric of a benchmark that got worse than the threshold allows"""
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float('inf')
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+# Items per run: scalar paths loop in Python, batch paths are vectorized
+SCALAR_SIZE = 20_000
+BATCH_SIZE = 500_000
+
+
+def benchmark(name: str, size: int) -> Callable[[Setup], Setup]:
+    """Register a setup function under ``name``"""
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name] = Benchmark(name, size, setup)
+        return setup
+    return register
+
+
+def _columns(p: generators.Portfolio) -> Dict[str, np.ndarray]:
+    """Per-room material and pattern columns, as the batch callers build them"""
+    m, t = p.material_indices, p.pattern_indices
+    return {
+        'waste_factors': p.material_table.waste_factor[m],
+        'pattern_waste': p.pattern_table.additional_waste_percentage[t],
+        'area_per_unit': p.material_table.area_per_unit[m],
+        'units_per_box': p.material_table.units_per_box[m],
+        'per_m2': p.material_table.per_m2[m],
+    }
+
+
+def _pairs(p: generators.Portfolio) -> List[Tuple[float, Any, Any]]:
+    return [(area, p.materials[m], p.patterns[t])
+            for area, m, t in zip(p.areas.tolist(), p.material_indices.tolist(), p.pattern_indices.tolist())]
+
+
+@benchmark('area.scalar', SCALAR_SIZE)
+def _area_scalar(n: int):
+    rooms = generators.rooms(n)
+    return lambda: [AreaCalculator.calculate_room_area(room) for room in rooms], n
+
+
+@benchmark('area.batch', BATCH_SIZE // 5)
+def _area_batch(n: int):
+    rooms = generators.rooms(n)
+    return lambda: AreaCalculator.calculate_room_area_batch(rooms), n
+
+
+@benchmark('area.table', BATCH_SIZE)
+def _area_table(n: int):
+    table = RoomTable.from_rooms(generators.rooms(n))
+    return lambda: AreaCalculator.calculate_room_area_batch(table), n
+
+
+@benchmark('waste.scalar', SCALAR_SIZE)
+def _waste_scalar(n: int):
+    rows = _pairs(generators.portfolio(n))
+    return lambda: [WasteCalculator.calculate_waste_quantity(a, m, p) for a, m, p in rows], n
+
+
+@benchmark('waste.batch', BATCH_SIZE)
+def _waste_batch(n: int):
+    p = generators.portfolio(n)
+    c = _columns(p)
+    return lambda: WasteCalculator.calculate_waste_quantity_batch(p.areas, c['waste_factors'],
+                                                                  c['pattern_waste']), n
+
+
+@benchmark('material.scalar', SCALAR_SIZE)
+def _material_scalar(n: int):
+    rows = _pairs(generators.portfolio(n))
+    return lambda: [MaterialCalculator.calculate_material_needed(a, m, p) for a, m, p in rows], n
+
+
+@benchmark('material.batch', BATCH_SIZE)
+def _material_batch(n: int):
+    p = generators.portfolio(n)
+    c = _columns(p)
+    return lambda: MaterialCalculator.calculate_material_needed_batch(
+        p.areas, c['waste_factors'], c['pattern_waste'], c['area_per_unit'], c['units_per_box'], c['per_m2']), n
+
+
+@benchmark('cost.scalar', SCALAR_SIZE)
+def _cost_scalar(n: int):
+    rows = _pairs(generators.portfolio(n))
+    return lambda: [CostCalculator.calculate_total_project_cost(a, m, p, 15.0, 50.0) for a, m, p in rows], n
+
+
+@benchmark('cost.batch', BATCH_SIZE)
+def _cost_batch(n: int):
+    p = generators.portfolio(n)
+    return lambda: CostCalculator.calculate_portfolio_cost(
+        p.areas, p.material_indices, p.pattern_indices, p.material_table, p.pattern_table, 15.0, 50.0), n
+
+
+@benchmark('report.scalar', SCALAR_SIZE // 4)
+def _report_scalar(n: int):
+    results = generators.results(n)
+    return lambda: [ReportGenerator.generate_project_report(r.room_name, r._asdict()) for r in results], n
+
+
+@benchmark('report.batch', SCALAR_SIZE)
+def _report_batch(n: int):
+    results = generators.results(n)
+    return lambda: list(ReportGenerator.render_reports(results)), n
+
+
+@benchmark('report.csv', BATCH_SIZE // 5)
+def _report_csv(n: int):
+    results = generators.results(n)
+    return lambda: ReportGenerator.write_csv(results, io.StringIO()), n
+
+
+def select(patterns: Optional[Iterable[str]] = None) -> List[Benchmark]:
+    """Benchmarks whose name matches any of the shell-style patterns (all by default)"""
+    patterns = list(patterns or ['*'])
+    return [b for name, b in BENCHMARKS.items() if any(fnmatch.fnmatchcase(name, p) for p in patterns)]
+
+
+def measure(bench: Benchmark, scale: float = 1.0, repeat: int = 5) -> Dict[str, float]:
+    """
+    Time one benchmark
+
+    After a warm-up run, the function is timed ``repeat`` times; the best
+    time gives the throughput, since slower runs measure other load on the
+    machine. Peak memory comes from one more run under tracemalloc, which
+    is not timed because tracing slows allocation down.
+    """
+    timed, items = bench.setup(max(1, int(bench.size * scale)))
+    timed()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        timed()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        timed()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    best = min(times)
+    return {'items': items, 'seconds': best, 'median_seconds': statistics.median(times),
+            'items_per_second': items / best if best > 0 else float('inf'), 'peak_bytes': peak}
+
+
+def run(benchmarks: Iterable[Benchmark], scale: float = 1.0, repeat: int = 5,
+        progress: Optional[Callable[[str, Dict[str, float]], None]] = None) -> Dict[str, Any]:
+    """Measure benchmarks into a baseline document (see ``save``)"""
+    results = {}
+    for bench in benchmarks:
+        results[bench.name] = measure(bench, scale, repeat)
+        if progress is not None:
+            progress(bench.name, results[bench.name])
+    return {
+        'version': BASELINE_VERSION,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': f"{platform.system()} {platform.machine()}",
+        'scale': scale,
+        'results': results,
+    }
+
+
+def save(document: Dict[str, Any], path: str) -> None:
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump(document, fh, indent=2, sort_keys=True)
+        fh.write('\n')
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path, encoding='utf-8') as fh:
+        document = json.load(fh)
+    if document.get('version') != BASELINE_VERSION:
+        raise ValueError(f"{path}: unsupported baseline version {document.get('version')!r}")
+    return document
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Regression]:
+    """
+    Regressions of ``current`` against ``baseline``
+
+    A benchmark regresses when its time or its peak memory per item grows
+    by more than ``threshold`` (and, for memory, by more than
+    MEMORY_FLOOR_BYTES over the run). Comparing per item keeps runs at
+    different scales comparable. Benchmarks missing from either side are
+    skipped.
+    """
+    regressions = []
+    for name, now in current['results'].items():
+        before = baseline['results'].get(name)
+        if before is None:
+            continue
+        base_time, now_time = before['seconds'] / before['items'], now['seconds'] / now['items']
+        if now_time > base_time * (1 + threshold):
+            regressions.append(Regression(name, 'seconds_per_item', base_time, now_time))
+        base_memory, now_memory = before['peak_bytes'] / before['items'], now['peak_bytes'] / now['items']
+        if (now_memory > base_memory * (1 + threshold)
+                and (now_memory - base_memory) * now['items'] > MEMORY_FLOOR_BYTES):
+            regressions.append(Regression(name, 'peak_bytes_per_item', base_memory, now_memory))
+    return regressions
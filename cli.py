@@ -4,13 +4,25 @@
 Usage examples:
   python cli.py --example living-room
   python cli.py --length 5 --width 4 --material-name "Ceramic" --unit-cost 25.5 --pattern straight --labor 15
+  python cli.py --batch rooms.csv --output estimates.csv --unit-cost 25.5 --labor 15
+  python cli.py --batch rooms.csv --output estimates.csv --profile --profile-dump batch.pstats
 """
 
 import argparse
+import os
 import sys
-from src.models import FlooringMaterial, LayingPattern, RoomSpecification, PatternType
-from src.calculators import AreaCalculator, MaterialCalculator, CostCalculator, WasteCalculator
+from typing import Optional
+from src.models import EstimateResult, FlooringMaterial, PatternLibrary, PriceBook, RoomSpecification, PatternType
+from src.calculators import EstimatePipeline
 from src.utils.report_generator import ReportGenerator
+from src.utils.unit_converter import UnitConverter
+
+# Batch and catalog modules (and NumPy) are imported by the commands that use
+# them, keeping single estimates fast to start (tests/test_cli_startup.py)
+
+
+# Every estimate field at full precision, for --batch output
+BATCH_COLUMNS = tuple((name, name, '', '') for name in EstimateResult._fields)
 
 
 def parse_pattern(value: str) -> PatternType:
@@ -21,15 +33,41 @@ def parse_pattern(value: str) -> PatternType:
     raise argparse.ArgumentTypeError(f"Unknown pattern '{value}'. Use one of: " + ", ".join([p.value for p in PatternType]))
 
 
+def parse_length(value: str):
+    """A plain number (in --length-unit, converted later) or a length with units such as 12ft 6in"""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        UnitConverter.parse_length(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+    return value
+
+
+def parse_unit(value: str) -> str:
+    try:
+        UnitConverter.length_factor(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+    return value
+
+
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Flooring Finishes Calculator — CLI")
 
     group = p.add_mutually_exclusive_group()
     group.add_argument('--example', choices=['living-room', 'bedroom'], help='Run a built-in example')
-    group.add_argument('--interactive', action='store_true', help='(Reserved) interactive mode (not implemented)')
+    group.add_argument('--interactive', action='store_true',
+                       help='Keep running and answer JSON estimate requests, one per line, on stdin (or --socket)')
+    group.add_argument('--batch', metavar='FILE',
+                       help='Estimate every room of a CSV or JSON Lines schedule; options below act as column defaults')
 
-    p.add_argument('--length', type=float, help='Room length in meters')
-    p.add_argument('--width', type=float, help='Room width in meters')
+    p.add_argument('--length', type=parse_length, help="Room length in --length-unit, or with units (12ft 6in, 12' 6\")")
+    p.add_argument('--width', type=parse_length, help='Room width, like --length')
+    p.add_argument('--length-unit', type=parse_unit, default='m',
+                   help='Unit of room lengths (m, cm, mm, ft, in, yd); schedule areas are in its square')
     p.add_argument('--room-name', default='Room', help='Room name')
 
     p.add_argument('--material-name', default='Material', help='Material name')
@@ -38,7 +76,11 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument('--unit-measurement', default='m2', help='Unit measurement, e.g., m2')
     p.add_argument('--width-cm', type=float, help='Material width in cm')
     p.add_argument('--length-cm', type=float, help='Material length in cm')
+    p.add_argument('--size-unit', type=parse_unit,
+                   help='Unit of --width-cm/--length-cm and of catalog file sizes instead of cm (and mm), e.g. in')
     p.add_argument('--waste-factor', type=float, default=0.10, help='Material waste factor (e.g., 0.10 for 10%)')
+    p.add_argument('--catalog', help='Material catalog: a saved catalog directory, or a CSV/JSON Lines SKU file')
+    p.add_argument('--sku', help='Take the material from --catalog instead of the material options')
 
     p.add_argument('--pattern', type=parse_pattern, default=PatternType.STRAIGHT, help='Laying pattern (straight, diagonal, herringbone, etc.)')
     p.add_argument('--pattern-waste', type=float, default=None, help='Override additional pattern waste percent (e.g., 5)')
@@ -46,65 +88,79 @@ def build_parser() -> argparse.ArgumentParser:
 
     p.add_argument('--labor', type=float, default=0.0, help='Labor cost per m2')
     p.add_argument('--additional-costs', type=float, default=0.0, help='Additional fixed costs')
+    p.add_argument('--price-book', help='JSON price book of consumable rates (default: built-in rates)')
+    p.add_argument('--region', help='Region of the price book rates to use')
 
     p.add_argument('--save-report', help='Save a text report to given filename')
+    p.add_argument('--socket', metavar='PATH', help='With --interactive, listen on a UNIX socket instead of stdin')
+
+    p.add_argument('--batch-format', choices=['csv', 'jsonl'], help='Schedule format (default: from the file extension)')
+    p.add_argument('--output', default='-', help='Batch results CSV file (default: stdout)')
+    p.add_argument('--output-format', choices=['csv', 'columns'], default='csv',
+                   help="Batch results as CSV, or as a directory of .npy columns ('columns', needs --output)")
+    p.add_argument('--rejects', help='File for malformed batch rows as JSON Lines (default: FILE.rejects.jsonl)')
+    p.add_argument('--chunk-size', type=int,
+                   help='Rows estimated per vectorized pass in batch mode (default: 10000)')
+
+    p.add_argument('--profile', action='store_true',
+                   help='Print calls and time per stage (parse, geometry, waste, material, cost, report) to stderr')
+    p.add_argument('--profile-dump', metavar='FILE',
+                   help='Also write cProfile statistics to FILE (read with python -m pstats FILE)')
 
     return p
 
 
+def catalog_material(path: str, sku: str, size_unit: Optional[str] = None) -> FlooringMaterial:
+    from src.catalog import MaterialCatalog
+
+    if not path:
+        raise SystemExit('--sku needs --catalog')
+    catalog = MaterialCatalog.open(path) if os.path.isdir(path) else MaterialCatalog.load(path, size_unit=size_unit)
+    row = catalog.find(sku)
+    if row is None:
+        raise SystemExit(f"SKU '{sku}' is not in {path}")
+    return catalog.material(row).thaw()
+
+
 def run_from_args(args: argparse.Namespace) -> str:
     # Build room
     room = RoomSpecification(
-        length_m=args.length,
-        width_m=args.width,
+        length_m=UnitConverter.parse_length(args.length, args.length_unit),
+        width_m=UnitConverter.parse_length(args.width, args.length_unit),
         room_name=args.room_name
     )
 
     # Build material
-    material = FlooringMaterial(
-        name=args.material_name,
-        material_type=args.material_type,
-        unit_cost=args.unit_cost,
-        unit_measurement=args.unit_measurement,
-        width_cm=args.width_cm,
-        length_cm=args.length_cm,
-        waste_factor=args.waste_factor
-    )
+    size = UnitConverter.length_factor(args.size_unit, 'cm') if args.size_unit else 1.0
+    if args.sku:
+        material = catalog_material(args.catalog, args.sku, args.size_unit)
+    else:
+        material = FlooringMaterial(
+            name=args.material_name,
+            material_type=args.material_type,
+            unit_cost=args.unit_cost,
+            unit_measurement=args.unit_measurement,
+            width_cm=None if args.width_cm is None else args.width_cm * size,
+            length_cm=None if args.length_cm is None else args.length_cm * size,
+            waste_factor=args.waste_factor
+        )
 
     # Build pattern
-    pattern = LayingPattern(
-        pattern_type=args.pattern,
-        description=args.pattern.value,
-        additional_waste_percentage=(args.pattern_waste if args.pattern_waste is not None else args.pattern.value and 0),
-        joints_width_mm=3.0,
+    pattern = PatternLibrary.pattern(
+        args.pattern, material.material_type, material.width_cm, material.length_cm,
+        additional_waste_percentage=args.pattern_waste,
         grout_consumption_kg_per_m2=args.grout_kg_per_m2
     )
 
-    area = AreaCalculator.calculate_room_area(room)
-    waste_qty, waste_details = WasteCalculator.calculate_waste_quantity(area, material, pattern)
-    material_info = MaterialCalculator.calculate_material_needed(area, material, pattern)
-    consumables = MaterialCalculator.calculate_consumables(area, pattern)
-    cost_info = CostCalculator.calculate_total_project_cost(
-        area, material, pattern, labor_cost_per_m2=args.labor, additional_costs=args.additional_costs
-    )
+    rates = None
+    if args.price_book:
+        rates = PriceBook.load(args.price_book).rates(material.material_type, args.region)
 
-    report_data = {
-        'room_name': room.room_name,
-        'area_m2': area,
-        'material_name': material.name,
-        'quantity_units': material_info['quantity_units'],
-        'unit_measurement': material_info['unit_measurement'],
-        'waste_percent': (waste_details.get('waste_percentage') if waste_details else 0),
-        'pattern_name': pattern.pattern_type.value,
-        'pattern_description': pattern.description,
-        'material_cost': cost_info['material_cost'],
-        'labor_cost': cost_info['labor_cost'],
-        'consumable_cost': cost_info['consumable_cost'],
-        'total_cost': cost_info['total_cost'],
-        'cost_per_m2': cost_info['cost_per_m2']
-    }
-
-    report = ReportGenerator.generate_project_report(room.room_name, report_data)
+    estimate = EstimatePipeline.run(
+        room, material, pattern, labor_cost_per_m2=args.labor, additional_costs=args.additional_costs,
+        rates=rates,
+    )
+    report = ReportGenerator.generate_estimate_report(estimate)
 
     # Print summary
     print(report)
@@ -112,11 +168,115 @@ def run_from_args(args: argparse.Namespace) -> str:
     return report
 
 
+def run_session(args: argparse.Namespace) -> None:
+    """Answer estimate requests from one warm process; options act as request defaults"""
+    from src.utils.estimate_session import EstimateSession
+
+    catalog = None
+    if args.catalog:
+        from src.catalog import MaterialCatalog
+        catalog = (MaterialCatalog.open(args.catalog) if os.path.isdir(args.catalog)
+                   else MaterialCatalog.load(args.catalog, size_unit=args.size_unit))
+    price_book = PriceBook.load(args.price_book) if args.price_book else None
+    session = EstimateSession(vars(args), catalog, price_book, args.region)
+    # Load every module and cache an estimate needs before the first request
+    session.handle('{"length": 1, "width": 1}')
+    session.requests = 0
+
+    if args.socket:
+        with session.server(args.socket) as server:
+            print(f"Listening on {args.socket}", file=sys.stderr)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os.remove(args.socket)
+    else:
+        session.serve(sys.stdin, sys.stdout)
+
+
+def run_batch(args: argparse.Namespace) -> dict:
+    """Stream a room schedule through the estimators, writing results as they are ready"""
+    from src.calculators import ParallelEstimator
+    from src.calculators.parallel_estimator import STREAM_CHUNK_SIZE
+    from src.utils.column_store import ColumnStore
+    from src.utils.room_schedule import RoomSchedule
+
+    chunk_size = args.chunk_size or STREAM_CHUNK_SIZE
+    fmt = args.batch_format or RoomSchedule.detect_format(args.batch)
+    rejects_path = args.rejects or args.batch + '.rejects.jsonl'
+    defaults = vars(args)
+    summary = {'rooms': 0, 'rejected': 0, 'total_area_m2': 0.0, 'total_cost': 0.0}
+
+    columnar = args.output_format == 'columns'
+    if columnar and args.output == '-':
+        raise SystemExit('--output-format columns needs an --output directory')
+    out = sys.stdout if args.output == '-' or columnar else open(args.output, 'w', newline='', encoding='utf-8')
+    try:
+        with open(args.batch, newline='', encoding='utf-8') as source, \
+                open(rejects_path, 'w', encoding='utf-8') as rejects_file:
+            write_reject = RoomSchedule.reject_writer(rejects_file)
+
+            def reject(line_no, raw, error):
+                summary['rejected'] += 1
+                write_reject(line_no, raw, error)
+
+            rows = RoomSchedule.read(source, fmt, defaults, reject)
+
+            def tally(results):
+                for result in results:
+                    summary['total_area_m2'] += result.area_m2
+                    summary['total_cost'] += result.total_cost
+                    yield result
+
+            price_book = PriceBook.load(args.price_book) if args.price_book else None
+            results = tally(ParallelEstimator.estimate_stream(rows, chunk_size, price_book, args.region))
+            if columnar:
+                summary['rooms'] = ColumnStore.write(results, args.output, chunk_size)
+            else:
+                summary['rooms'] = ReportGenerator.write_csv(results, out, BATCH_COLUMNS)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"Estimated {summary['rooms']} rooms ({summary['total_area_m2']:.2f} m², "
+          f"€{summary['total_cost']:.2f}); {summary['rejected']} rejected rows in {rejects_path}",
+          file=sys.stderr)
+    return summary
+
+
 def main():
     parser = build_parser()
     args = parser.parse_args()
 
+    if not (args.profile or args.profile_dump):
+        run(parser, args)
+        return
+
+    from src.utils.profiler import Profiler
+
+    profiler = Profiler(cprofile=bool(args.profile_dump))
+    try:
+        with profiler:
+            run(parser, args)
+    finally:
+        if args.profile_dump:
+            profiler.dump_stats(args.profile_dump)
+        print(profiler.report(), file=sys.stderr)
+
+
+def run(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    if args.batch:
+        run_batch(args)
+        return
+
+    if args.interactive:
+        run_session(args)
+        return
+
     if args.example:
+        args.length_unit, args.size_unit = 'm', None
         if args.example == 'living-room':
             args.length = 5.0
             args.width = 4.0
@@ -1,6 +1,25 @@
 """
 Flooring Finishes Calculator - A comprehensive tool for calculating flooring requirements
+
+Subpackages, and the names exported by src.models and src.calculators, are
+imported on first access. A scalar estimate (``cli.py --example``) then
+loads only the modules it uses and never NumPy, which the batch code paths
+import when they run.
 """
 
+from importlib import import_module
+
 __version__ = "1.0.0"
 __author__ = "Flooring Calculator Team"
+
+_SUBPACKAGES = ('calculators', 'catalog', 'models', 'utils')
+
+
+def __getattr__(name: str):
+    if name not in _SUBPACKAGES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module('.' + name, __name__)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBPACKAGES))
@@ -1,8 +1,47 @@
 """Calculators for flooring requirements"""
 
-from .area_calculator import AreaCalculator
-from .material_calculator import MaterialCalculator
-from .cost_calculator import CostCalculator
-from .waste_calculator import WasteCalculator
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ['AreaCalculator', 'MaterialCalculator', 'CostCalculator', 'WasteCalculator']
+# Public name -> submodule defining it, imported on first access (see src/__init__.py)
+_EXPORTS = {
+    'AreaCalculator': '.area_calculator',
+    'MaterialCalculator': '.material_calculator',
+    'CostCalculator': '.cost_calculator',
+    'WasteCalculator': '.waste_calculator',
+    'LayoutCalculator': '.layout_calculator',
+    'MotifCalculator': '.motif_calculator',
+    'PlankSequencer': '.plank_sequencer',
+    'ScenarioCalculator': '.scenario_calculator',
+    'ParallelEstimator': '.parallel_estimator',
+    'Estimate': '.estimate_pipeline',
+    'EstimatePipeline': '.estimate_pipeline',
+    'ProjectEstimate': '.project_estimate',
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .area_calculator import AreaCalculator
+    from .material_calculator import MaterialCalculator
+    from .cost_calculator import CostCalculator
+    from .waste_calculator import WasteCalculator
+    from .layout_calculator import LayoutCalculator
+    from .motif_calculator import MotifCalculator
+    from .plank_sequencer import PlankSequencer
+    from .scenario_calculator import ScenarioCalculator
+    from .parallel_estimator import ParallelEstimator
+    from .estimate_pipeline import Estimate, EstimatePipeline
+    from .project_estimate import ProjectEstimate
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(import_module(module, __name__), name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
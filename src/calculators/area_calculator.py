@@ -1,7 +1,10 @@
 """Calculate flooring areas based on room specifications and layouts"""
 
 from src.models import RoomSpecification
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    from src.models import RoomTable
 
 
 class AreaCalculator:
@@ -12,6 +15,26 @@ class AreaCalculator:
         """Calculate total floor area for a room"""
         return room.get_total_area()
     
+    @staticmethod
+    def calculate_room_area_batch(rooms: Union[Sequence[RoomSpecification], "RoomTable"]):
+        """
+        Calculate floor areas for many rooms in one vectorized pass
+
+        Args:
+            rooms: Rooms, or a RoomTable (e.g. RoomTable.from_rectangles
+                over length and width columns) to skip reading the rooms
+
+        Returns:
+            NumPy array of areas in m2, in the order of ``rooms``
+        """
+        from src.models import RoomTable
+        from src.utils.geometry import polygon_areas
+
+        table = rooms if isinstance(rooms, RoomTable) else RoomTable.from_rooms(rooms)
+        areas = table.length_m * table.width_m
+        areas[table.outline_rows] = polygon_areas(table.coords, table.offsets)
+        return areas + table.additional_area_m2
+
     @staticmethod
     def calculate_area_with_angles(length_m: float, width_m: float, 
                                    angle_degrees: float = 0) -> float:
@@ -29,6 +52,22 @@ class AreaCalculator:
         """Calculate room perimeter"""
         return room.get_perimeter()
     
+    @staticmethod
+    def calculate_perimeter_batch(rooms: Union[Sequence[RoomSpecification], "RoomTable"]):
+        """
+        Calculate perimeters for many rooms in one vectorized pass
+
+        Returns:
+            NumPy array of perimeters in m, in the order of ``rooms``
+        """
+        from src.models import RoomTable
+        from src.utils.geometry import polygon_perimeters
+
+        table = rooms if isinstance(rooms, RoomTable) else RoomTable.from_rooms(rooms)
+        perimeters = 2 * (table.length_m + table.width_m)
+        perimeters[table.outline_rows] = polygon_perimeters(table.coords, table.offsets)
+        return perimeters
+
     @staticmethod
     def calculate_border_area(room: RoomSpecification, border_width_m: float) -> float:
         """Calculate area needed for border flooring"""
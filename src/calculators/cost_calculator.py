@@ -1,8 +1,23 @@
 """Calculate costs for flooring projects"""
 
-from src.models import FlooringMaterial, LayingPattern
-from src.calculators import MaterialCalculator
-from typing import Dict
+from src.models import (ConsumableRates, CostResult, FlooringMaterial, LayingPattern, MaterialResult,
+                        ResultBatch)
+from src.models.price_book import DEFAULT_RATES
+from .material_calculator import MaterialCalculator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    from src.models import MaterialTable, PatternTable
+
+
+# Estimated consumable prices (see PriceBook for per material type and region prices)
+GROUT_PRICE_PER_KG = DEFAULT_RATES.grout_price_per_kg
+ADHESIVE_PRICE_PER_KG = DEFAULT_RATES.adhesive_price_per_kg
+SEALER_PRICE_PER_LITER = DEFAULT_RATES.sealer_price_per_liter
+
+# Entries kept by calculate_total_project_cost_cached
+CACHE_SIZE = 65536
 
 
 class CostCalculator:
@@ -10,14 +25,20 @@ class CostCalculator:
     
     @staticmethod
     def calculate_material_cost(total_area: float, material: FlooringMaterial,
-                               pattern: LayingPattern) -> Dict:
+                               pattern: LayingPattern,
+                               material_info: Optional[MaterialResult] = None) -> Dict:
         """
         Calculate total material cost
         
+        Args:
+            material_info: Result of MaterialCalculator.calculate_material_needed,
+                if already computed
+        
         Returns:
             Dictionary with cost breakdown
         """
-        material_info = MaterialCalculator.calculate_material_needed(total_area, material, pattern)
+        if material_info is None:
+            material_info = MaterialCalculator.calculate_material_needed(total_area, material, pattern)
         quantity_units = material_info['quantity_units']
         
         material_cost = quantity_units * material.unit_cost
@@ -33,7 +54,8 @@ class CostCalculator:
     def calculate_total_project_cost(total_area: float, material: FlooringMaterial,
                                     pattern: LayingPattern,
                                     labor_cost_per_m2: float = 0,
-                                    additional_costs: float = 0) -> Dict:
+                                    additional_costs: float = 0,
+                                    rates: Optional[ConsumableRates] = None) -> CostResult:
         """
         Calculate total project cost including material, labor, and other costs
         
@@ -43,43 +65,231 @@ class CostCalculator:
             pattern: LayingPattern instance
             labor_cost_per_m2: Labor cost per square meter
             additional_costs: Any additional costs (delivery, prep, etc.)
+            rates: Consumable rates, e.g. PriceBook.rates(material.material_type)
         
         Returns:
             Complete cost breakdown
         """
         material_cost_info = CostCalculator.calculate_material_cost(total_area, material, pattern)
-        material_cost = material_cost_info['material_cost']
+        consumables_info = MaterialCalculator.calculate_consumables(total_area, pattern, rates)
         
-        labor_cost = total_area * labor_cost_per_m2
-        consumables_info = MaterialCalculator.calculate_consumables(total_area, pattern)
+        return CostCalculator.combine_costs(
+            total_area,
+            material_cost_info['material_cost'],
+            CostCalculator.calculate_consumable_cost(consumables_info, rates),
+            labor_cost_per_m2,
+            additional_costs,
+        )
+    
+    @staticmethod
+    def calculate_total_project_cost_cached(total_area: float, material: FlooringMaterial,
+                                            pattern: LayingPattern,
+                                            labor_cost_per_m2: float = 0,
+                                            additional_costs: float = 0,
+                                            rates: Optional[ConsumableRates] = None) -> CostResult:
+        """
+        Memoized calculate_total_project_cost keyed on frozen models and rates
         
-        # Estimate consumable costs
+        Returns:
+            The cached (immutable) cost breakdown
+        """
+        return _total_project_cost(total_area, material.freeze(), pattern.freeze(),
+                                   labor_cost_per_m2, additional_costs, rates or DEFAULT_RATES)
+    
+    @staticmethod
+    def cache_info():
+        """Hit/miss statistics of calculate_total_project_cost_cached"""
+        return _total_project_cost.cache_info()
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all memoized project costs"""
+        _total_project_cost.cache_clear()
+    
+    @staticmethod
+    def calculate_consumable_cost(consumables_info, rates: Optional[ConsumableRates] = None) -> float:
+        """Estimate the cost of consumables from MaterialCalculator.calculate_consumables"""
+        rates = rates or DEFAULT_RATES
         consumable_cost = 0
         if 'grout_kg' in consumables_info:
-            consumable_cost += consumables_info['grout_kg'] * 2.5  # ~2.5 per kg
+            consumable_cost += consumables_info['grout_kg'] * rates.grout_price_per_kg
         if 'adhesive_kg' in consumables_info:
-            consumable_cost += consumables_info['adhesive_kg'] * 0.8  # ~0.8 per kg
+            consumable_cost += consumables_info['adhesive_kg'] * rates.adhesive_price_per_kg
         if 'sealer_liters' in consumables_info:
-            consumable_cost += consumables_info['sealer_liters'] * 15  # ~15 per liter
+            consumable_cost += consumables_info['sealer_liters'] * rates.sealer_price_per_liter
+        return consumable_cost
+    
+    @staticmethod
+    def combine_costs(total_area: float, material_cost: float, consumable_cost: float,
+                      labor_cost_per_m2: float = 0, additional_costs: float = 0) -> CostResult:
+        """
+        Combine already computed cost components into the project breakdown
         
+        Returns:
+            Complete cost breakdown, as calculate_total_project_cost
+        """
+        labor_cost = total_area * labor_cost_per_m2
         total_cost = material_cost + labor_cost + consumable_cost + additional_costs
         
-        return {
-            'area_m2': total_area,
+        return CostResult(
+            area_m2=total_area,
+            material_cost=material_cost,
+            labor_cost=labor_cost,
+            labor_cost_per_m2=labor_cost_per_m2,
+            consumable_cost=consumable_cost,
+            additional_costs=additional_costs,
+            total_cost=total_cost,
+            cost_per_m2=total_cost / total_area if total_area > 0 else 0,
+        )
+    
+    @staticmethod
+    def calculate_portfolio_cost(total_areas, material_indices, pattern_indices,
+                                 materials: Union[Sequence[FlooringMaterial], "MaterialTable"],
+                                 patterns: Union[Sequence[LayingPattern], "PatternTable"],
+                                 labor_cost_per_m2=0, additional_costs=0,
+                                 rates: Optional[ConsumableRates] = None) -> ResultBatch:
+        """
+        Calculate total project costs for a whole portfolio of rooms at once
+        
+        Every room picks its material and pattern by index, so a million rooms
+        priced against a few hundred catalog entries are evaluated in one
+        vectorized pass. Each element matches calculate_total_project_cost.
+        
+        Args:
+            total_areas: Flooring area of every room in m2
+            material_indices: Index into ``materials`` per room
+            pattern_indices: Index into ``patterns`` per room
+            materials: Materials, or a prebuilt MaterialTable
+            patterns: Patterns, or a prebuilt PatternTable
+            labor_cost_per_m2: Labor rate, scalar or per room
+            additional_costs: Additional fixed costs, scalar or per room
+            rates: Consumable rates, scalar or per material (PriceBook.rate_table)
+        
+        Returns:
+            ResultBatch of CostResult columns plus quantity_units, boxes_needed
+            and grout_kg (kept for reprice_batch)
+        """
+        import numpy as np
+        from src.models import MaterialTable, PatternTable
+        
+        if not isinstance(materials, MaterialTable):
+            materials = MaterialTable.from_materials(materials)
+        if not isinstance(patterns, PatternTable):
+            patterns = PatternTable.from_patterns(patterns)
+        
+        total_areas = np.asarray(total_areas, dtype=np.float64)
+        m = np.asarray(material_indices, dtype=np.intp)
+        p = np.asarray(pattern_indices, dtype=np.intp)
+        
+        material_info = MaterialCalculator.calculate_material_needed_batch(
+            total_areas,
+            materials.waste_factor[m],
+            patterns.additional_waste_percentage[p],
+            materials.area_per_unit[m],
+            materials.units_per_box[m],
+            materials.per_m2[m],
+        )
+        quantity_units = material_info['quantity_units']
+        material_cost = quantity_units * materials.unit_cost[m]
+        
+        rates = (rates or DEFAULT_RATES).take(m)
+        consumables = MaterialCalculator.calculate_consumables_batch(total_areas, patterns.grout_kg_per_m2[p], rates)
+        costs = CostCalculator.combine_costs_batch(
+            total_areas, material_cost, CostCalculator.calculate_consumable_cost_batch(consumables, rates),
+            labor_cost_per_m2, additional_costs,
+        )
+        costs['quantity_units'] = quantity_units
+        costs['boxes_needed'] = material_info['boxes_needed']
+        costs['grout_kg'] = consumables['grout_kg']
+        return costs
+    
+    @staticmethod
+    def calculate_consumable_cost_batch(consumables: ResultBatch, rates: Optional[ConsumableRates] = None):
+        """Consumable cost per row from MaterialCalculator.calculate_consumables_batch"""
+        rates = rates or DEFAULT_RATES
+        return (consumables['grout_kg'] * rates.grout_price_per_kg
+                + consumables['adhesive_kg'] * rates.adhesive_price_per_kg
+                + consumables['sealer_liters'] * rates.sealer_price_per_liter)
+    
+    @staticmethod
+    def reprice_batch(costs: ResultBatch, rates: ConsumableRates) -> ResultBatch:
+        """
+        Reprice stored cost columns with other consumable rates
+        
+        Only consumables and the totals depending on them are recomputed,
+        from the stored area_m2 and grout_kg columns; geometry, waste and
+        material quantities are left as they are.
+        
+        Args:
+            costs: Columns with area_m2, grout_kg, material_cost,
+                labor_cost_per_m2 and additional_costs (e.g. from
+                calculate_portfolio_cost or ProjectEstimate.columns)
+            rates: New rates, scalar or per row
+        
+        Returns:
+            ResultBatch with the repriced CostResult columns, other columns kept
+        """
+        missing = [key for key in ('area_m2', 'grout_kg', 'material_cost', 'labor_cost_per_m2',
+                                   'additional_costs') if key not in costs]
+        if missing:
+            raise ValueError(f"Cannot reprice without columns {missing}")
+        consumables = MaterialCalculator.calculate_consumables_batch(costs['area_m2'], 0, rates)
+        consumables['grout_kg'] = costs['grout_kg']
+        repriced = CostCalculator.combine_costs_batch(
+            costs['area_m2'], costs['material_cost'],
+            CostCalculator.calculate_consumable_cost_batch(consumables, rates),
+            costs['labor_cost_per_m2'], costs['additional_costs'],
+        )
+        columns = dict(costs.items())
+        columns.update(consumables.items())
+        columns.update(repriced.items())
+        return ResultBatch(costs.record, columns)
+    
+    @staticmethod
+    def combine_costs_batch(total_areas, material_cost, consumable_cost,
+                            labor_cost_per_m2=0, additional_costs=0) -> ResultBatch:
+        """
+        Combine cost columns into the project breakdown, as combine_costs
+        
+        Returns:
+            ResultBatch of CostResult columns
+        """
+        import numpy as np
+        
+        total_areas = np.asarray(total_areas, dtype=np.float64)
+        labor_cost_per_m2 = np.broadcast_to(np.asarray(labor_cost_per_m2, dtype=np.float64), total_areas.shape)
+        additional_costs = np.broadcast_to(np.asarray(additional_costs, dtype=np.float64), total_areas.shape)
+        labor_cost = total_areas * labor_cost_per_m2
+        
+        total_cost = material_cost + labor_cost + consumable_cost + additional_costs
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cost_per_m2 = np.where(total_areas > 0, total_cost / total_areas, 0.0)
+        
+        return ResultBatch(CostResult, {
+            'area_m2': total_areas,
             'material_cost': material_cost,
             'labor_cost': labor_cost,
             'labor_cost_per_m2': labor_cost_per_m2,
             'consumable_cost': consumable_cost,
             'additional_costs': additional_costs,
             'total_cost': total_cost,
-            'cost_per_m2': total_cost / total_area if total_area > 0 else 0,
-        }
+            'cost_per_m2': cost_per_m2,
+        })
     
     @staticmethod
     def get_cost_summary(total_area: float, material: FlooringMaterial,
                         pattern: LayingPattern,
-                        labor_cost_per_m2: float = 0) -> Dict:
+                        labor_cost_per_m2: float = 0) -> CostResult:
         """Get comprehensive cost summary for project"""
         return CostCalculator.calculate_total_project_cost(
             total_area, material, pattern, labor_cost_per_m2
         )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _total_project_cost(total_area: float, material, pattern,
+                        labor_cost_per_m2: float, additional_costs: float,
+                        rates: ConsumableRates) -> CostResult:
+    return CostCalculator.calculate_total_project_cost(
+        total_area, material, pattern, labor_cost_per_m2, additional_costs, rates
+    )
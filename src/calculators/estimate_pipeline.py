@@ -0,0 +1,204 @@
+"""Evaluate a room estimate as a dependency graph, each quantity computed once"""
+
+from src.models import (ConsumableRates, ConsumablesResult, CostResult, EstimateResult, FlooringMaterial,
+                        LayingPattern, MaterialResult, RoomSpecification, WasteResult)
+from .area_calculator import AreaCalculator
+from .cost_calculator import CostCalculator
+from .material_calculator import MaterialCalculator
+from .waste_calculator import WasteCalculator
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+# Material types laid piece by piece by default (PlankSequencer.PLANK_MATERIAL_TYPES;
+# named here so that estimates of other materials do not import the NumPy engines)
+LAYOUT_MATERIAL_TYPES = ('wood', 'laminate')
+
+
+def _layout(est: "Estimate") -> Optional[Dict]:
+    if est.layout is not None:
+        return est.layout
+    if EstimatePipeline.simulates(est.room, est.material):
+        from .layout_calculator import LayoutCalculator
+        # Installers reuse offcuts whatever the pattern (PlankSequencer always does)
+        return LayoutCalculator.simulate_layout(est.room, est.material, est.pattern, reuse_offcuts=True)
+    return None
+
+
+def _waste(est: "Estimate") -> Tuple[float, WasteResult]:
+    if est['layout'] is not None:
+        return WasteCalculator.calculate_waste_from_layout(est['layout'])
+    return WasteCalculator.calculate_waste_quantity(est['area'], est.material, est.pattern)
+
+
+def _material_cost(est: "Estimate") -> Dict:
+    return CostCalculator.calculate_material_cost(
+        est['area'], est.material, est.pattern, material_info=est['material']
+    )
+
+
+def _cost(est: "Estimate") -> CostResult:
+    return CostCalculator.combine_costs(
+        est['area'],
+        est['material_cost']['material_cost'],
+        CostCalculator.calculate_consumable_cost(est['consumables'], est.rates),
+        est.labor_cost_per_m2,
+        est.additional_costs,
+    )
+
+
+class EstimatePipeline:
+    """
+    The estimate graph: node name -> (inputs read, upstream nodes, function)
+
+    Nodes are listed in dependency order. Each function receives the
+    Estimate and reads its upstream values through ``est[name]``.
+    """
+
+    NODES: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...], Callable[["Estimate"], Any]]] = {
+        'area': (('room',), (), lambda est: AreaCalculator.calculate_room_area(est.room)),
+        'layout': (('room', 'material', 'pattern', 'layout'), (), _layout),
+        'waste': (('material', 'pattern'), ('area', 'layout'), _waste),
+        'material': (('material', 'pattern'), ('area', 'layout'),
+                     lambda est: MaterialCalculator.calculate_material_needed(
+                         est['area'], est.material, est.pattern, est['layout'])),
+        'consumables': (('pattern', 'rates'), ('area',),
+                        lambda est: MaterialCalculator.calculate_consumables(est['area'], est.pattern, est.rates)),
+        'material_cost': (('material',), ('area', 'material'), _material_cost),
+        'cost': (('labor_cost_per_m2', 'additional_costs', 'rates'),
+                 ('area', 'material_cost', 'consumables'), _cost),
+    }
+
+    @staticmethod
+    def simulates(room: RoomSpecification, material: FlooringMaterial) -> bool:
+        """
+        Whether estimates of this room lay the pieces out instead of using flat waste factors
+
+        True for wood and laminate with a known piece size. The simulation
+        covers the outline only, so rooms with additional area keep the
+        flat factors.
+        """
+        return bool(material.material_type in LAYOUT_MATERIAL_TYPES and material.width_cm
+                    and material.length_cm and not room.additional_area_m2)
+
+    @staticmethod
+    def dependents(changed: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Nodes that have to be recomputed when the given inputs change"""
+        stale = set()
+        for name, (inputs, upstream, _) in EstimatePipeline.NODES.items():
+            if stale.intersection(upstream) or set(inputs).intersection(changed):
+                stale.add(name)
+        return tuple(name for name in EstimatePipeline.NODES if name in stale)
+
+    @staticmethod
+    def run(room: RoomSpecification, material: FlooringMaterial, pattern: LayingPattern,
+            labor_cost_per_m2: float = 0, additional_costs: float = 0,
+            layout: Optional[Dict] = None, rates: Optional[ConsumableRates] = None) -> "Estimate":
+        """Build an Estimate and evaluate every node"""
+        estimate = Estimate(room, material, pattern, labor_cost_per_m2, additional_costs, layout, rates)
+        estimate.evaluate()
+        return estimate
+
+
+class Estimate:
+    """
+    One room's estimate, evaluated lazily along EstimatePipeline.NODES
+
+    Every node is computed at most once and shared by all nodes that read
+    it; changing an input with ``update`` only drops the nodes downstream
+    of it.
+
+    Args:
+        room: RoomSpecification instance
+        material: FlooringMaterial instance
+        pattern: LayingPattern instance
+        labor_cost_per_m2: Labor cost per square meter
+        additional_costs: Any additional costs (delivery, prep, etc.)
+        layout: Optional result of LayoutCalculator.simulate_layout; waste and
+            quantities come from the simulated piece count. Wood and laminate
+            with a known piece size are simulated when none is given
+        rates: Consumable rates, e.g. PriceBook.rates(material.material_type);
+            changing them recomputes only consumables and cost
+    """
+
+    INPUTS = ('room', 'material', 'pattern', 'labor_cost_per_m2', 'additional_costs', 'layout', 'rates')
+
+    def __init__(self, room: RoomSpecification, material: FlooringMaterial,
+                 pattern: LayingPattern, labor_cost_per_m2: float = 0,
+                 additional_costs: float = 0, layout: Optional[Dict] = None,
+                 rates: Optional[ConsumableRates] = None):
+        self.room = room
+        self.material = material
+        self.pattern = pattern
+        self.labor_cost_per_m2 = labor_cost_per_m2
+        self.additional_costs = additional_costs
+        self.layout = layout
+        self.rates = rates
+        self._values: Dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        """Value of a node, computing it (and its upstream nodes) on first access"""
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        value = EstimatePipeline.NODES[name][2](self)
+        self._values[name] = value
+        return value
+
+    def evaluate(self) -> "Estimate":
+        """Compute every node that is not yet known"""
+        for name in EstimatePipeline.NODES:
+            self[name]
+        return self
+
+    def update(self, **inputs) -> "Estimate":
+        """Change inputs and drop only the nodes that depend on them"""
+        for key, value in inputs.items():
+            if key not in self.INPUTS:
+                raise ValueError(f"Unknown estimate input '{key}'")
+            setattr(self, key, value)
+        for name in EstimatePipeline.dependents(tuple(inputs)):
+            self._values.pop(name, None)
+        return self
+
+    @property
+    def area(self) -> float:
+        return self['area']
+
+    @property
+    def waste(self) -> Tuple[float, WasteResult]:
+        return self['waste']
+
+    @property
+    def material_info(self) -> MaterialResult:
+        return self['material']
+
+    @property
+    def consumables(self) -> ConsumablesResult:
+        return self['consumables']
+
+    @property
+    def cost(self) -> CostResult:
+        return self['cost']
+
+    def report_data(self) -> EstimateResult:
+        """Flat record used by ReportGenerator.generate_project_report"""
+        _, waste_details = self.waste
+        material_info = self.material_info
+        cost = self.cost
+        return EstimateResult(
+            room_name=self.room.room_name,
+            area_m2=self.area,
+            material_name=self.material.name,
+            quantity_units=material_info.quantity_units,
+            unit_measurement=material_info.unit_measurement,
+            waste_percent=waste_details.waste_percentage,
+            pattern_name=self.pattern.pattern_type.value,
+            pattern_description=self.pattern.description,
+            material_cost=cost.material_cost,
+            labor_cost=cost.labor_cost,
+            consumable_cost=cost.consumable_cost,
+            total_cost=cost.total_cost,
+            cost_per_m2=cost.cost_per_m2,
+            boxes_needed=material_info.boxes_needed,
+        )
@@ -0,0 +1,166 @@
+"""Simulate laying pieces over a room to count full and cut pieces exactly"""
+
+from src.models import FlooringMaterial, LayingPattern, PatternType, RoomSpecification
+from src.utils.geometry import rect_clip_bounds, rect_intersection_areas, rotate_points
+from .offcut_optimizer import OffcutOptimizer
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+
+# Relative tolerance for deciding that a piece is fully inside / fully outside
+AREA_TOLERANCE = 1e-9
+
+# Row offset of running bond, as a fraction of the piece pitch
+_RUNNING_BOND_OFFSET = 0.5
+
+
+class LayoutCalculator:
+    """Lays material pieces over a room outline and classifies every piece"""
+
+    GRID_PATTERNS = (PatternType.STRAIGHT, PatternType.RUNNING_BOND, PatternType.DIAGONAL)
+
+    @staticmethod
+    def get_piece_size_m(material: FlooringMaterial) -> Tuple[float, float]:
+        """Return (length_m, width_m) of one piece; length runs along the rows"""
+        if not (material.width_cm and material.length_cm):
+            raise ValueError(
+                f"Material '{material.name}' needs width_cm and length_cm for a layout simulation"
+            )
+        return material.length_cm / 100, material.width_cm / 100
+
+    @staticmethod
+    def build_piece_grid(room: RoomSpecification, material: FlooringMaterial,
+                         pattern: LayingPattern,
+                         angle_degrees: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray,
+                                                                          np.ndarray, np.ndarray]:
+        """
+        Place pieces on a grid covering the room's bounding box
+
+        The room outline is rotated into the pattern frame (45 degrees for
+        DIAGONAL unless ``angle_degrees`` says otherwise) so that pieces are
+        always axis-aligned rectangles there.
+
+        Returns:
+            Tuple of (outline_in_pattern_frame, x0, x1, y0, y1) piece bounds
+        """
+        if pattern.pattern_type not in LayoutCalculator.GRID_PATTERNS:
+            raise ValueError(f"Pattern '{pattern.pattern_type.value}' is not a grid pattern")
+        if angle_degrees is None:
+            angle_degrees = 45.0 if pattern.pattern_type == PatternType.DIAGONAL else 0.0
+
+        piece_length, piece_width = LayoutCalculator.get_piece_size_m(material)
+        joint = pattern.joints_width_mm / 1000
+        pitch_x, pitch_y = piece_length + joint, piece_width + joint
+
+        outline = np.asarray(room.get_vertices(), dtype=np.float64)
+        if angle_degrees:
+            outline = rotate_points(outline, -angle_degrees)
+        (min_x, min_y), (max_x, max_y) = outline.min(axis=0), outline.max(axis=0)
+
+        rows = int(np.ceil((max_y - min_y) / pitch_y - AREA_TOLERANCE))
+        cols = int(np.ceil((max_x - min_x) / pitch_x - AREA_TOLERANCE))
+
+        row_idx = np.arange(rows)
+        shift = np.zeros(rows)
+        if pattern.pattern_type == PatternType.RUNNING_BOND:
+            # Odd rows start half a piece early and need one extra column
+            shift[1::2] = _RUNNING_BOND_OFFSET * pitch_x
+            cols += 1
+
+        x0 = (min_x + np.arange(cols) * pitch_x)[None, :] - shift[:, None]
+        y0 = np.broadcast_to((min_y + row_idx * pitch_y)[:, None], x0.shape)
+        x0, y0 = x0.ravel(), np.ascontiguousarray(y0).ravel()
+        x1, y1 = x0 + piece_length, y0 + piece_width
+
+        inside_box = (x1 > min_x) & (x0 < max_x)
+        return outline, x0[inside_box], x1[inside_box], y0[inside_box], y1[inside_box]
+
+    @staticmethod
+    def simulate_layout(room: RoomSpecification, material: FlooringMaterial,
+                        pattern: LayingPattern,
+                        angle_degrees: Optional[float] = None,
+                        reuse_offcuts: bool = False,
+                        kerf_m: float = 0.0) -> Dict:
+        """
+        Lay pieces over the room and count full pieces, cut pieces and offcuts
+
+        HERRINGBONE and CHEVRON are delegated to MotifCalculator, and wood or
+        laminate laid in rows to PlankSequencer (which always carries offcuts).
+
+        Args:
+            reuse_offcuts: Fill edge pieces from earlier offcuts where a
+                guillotine cut allows it (see OffcutOptimizer)
+            kerf_m: Material lost per saw cut when reusing offcuts
+
+        Returns:
+            Dictionary with piece counts and areas
+        """
+        if pattern.pattern_type in (PatternType.HERRINGBONE, PatternType.CHEVRON):
+            from .motif_calculator import MotifCalculator
+            return MotifCalculator.count_pieces(room, material, pattern, angle_degrees,
+                                                reuse_offcuts=reuse_offcuts, kerf_m=kerf_m)
+
+        from .plank_sequencer import PlankSequencer
+        if (material.material_type in PlankSequencer.PLANK_MATERIAL_TYPES
+                and pattern.pattern_type in PlankSequencer.PLANK_PATTERNS and not angle_degrees):
+            return PlankSequencer.sequence_room(room, material, pattern)
+
+        outline, x0, x1, y0, y1 = LayoutCalculator.build_piece_grid(
+            room, material, pattern, angle_degrees
+        )
+        piece_length, piece_width = LayoutCalculator.get_piece_size_m(material)
+        piece_area = piece_length * piece_width
+
+        covered = rect_intersection_areas(outline, x0, x1, y0, y1)
+        full = covered >= piece_area * (1 - AREA_TOLERANCE)
+        cut = ~full & (covered > piece_area * AREA_TOLERANCE)
+
+        reused_offcuts = 0
+        if reuse_offcuts:
+            reused_offcuts = LayoutCalculator.count_reusable_cuts(
+                outline, x0[cut], x1[cut], y0[cut], y1[cut], piece_length, piece_width, kerf_m
+            )
+
+        return LayoutCalculator.summarize_layout(
+            pattern, piece_area, room.get_total_area() - room.additional_area_m2,
+            int(np.count_nonzero(full)), int(np.count_nonzero(cut)),
+            float(covered[full | cut].sum()), reused_offcuts,
+        )
+
+    @staticmethod
+    def count_reusable_cuts(outline: np.ndarray, x0: np.ndarray, x1: np.ndarray,
+                            y0: np.ndarray, y1: np.ndarray,
+                            piece_length: float, piece_width: float,
+                            kerf_m: float = 0.0) -> int:
+        """Number of cut pieces that can be taken from offcuts instead of new stock"""
+        if x0.shape[0] == 0:
+            return 0
+        bounds = rect_clip_bounds(outline, x0, x1, y0, y1)
+        plan = OffcutOptimizer.optimize(
+            bounds[:, 1] - bounds[:, 0], bounds[:, 3] - bounds[:, 2],
+            piece_length, piece_width, kerf_m=kerf_m,
+        )
+        return plan['reused_offcuts']
+
+    @staticmethod
+    def summarize_layout(pattern: LayingPattern, piece_area: float, room_area: float,
+                         full_pieces: int, cut_pieces: int, covered_area: float,
+                         reused_offcuts: int = 0) -> Dict:
+        """Build the layout result dictionary shared by all layout engines"""
+        total_pieces = full_pieces + cut_pieces
+        pieces_required = total_pieces - reused_offcuts
+        offcut_area = pieces_required * piece_area - covered_area
+
+        return {
+            'pattern': pattern.pattern_type.value,
+            'piece_area_m2': piece_area,
+            'room_area_m2': room_area,
+            'full_pieces': full_pieces,
+            'cut_pieces': cut_pieces,
+            'total_pieces': total_pieces,
+            'reused_offcuts': reused_offcuts,
+            'pieces_required': pieces_required,
+            'covered_area_m2': covered_area,
+            'offcut_area_m2': offcut_area,
+            'waste_percentage': (offcut_area / room_area * 100) if room_area > 0 else 0,
+        }
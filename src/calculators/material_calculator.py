@@ -1,48 +1,148 @@
 """Calculate material requirements and quantities"""
 
-from src.models import FlooringMaterial, LayingPattern
+from src.models import (ConsumableRates, ConsumablesResult, FlooringMaterial, LayingPattern, MaterialResult,
+                        ResultBatch)
+from src.models.price_book import DEFAULT_RATES
+from functools import lru_cache
 from typing import Dict, Optional
 import math
 
 
+# Typical consumable rates (see PriceBook for per material type and region rates)
+ADHESIVE_KG_PER_M2 = DEFAULT_RATES.adhesive_kg_per_m2
+SEALER_COVERAGE_M2_PER_LITER = DEFAULT_RATES.sealer_coverage_m2_per_liter
+
+# Entries kept by the memoized calculations (one per distinct area/material/pattern)
+CACHE_SIZE = 65536
+
+
 class MaterialCalculator:
     """Handles material quantity calculations"""
     
     @staticmethod
     def calculate_material_needed(total_area: float, material: FlooringMaterial,
-                                 pattern: LayingPattern) -> Dict:
+                                 pattern: LayingPattern,
+                                 layout: Optional[Dict] = None) -> MaterialResult:
         """
         Calculate total material needed including waste
         
+        Args:
+            total_area: Total flooring area in m2
+            material: FlooringMaterial instance
+            pattern: LayingPattern instance
+            layout: Optional result of LayoutCalculator.simulate_layout; when
+                given, the simulated piece count replaces the waste percentages
+        
         Returns:
-            Dictionary with material quantities and counts
+            MaterialResult with material quantities and counts
         """
-        # Calculate area with waste
-        total_waste_factor = pattern.get_total_waste_factor(material.waste_factor)
-        area_with_waste = total_area * (1 + total_waste_factor)
-        
-        # Calculate quantity needed
         area_per_unit = material.get_area_per_unit()
         
-        if material.unit_measurement == 'm2':
-            quantity_m2 = area_with_waste
-            quantity_units = area_with_waste / area_per_unit if area_per_unit > 0 else 0
-        else:
-            quantity_units = math.ceil(area_with_waste / area_per_unit) if area_per_unit > 0 else 0
+        if layout is not None:
+            # Piece count from the simulation already includes every cut
+            quantity_units = layout['pieces_required']
             quantity_m2 = quantity_units * area_per_unit
+            total_waste_factor = (quantity_m2 / total_area - 1) if total_area > 0 else 0
+        else:
+            # Calculate area with waste
+            total_waste_factor = pattern.get_total_waste_factor(material.waste_factor)
+            area_with_waste = total_area * (1 + total_waste_factor)
+            
+            if material.unit_measurement == 'm2':
+                quantity_m2 = area_with_waste
+                quantity_units = area_with_waste / area_per_unit if area_per_unit > 0 else 0
+            else:
+                quantity_units = math.ceil(area_with_waste / area_per_unit) if area_per_unit > 0 else 0
+                quantity_m2 = quantity_units * area_per_unit
         
         # Calculate boxes needed
         boxes_needed = 1
         if material.units_per_box and material.units_per_box > 0:
             boxes_needed = math.ceil(quantity_units / material.units_per_box)
         
-        return {
+        return MaterialResult(
+            area_needed_m2=quantity_m2,
+            quantity_units=quantity_units,
+            unit_measurement=material.unit_measurement,
+            boxes_needed=boxes_needed,
+            total_waste_factor_percent=(total_waste_factor * 100),
+        )
+    
+    @staticmethod
+    def calculate_material_needed_cached(total_area: float, material: FlooringMaterial,
+                                         pattern: LayingPattern) -> MaterialResult:
+        """
+        Memoized calculate_material_needed
+        
+        Materials and patterns are frozen (and so interned) to form the cache
+        key; rooms repeating the same area, material and pattern are computed
+        once. The immutable result record is shared between callers.
+        """
+        return _material_needed(total_area, material.freeze(), pattern.freeze())
+    
+    @staticmethod
+    def cache_info():
+        """Hit/miss statistics of calculate_material_needed_cached"""
+        return _material_needed.cache_info()
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all memoized material calculations"""
+        _material_needed.cache_clear()
+    
+    @staticmethod
+    def calculate_material_needed_batch(total_areas, waste_factors, pattern_waste_percentages,
+                                        areas_per_unit, units_per_box=None, per_m2=True) -> ResultBatch:
+        """
+        Calculate material needed for many rows at once
+        
+        Applies exactly the arithmetic of calculate_material_needed to whole
+        columns, so every element matches the scalar result.
+        
+        Args:
+            total_areas: Flooring areas in m2
+            waste_factors: Material waste factors (FlooringMaterial.waste_factor)
+            pattern_waste_percentages: LayingPattern.additional_waste_percentage
+            areas_per_unit: FlooringMaterial.get_area_per_unit() per row
+            units_per_box: Units per box, 0 where not boxed (None for none)
+            per_m2: True where the material is sold per m2 (not rounded up)
+        
+        Returns:
+            ResultBatch of MaterialResult columns (no unit_measurement column)
+        """
+        import numpy as np
+        
+        total_areas = np.asarray(total_areas, dtype=np.float64)
+        waste_factors = np.asarray(waste_factors, dtype=np.float64)
+        area_per_unit = np.asarray(areas_per_unit, dtype=np.float64)
+        
+        total_waste_factor = waste_factors + (waste_factors * np.asarray(pattern_waste_percentages) / 100)
+        area_with_waste = total_areas * (1 + total_waste_factor)
+        
+        has_unit_area = area_per_unit > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            units_exact = np.where(has_unit_area, area_with_waste / area_per_unit, 0.0)
+        units_rounded = np.ceil(units_exact)
+        
+        per_m2 = np.asarray(per_m2, dtype=bool)
+        quantity_units = np.where(per_m2, units_exact, units_rounded)
+        quantity_m2 = np.where(per_m2, area_with_waste, units_rounded * area_per_unit)
+        
+        # Calculate boxes needed
+        if units_per_box is None:
+            boxes_needed = np.ones(quantity_units.shape, dtype=np.int64)
+        else:
+            units_per_box = np.asarray(units_per_box, dtype=np.float64)
+            boxed = units_per_box > 0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                boxes_needed = np.where(boxed, np.ceil(quantity_units / units_per_box), 1).astype(np.int64)
+        
+        return ResultBatch(MaterialResult, {
             'area_needed_m2': quantity_m2,
             'quantity_units': quantity_units,
-            'unit_measurement': material.unit_measurement,
             'boxes_needed': boxes_needed,
-            'total_waste_factor_percent': (total_waste_factor * 100),
-        }
+            'total_waste_factor_percent': total_waste_factor * 100,
+        })
     
     @staticmethod
     def calculate_grout_needed(total_area: float, pattern: LayingPattern) -> Optional[float]:
@@ -52,12 +152,47 @@ class MaterialCalculator:
         return None
     
     @staticmethod
-    def calculate_consumables(total_area: float, pattern: LayingPattern) -> Dict:
-        """Calculate consumables like grout, sealant, adhesive, etc."""
-        consumables = {
-            'grout_kg': MaterialCalculator.calculate_grout_needed(total_area, pattern),
-            'adhesive_kg': total_area * 1.5,  # Typical 1.5 kg per m2 for thin-set
-            'sealer_liters': total_area / 10,  # Typical coverage 10 m2 per liter
-        }
+    def calculate_consumables(total_area: float, pattern: LayingPattern,
+                              rates: Optional[ConsumableRates] = None) -> ConsumablesResult:
+        """
+        Calculate consumables like grout, sealant, adhesive, etc.
+        
+        Args:
+            rates: Usage rates (default: DEFAULT_RATES)
+        """
+        rates = rates or DEFAULT_RATES
+        return ConsumablesResult(
+            grout_kg=MaterialCalculator.calculate_grout_needed(total_area, pattern),
+            adhesive_kg=total_area * rates.adhesive_kg_per_m2,
+            sealer_liters=total_area / rates.sealer_coverage_m2_per_liter,
+        )
+    
+    @staticmethod
+    def calculate_consumables_batch(total_areas, grout_kg_per_m2,
+                                    rates: Optional[ConsumableRates] = None) -> ResultBatch:
+        """
+        Calculate consumables for many rows at once
+        
+        Args:
+            total_areas: Flooring areas in m2
+            grout_kg_per_m2: Pattern grout consumption, 0 where no grout is used
+            rates: Usage rates, scalar or per row (default: DEFAULT_RATES)
         
-        return {k: v for k, v in consumables.items() if v is not None}
+        Returns:
+            ResultBatch of ConsumablesResult columns (grout_kg is 0 where the
+            scalar result has none)
+        """
+        import numpy as np
+        
+        rates = rates or DEFAULT_RATES
+        total_areas = np.asarray(total_areas, dtype=np.float64)
+        return ResultBatch(ConsumablesResult, {
+            'grout_kg': total_areas * np.asarray(grout_kg_per_m2, dtype=np.float64),
+            'adhesive_kg': total_areas * rates.adhesive_kg_per_m2,
+            'sealer_liters': total_areas / rates.sealer_coverage_m2_per_liter,
+        })
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _material_needed(total_area: float, material, pattern) -> MaterialResult:
+    return MaterialCalculator.calculate_material_needed(total_area, material, pattern)
@@ -0,0 +1,215 @@
+"""Count pieces for herringbone and chevron motifs with a memoized motif cache"""
+
+from src.models import FlooringMaterial, LayingPattern, PatternType, RoomSpecification
+from src.utils.geometry import rect_clip_bounds, rect_intersection_areas, rotate_points
+from .layout_calculator import AREA_TOLERANCE, LayoutCalculator
+from .offcut_optimizer import OffcutOptimizer
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import math
+import numpy as np
+
+
+# Inputs are quantized to whole millimetres before they reach the cache
+_QUANTUM_M = 0.001
+
+# Angle at which chevron board ends are cut, in degrees
+_CHEVRON_CUT_ANGLE = 45.0
+
+# Default rotation of each motif relative to the room walls, in degrees
+_DEFAULT_ANGLES = {
+    PatternType.HERRINGBONE: 45.0,  # zigzag runs parallel to the walls
+    PatternType.CHEVRON: 0.0,
+}
+
+_CACHE_SIZE = 4096
+
+
+def _quantize(value_m: float) -> int:
+    return int(round(value_m / _QUANTUM_M))
+
+
+class _MotifFamily:
+    """
+    One family of motif pieces that are axis-aligned rectangles after a shear
+
+    A family maps the room outline through ``(x, y) -> (x, y + shear * x)``
+    and then repeats ``rects`` (x0, x1, y0, y1 in the sheared frame) over the
+    lattice spanned by ``v1`` and ``v2``. Shears preserve area, so clipped
+    areas in the sheared frame are true areas.
+    """
+
+    __slots__ = ('shear', 'rects', 'v1', 'v2')
+
+    def __init__(self, shear: float, rects: np.ndarray, v1: np.ndarray, v2: np.ndarray):
+        self.shear = shear
+        self.rects = rects
+        self.v1 = v1
+        self.v2 = v2
+
+    def place(self, outline: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return (sheared_outline, x0, x1, y0, y1) for every piece near the outline"""
+        sheared = outline.copy()
+        sheared[:, 1] += self.shear * sheared[:, 0]
+        lo, hi = sheared.min(axis=0), sheared.max(axis=0)
+
+        # Lattice coordinates of the bounding box corners bound the translations
+        basis = np.column_stack([self.v1, self.v2])
+        corners = np.array([[lo[0], lo[1]], [lo[0], hi[1]], [hi[0], lo[1]], [hi[0], hi[1]]])
+        lattice = np.linalg.solve(basis, corners.T)
+        rect_corners = np.concatenate([self.rects[:, [0, 2]], self.rects[:, [1, 3]]])
+        extent = np.abs(np.linalg.solve(basis, rect_corners.T)).max() + 1
+        i_range = np.arange(math.floor(lattice[0].min() - extent), math.ceil(lattice[0].max() + extent) + 1)
+        k_range = np.arange(math.floor(lattice[1].min() - extent), math.ceil(lattice[1].max() + extent) + 1)
+
+        ii, kk = np.meshgrid(i_range, k_range, indexing='ij')
+        offsets = ii.reshape(-1, 1) * self.v1 + kk.reshape(-1, 1) * self.v2
+
+        x0 = (offsets[:, 0:1] + self.rects[:, 0]).ravel()
+        x1 = (offsets[:, 0:1] + self.rects[:, 1]).ravel()
+        y0 = (offsets[:, 1:2] + self.rects[:, 2]).ravel()
+        y1 = (offsets[:, 1:2] + self.rects[:, 3]).ravel()
+
+        near = (x1 > lo[0]) & (x0 < hi[0]) & (y1 > lo[1]) & (y0 < hi[1])
+        return sheared, x0[near], x1[near], y0[near], y1[near]
+
+
+@lru_cache(maxsize=256)
+def _build_motif(pattern_value: str, length_mm: int, width_mm: int, joint_mm: int) -> Tuple[_MotifFamily, ...]:
+    """Build the repeating motif for a board size; shared by every room that uses it"""
+    a, b, j = length_mm * _QUANTUM_M, width_mm * _QUANTUM_M, joint_mm * _QUANTUM_M
+
+    if pattern_value == PatternType.HERRINGBONE.value:
+        # A vertical and a horizontal board form an L; L's stack along (B, B)
+        pitch_a, pitch_b = a + j, b + j
+        rects = np.array([
+            [0.0, b, 0.0, a],
+            [pitch_b, pitch_b + a, 0.0, b],
+        ])
+        return (_MotifFamily(0.0, rects, np.array([pitch_b, pitch_b]), np.array([pitch_a, -pitch_a])),)
+
+    # Chevron: columns of parallelograms whose slope alternates, forming a V
+    theta = math.radians(_CHEVRON_CUT_ANGLE)
+    slope = math.tan(theta)
+    column = a * math.cos(theta)
+    height = b / math.cos(theta)
+    pitch_x = column + j
+    pitch_y = height + j / math.cos(theta)
+
+    rising = np.array([[0.0, column, 0.0, height]])
+    apex = 2 * slope * pitch_x
+    falling = np.array([[pitch_x, pitch_x + column, apex, apex + height]])
+    return (
+        # (x, y - s*x) straightens the rising column; it repeats every 2 columns
+        _MotifFamily(-slope, rising, np.array([2 * pitch_x, -2 * slope * pitch_x]), np.array([0.0, pitch_y])),
+        # (x, y + s*x) straightens the falling column
+        _MotifFamily(slope, falling, np.array([2 * pitch_x, 2 * slope * pitch_x]), np.array([0.0, pitch_y])),
+    )
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _count_motif(pattern_value: str, length_mm: int, width_mm: int, joint_mm: int,
+                 angle_millideg: int, outline_mm: Tuple[Tuple[int, int], ...],
+                 kerf_mm: Optional[int] = None) -> Tuple[int, int, float, int]:
+    """Count (full, cut, covered_area, reused_offcuts) for one quantized room and motif"""
+    outline = np.array(outline_mm, dtype=np.float64) * _QUANTUM_M
+    if angle_millideg:
+        outline = rotate_points(outline, -angle_millideg / 1000)
+
+    piece_area = (length_mm * _QUANTUM_M) * (width_mm * _QUANTUM_M)
+    full_pieces = cut_pieces = 0
+    covered_area = 0.0
+    cut_bounds = []
+
+    for family in _build_motif(pattern_value, length_mm, width_mm, joint_mm):
+        sheared, x0, x1, y0, y1 = family.place(outline)
+        covered = rect_intersection_areas(sheared, x0, x1, y0, y1)
+        full = covered >= piece_area * (1 - AREA_TOLERANCE)
+        cut = ~full & (covered > piece_area * AREA_TOLERANCE)
+        full_pieces += int(np.count_nonzero(full))
+        cut_pieces += int(np.count_nonzero(cut))
+        covered_area += float(covered[full | cut].sum())
+        if kerf_mm is not None and cut.any():
+            bounds = rect_clip_bounds(sheared, x0[cut], x1[cut], y0[cut], y1[cut])
+            # Back to board coordinates: a sheared column is a*cos wide and b/cos high
+            cos = 1 / math.hypot(1.0, family.shear)
+            cut_bounds.append(np.column_stack([(bounds[:, 1] - bounds[:, 0]) / cos,
+                                               (bounds[:, 3] - bounds[:, 2]) * cos]))
+
+    reused_offcuts = 0
+    if cut_bounds:
+        # Both families are cut from the same boards, so they share one offcut pool
+        sizes = np.concatenate(cut_bounds)
+        plan = OffcutOptimizer.optimize(
+            sizes[:, 1], sizes[:, 0],
+            width_mm * _QUANTUM_M, length_mm * _QUANTUM_M, kerf_m=kerf_mm * _QUANTUM_M,
+        )
+        reused_offcuts = plan['reused_offcuts']
+
+    return full_pieces, cut_pieces, covered_area, reused_offcuts
+
+
+class MotifCalculator:
+    """Counts pieces for repeating herringbone and chevron motifs"""
+
+    MOTIF_PATTERNS = (PatternType.HERRINGBONE, PatternType.CHEVRON)
+
+    @staticmethod
+    def count_pieces(room: RoomSpecification, material: FlooringMaterial,
+                     pattern: LayingPattern,
+                     angle_degrees: Optional[float] = None,
+                     reuse_offcuts: bool = False,
+                     kerf_m: float = 0.0) -> Dict:
+        """
+        Tile the motif over the room and count full pieces, edge cuts and waste
+
+        Piece size, joint width and the room outline are quantized to 1 mm and
+        used as the cache key, so rooms of the same shape and board size are
+        only tiled once. Rooms are keyed relative to their own corner, so the
+        same room at a different position in the plan also hits the cache.
+
+        Returns:
+            Dictionary with piece counts and areas (see LayoutCalculator)
+        """
+        if pattern.pattern_type not in MotifCalculator.MOTIF_PATTERNS:
+            raise ValueError(f"Pattern '{pattern.pattern_type.value}' is not a motif pattern")
+        if angle_degrees is None:
+            angle_degrees = _DEFAULT_ANGLES[pattern.pattern_type]
+
+        piece_length, piece_width = LayoutCalculator.get_piece_size_m(material)
+        piece_length, piece_width = max(piece_length, piece_width), min(piece_length, piece_width)
+        key = (
+            pattern.pattern_type.value,
+            _quantize(piece_length),
+            _quantize(piece_width),
+            _quantize(pattern.joints_width_mm / 1000),
+            int(round(angle_degrees * 1000)),
+            MotifCalculator.outline_key(room),
+            _quantize(kerf_m) if reuse_offcuts else None,
+        )
+        full_pieces, cut_pieces, covered_area, reused_offcuts = _count_motif(*key)
+
+        piece_area = (key[1] * _QUANTUM_M) * (key[2] * _QUANTUM_M)
+        return LayoutCalculator.summarize_layout(
+            pattern, piece_area, room.get_total_area() - room.additional_area_m2,
+            full_pieces, cut_pieces, covered_area, reused_offcuts,
+        )
+
+    @staticmethod
+    def outline_key(room: RoomSpecification) -> Tuple[Tuple[int, int], ...]:
+        """Quantized room outline, translated so its bounding box starts at the origin"""
+        vertices: List[Tuple[float, float]] = room.get_vertices()
+        min_x = min(x for x, _ in vertices)
+        min_y = min(y for _, y in vertices)
+        return tuple((_quantize(x - min_x), _quantize(y - min_y)) for x, y in vertices)
+
+    @staticmethod
+    def cache_info():
+        """Hit/miss statistics of the room-level motif cache"""
+        return _count_motif.cache_info()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached motifs and room counts"""
+        _count_motif.cache_clear()
+        _build_motif.cache_clear()
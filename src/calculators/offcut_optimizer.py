@@ -0,0 +1,165 @@
+"""Reuse offcuts for edge pieces with guillotine cuts (2D cutting stock)"""
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+
+# Dimensions are handled in whole millimetres so offcut sizes hash exactly
+_MM_PER_M = 1000
+
+# Offcuts with a side shorter than this are treated as unusable slivers
+DEFAULT_MIN_OFFCUT_M = 0.02
+
+
+class _OffcutPool:
+    """
+    Multiset of offcut rectangles indexed by normalized (short, long) size
+
+    Sizes are kept in a sorted list next to a count per size, so the best
+    fitting offcut is found by bisecting to the first short side that fits
+    instead of scanning every offcut ever produced.
+    """
+
+    __slots__ = ('counts', 'sizes')
+
+    def __init__(self):
+        self.counts: Dict[Tuple[int, int], int] = {}
+        self.sizes: List[Tuple[int, int]] = []
+
+    def add(self, short: int, long: int) -> None:
+        key = (short, long)
+        count = self.counts.get(key)
+        if count:
+            self.counts[key] = count + 1
+        else:
+            self.counts[key] = 1
+            insort(self.sizes, key)
+
+    def take_best_fit(self, short: int, long: int) -> Optional[Tuple[int, int]]:
+        """Remove and return the smallest-area offcut that holds short x long"""
+        sizes = self.sizes
+        best = None
+        best_area = None
+        for idx in range(bisect_left(sizes, (short, -1)), len(sizes)):
+            size_short, size_long = sizes[idx]
+            # Later sizes have a short side at least this large, so none can beat best
+            if best_area is not None and size_short * long >= best_area:
+                break
+            if size_long >= long:
+                area = size_short * size_long
+                if best_area is None or area < best_area:
+                    best, best_area = idx, area
+        if best is None:
+            return None
+
+        key = sizes[best]
+        remaining = self.counts[key] - 1
+        if remaining:
+            self.counts[key] = remaining
+        else:
+            del self.counts[key]
+            del sizes[best]
+        return key
+
+    def __len__(self) -> int:
+        return sum(self.counts.values())
+
+    def total_area(self) -> int:
+        return sum(s * l * n for (s, l), n in self.counts.items())
+
+
+def _normalized(a: int, b: int) -> Tuple[int, int]:
+    return (a, b) if a <= b else (b, a)
+
+
+def _guillotine_leftovers(stock_w: int, stock_l: int, need_w: int, need_l: int,
+                          kerf: int) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    Cut need_w x need_l from a corner of the stock with two guillotine cuts
+
+    Of the two possible cut orders, keep the one whose larger leftover is
+    biggest, since large offcuts are the ones that fill later edge pieces.
+    """
+    rest_w = stock_w - need_w - kerf
+    rest_l = stock_l - need_l - kerf
+    # Cut across the width first: strip rest_w x stock_l, then need_w x rest_l
+    first = ((rest_w, stock_l), (need_w, rest_l))
+    # Cut across the length first: strip stock_w x rest_l, then rest_w x need_l
+    second = ((stock_w, rest_l), (rest_w, need_l))
+    largest_first = max(max(w, 0) * max(l, 0) for w, l in first)
+    largest_second = max(max(w, 0) * max(l, 0) for w, l in second)
+    return first if largest_first >= largest_second else second
+
+
+class OffcutOptimizer:
+    """Matches required edge pieces to offcuts left over from earlier cuts"""
+
+    @staticmethod
+    def optimize(required_w_m: np.ndarray, required_l_m: np.ndarray,
+                 piece_w_m: float, piece_l_m: float,
+                 kerf_m: float = 0.0,
+                 min_offcut_m: float = DEFAULT_MIN_OFFCUT_M) -> Dict:
+        """
+        Plan which cut pieces come from new stock and which from offcuts
+
+        Required pieces are processed largest first. Each is taken from the
+        best-fitting offcut in the pool (pieces may be rotated); otherwise a
+        new piece is cut and both guillotine leftovers go back into the pool.
+        Every piece fits the stock, so leftovers always lie within the piece
+        they were cut from.
+
+        Args:
+            required_w_m, required_l_m: Bounding size of each cut piece needed
+            piece_w_m, piece_l_m: Size of one purchased piece
+            kerf_m: Material lost per saw cut
+            min_offcut_m: Offcuts with a shorter side are discarded
+
+        Returns:
+            Dictionary with new pieces, reused offcuts and leftover stock
+
+        Raises:
+            ValueError: If a required piece is larger than the stock
+        """
+        w = np.ceil(np.asarray(required_w_m, dtype=np.float64) * _MM_PER_M - 1e-6).astype(np.int64)
+        l = np.ceil(np.asarray(required_l_m, dtype=np.float64) * _MM_PER_M - 1e-6).astype(np.int64)
+        short, long = np.minimum(w, l), np.maximum(w, l)
+        order = np.lexsort((short, short * long))[::-1]
+
+        stock_w = int(round(piece_w_m * _MM_PER_M))
+        stock_l = int(round(piece_l_m * _MM_PER_M))
+        stock_short, stock_long = _normalized(stock_w, stock_l)
+        kerf = int(round(kerf_m * _MM_PER_M))
+        min_side = int(round(min_offcut_m * _MM_PER_M))
+        oversized = (short > stock_short) | (long > stock_long)
+        if oversized.any():
+            first = int(np.flatnonzero(oversized)[0])
+            raise ValueError(
+                f"Cut piece of {int(short[first])} x {int(long[first])} mm does not fit "
+                f"the {stock_short} x {stock_long} mm stock"
+            )
+
+        pool = _OffcutPool()
+        new_pieces = 0
+        reused = 0
+
+        for need_short, need_long in zip(short[order].tolist(), long[order].tolist()):
+            source = pool.take_best_fit(need_short, need_long)
+            if source is None:
+                source = (stock_short, stock_long)
+                new_pieces += 1
+            else:
+                reused += 1
+
+            for rest in _guillotine_leftovers(source[0], source[1], need_short, need_long, kerf):
+                rest_short, rest_long = _normalized(*rest)
+                if rest_short >= min_side:
+                    pool.add(rest_short, rest_long)
+
+        return {
+            'cut_pieces': int(short.shape[0]),
+            'new_pieces': new_pieces,
+            'reused_offcuts': reused,
+            'leftover_offcuts': len(pool),
+            'leftover_offcut_area_m2': pool.total_area() / (_MM_PER_M * _MM_PER_M),
+        }
@@ -0,0 +1,220 @@
+"""Shard large building estimates across worker processes"""
+
+from src.models import (ConsumableRates, CostResult, EstimateResult, FlooringMaterial, LayingPattern,
+                        MaterialTable, PatternTable, PriceBook, ResultBatch, RoomSpecification, RoomTable)
+from .area_calculator import AreaCalculator
+from .cost_calculator import CostCalculator
+from .estimate_pipeline import EstimatePipeline
+from .waste_calculator import WasteCalculator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import itertools
+import math
+import os
+import numpy as np
+
+
+# Below this many rooms per worker the pool costs more than it saves
+MIN_ROOMS_PER_CHUNK = 2000
+
+# Rows held in memory at a time by estimate_stream
+STREAM_CHUNK_SIZE = 10000
+
+# Lookup tables (and consumable rates) installed once per worker process by the pool initializer
+_worker_tables: Optional[Tuple[MaterialTable, PatternTable, Optional[ConsumableRates]]] = None
+
+
+def _init_worker(materials: MaterialTable, patterns: PatternTable,
+                 rates: Optional[ConsumableRates] = None) -> None:
+    global _worker_tables
+    _worker_tables = (materials, patterns, rates)
+
+
+def _estimate_chunk(payload: Tuple[Any, ...]) -> ResultBatch:
+    """Run area -> waste -> material -> cost for one chunk of rooms"""
+    rooms, material_idx, pattern_idx, labor, additional_costs = payload
+    materials, patterns, rates = _worker_tables
+
+    areas = AreaCalculator.calculate_room_area_batch(rooms)
+    waste = WasteCalculator.calculate_waste_quantity_batch(
+        areas, materials.waste_factor[material_idx], patterns.additional_waste_percentage[pattern_idx]
+    )
+    costs = CostCalculator.calculate_portfolio_cost(
+        areas, material_idx, pattern_idx, materials, patterns,
+        labor_cost_per_m2=labor, additional_costs=additional_costs, rates=rates,
+    )
+    costs['total_waste_m2'] = waste['total_waste_m2']
+    costs['waste_percentage'] = waste['waste_percentage']
+    return costs
+
+
+class ParallelEstimator:
+    """Runs per-room estimates for a whole building on a process pool"""
+
+    @staticmethod
+    def pack_chunks(rooms: Union[Sequence[RoomSpecification], RoomTable], material_indices, pattern_indices,
+                    labor_cost_per_m2, additional_costs,
+                    chunk_size: int) -> List[Tuple[Any, ...]]:
+        """
+        Split rooms into compact array payloads, one per chunk
+
+        Each payload is a RoomTable slice (sides, plus vertices for outline
+        rooms only) and per-room columns, which pickle as flat buffers
+        instead of one object graph per room. Areas are computed from them
+        by the worker.
+        """
+        table = rooms if isinstance(rooms, RoomTable) else RoomTable.from_rooms(rooms)
+        n = len(table)
+        material_idx = np.broadcast_to(np.asarray(material_indices, dtype=np.intp), (n,))
+        pattern_idx = np.broadcast_to(np.asarray(pattern_indices, dtype=np.intp), (n,))
+        labor = np.broadcast_to(np.asarray(labor_cost_per_m2, dtype=np.float64), (n,))
+        additional = np.broadcast_to(np.asarray(additional_costs, dtype=np.float64), (n,))
+
+        chunks = []
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            chunks.append((
+                table.slice(start, stop),
+                np.ascontiguousarray(material_idx[start:stop]),
+                np.ascontiguousarray(pattern_idx[start:stop]),
+                np.ascontiguousarray(labor[start:stop]),
+                np.ascontiguousarray(additional[start:stop]),
+            ))
+        return chunks
+
+    @staticmethod
+    def estimate_rooms(rooms: Union[Sequence[RoomSpecification], RoomTable],
+                       materials: Union[Sequence[FlooringMaterial], MaterialTable],
+                       patterns: Union[Sequence[LayingPattern], PatternTable],
+                       material_indices=0, pattern_indices=0,
+                       labor_cost_per_m2=0, additional_costs=0,
+                       workers: Optional[int] = None,
+                       chunk_size: Optional[int] = None,
+                       rates: Optional[ConsumableRates] = None) -> Dict:
+        """
+        Estimate every room of a building across a ProcessPoolExecutor
+
+        Material and pattern tables are shipped once per worker through the
+        pool initializer; rooms travel as RoomTable slices. Results are
+        merged in room order and totals are summed with math.fsum, so the
+        output does not depend on the number of workers or chunking.
+
+        Args:
+            rooms: Rooms to estimate, or their RoomTable (e.g. from_rectangles
+                over schedule columns, which skips reading room objects)
+            materials, patterns: Candidates, or prebuilt tables
+            material_indices, pattern_indices: Per-room (or single) table index
+            labor_cost_per_m2, additional_costs: Scalar or per room
+            workers: Worker processes (default: CPU count); 1 runs in-process
+            chunk_size: Rooms per payload (default: a few chunks per worker)
+            rates: Consumable rates, scalar or per material (PriceBook.rate_table)
+
+        Returns:
+            Dictionary with a per-room ResultBatch under 'rooms' and sums under 'totals'
+        """
+        if not isinstance(materials, MaterialTable):
+            materials = MaterialTable.from_materials(materials)
+        if not isinstance(patterns, PatternTable):
+            patterns = PatternTable.from_patterns(patterns)
+
+        n = len(rooms)
+        workers = workers or os.cpu_count() or 1
+        if chunk_size is None:
+            chunk_size = max(MIN_ROOMS_PER_CHUNK, math.ceil(n / (workers * 4)))
+        chunks = ParallelEstimator.pack_chunks(
+            rooms, material_indices, pattern_indices, labor_cost_per_m2, additional_costs, chunk_size
+        )
+
+        if workers == 1 or len(chunks) <= 1:
+            _init_worker(materials, patterns, rates)
+            results = [_estimate_chunk(chunk) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=_init_worker,
+                                     initargs=(materials, patterns, rates)) as pool:
+                results = list(pool.map(_estimate_chunk, chunks))
+
+        if results:
+            columns = ResultBatch(CostResult, {key: np.concatenate([r[key] for r in results])
+                                               for key in results[0].keys()})
+        else:
+            columns = _estimate_chunk_empty(materials, patterns, rates)
+        return {'rooms': columns, 'totals': ResultBatch.summarize(columns, n)}
+
+    @staticmethod
+    def estimate_stream(rows: Iterable, chunk_size: int = STREAM_CHUNK_SIZE,
+                        price_book: Optional[PriceBook] = None,
+                        region: Optional[str] = None) -> Iterator[EstimateResult]:
+        """
+        Estimate an unbounded stream of rooms with bounded memory
+
+        Rows are consumed ``chunk_size`` at a time and priced with the
+        vectorized chunk estimate, so memory depends on the chunk size and
+        not on the length of the stream. Materials and patterns are frozen
+        (interned) models; each distinct one becomes one table row per chunk.
+        Rooms whose pieces are laid out (EstimatePipeline.simulates) are
+        priced by EstimatePipeline, as single estimates are.
+
+        Args:
+            rows: Iterable of objects with room, material, pattern,
+                labor_cost_per_m2 and additional_costs (see RoomSchedule)
+            chunk_size: Rows estimated per vectorized pass
+            price_book, region: Consumable rates per material type (default: DEFAULT_RATES)
+
+        Yields:
+            EstimateResult per row, in input order
+        """
+        iterator = iter(rows)
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if not chunk:
+                return
+
+            materials: Dict = {}
+            patterns: Dict = {}
+            material_idx = [materials.setdefault(row.material, len(materials)) for row in chunk]
+            pattern_idx = [patterns.setdefault(row.pattern, len(patterns)) for row in chunk]
+            result = ParallelEstimator.estimate_rooms(
+                [row.room for row in chunk], list(materials), list(patterns),
+                material_idx, pattern_idx,
+                [row.labor_cost_per_m2 for row in chunk],
+                [row.additional_costs for row in chunk],
+                workers=1, chunk_size=len(chunk),
+                rates=price_book.rate_table([m.material_type for m in materials], region) if price_book else None,
+            )['rooms']
+
+            columns = zip(*(result[key].tolist() for key in (
+                'area_m2', 'quantity_units', 'waste_percentage', 'material_cost',
+                'labor_cost', 'consumable_cost', 'total_cost', 'cost_per_m2', 'boxes_needed')))
+            for row, (area, quantity, waste, material_cost, labor, consumable, total, per_m2,
+                      boxes) in zip(chunk, columns):
+                if EstimatePipeline.simulates(row.room, row.material):
+                    rates = price_book.rates(row.material.material_type, region) if price_book else None
+                    yield EstimatePipeline.run(row.room, row.material, row.pattern, row.labor_cost_per_m2,
+                                               row.additional_costs, rates=rates).report_data()
+                    continue
+                yield EstimateResult(
+                    room_name=row.room.room_name,
+                    area_m2=area,
+                    material_name=row.material.name,
+                    quantity_units=quantity,
+                    unit_measurement=row.material.unit_measurement,
+                    waste_percent=waste,
+                    pattern_name=row.pattern.pattern_type.value,
+                    pattern_description=row.pattern.description,
+                    material_cost=material_cost,
+                    labor_cost=labor,
+                    consumable_cost=consumable,
+                    total_cost=total,
+                    cost_per_m2=per_m2,
+                    boxes_needed=boxes,
+                )
+
+
+
+def _estimate_chunk_empty(materials: MaterialTable, patterns: PatternTable,
+                          rates: Optional[ConsumableRates] = None) -> ResultBatch:
+    """Result columns for a building with no rooms"""
+    _init_worker(materials, patterns, rates)
+    empty = np.zeros(0)
+    idx = np.zeros(0, dtype=np.intp)
+    return _estimate_chunk((RoomTable.from_rectangles(empty, empty), idx, idx, empty, empty))
@@ -0,0 +1,244 @@
+"""Sequence planks row by row, carrying offcuts over to start later rows"""
+
+from src.models import FlooringMaterial, LayingPattern, PatternType, RoomSpecification
+from src.utils.geometry import rect_intersection_areas
+from .layout_calculator import LayoutCalculator
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+
+# Lengths are sequenced in whole millimetres so carried offcuts compare exactly
+_MM_PER_M = 1000
+
+# Installer rules: joints in neighbouring rows at least this far apart, and no
+# piece shorter than the minimum length
+DEFAULT_MIN_STAGGER_M = 0.20
+DEFAULT_MIN_PIECE_M = 0.20
+
+# How many of the longest offcuts are tried as a row start before opening a plank
+_START_CANDIDATES = 8
+
+
+class _RowState:
+    """Mutable counters and offcut pool threaded through every row"""
+
+    __slots__ = ('pool', 'full', 'cut', 'from_pool', 'prev_start')
+
+    def __init__(self, pool: Optional[List[int]] = None):
+        self.pool: List[int] = pool if pool is not None else []
+        self.full = 0
+        self.cut = 0
+        self.from_pool = 0
+        self.prev_start: Optional[int] = None
+
+
+class PlankSequencer:
+    """Simulates plank-by-plank installation of wood and laminate floors"""
+
+    PLANK_MATERIAL_TYPES = ('wood', 'laminate')
+    PLANK_PATTERNS = (PatternType.STRAIGHT, PatternType.RUNNING_BOND)
+
+    @staticmethod
+    def row_segments(room: RoomSpecification, row_pitch_m: float,
+                     row_width_m: float) -> Tuple[List[List[float]], np.ndarray]:
+        """
+        Split the room into plank rows and find the runs each row has to cover
+
+        Runs are where a line along the row crosses the outline, so L-shaped
+        and irregular rooms yield one or more runs per row. The row's bottom,
+        centre and top lines are tried and the longest is kept, so a row that
+        straddles a step in the wall is planked to its wider side.
+
+        Returns:
+            Tuple of (run lengths per row in m, exact floor area per row in m2)
+        """
+        outline = np.asarray(room.get_vertices(), dtype=np.float64)
+        (min_x, min_y), (max_x, max_y) = outline.min(axis=0), outline.max(axis=0)
+        rows = int(np.ceil((max_y - min_y) / row_pitch_m - 1e-9))
+
+        y0 = min_y + np.arange(rows) * row_pitch_m
+        y1 = np.minimum(y0 + row_width_m, max_y)
+        inset = np.minimum(1e-6, (y1 - y0) / 4)
+
+        xa, ya = outline[:, 0], outline[:, 1]
+        xb, yb = np.roll(xa, -1), np.roll(ya, -1)
+        best_total = np.full(rows, -1.0)
+        best_crossings = np.empty((rows, xa.shape[0]))
+        for line in (y0 + inset, (y0 + y1) / 2, y1 - inset):
+            line = line[:, None]
+            straddles = (ya > line) != (yb > line)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                crossings = np.where(straddles, xa + (line - ya) * (xb - xa) / (yb - ya), np.nan)
+            crossings.sort(axis=1)
+            total = np.nansum(crossings[:, 1::2], axis=1) - np.nansum(crossings[:, 0::2], axis=1)
+            longer = total > best_total
+            best_total[longer] = total[longer]
+            best_crossings[longer] = crossings[longer]
+
+        segments = []
+        for row in best_crossings:
+            xs = row[~np.isnan(row)]
+            segments.append((xs[1::2] - xs[0::2]).tolist())
+
+        strip_areas = rect_intersection_areas(
+            outline, np.full(rows, min_x), np.full(rows, max_x), y0, y1
+        )
+        return segments, strip_areas
+
+    @staticmethod
+    def sequence_room(room: RoomSpecification, material: FlooringMaterial,
+                      pattern: LayingPattern,
+                      min_stagger_m: float = DEFAULT_MIN_STAGGER_M,
+                      min_piece_m: float = DEFAULT_MIN_PIECE_M,
+                      pool: Optional[List[int]] = None) -> Dict:
+        """
+        Lay planks across every row, carrying row-end offcuts to later rows
+
+        Each row starts with the longest carried offcut that keeps its joints
+        at least ``min_stagger_m`` from the previous row's; otherwise a new
+        plank is opened (cut to length when a full plank would line up).
+        The row ends with the smallest offcut that still fits, or a new plank
+        whose remainder is carried on.
+
+        Args:
+            pool: Offcut lengths in mm shared between calls; pass the same
+                list for several rooms laid with the same material
+
+        Returns:
+            Dictionary with plank counts and waste (see LayoutCalculator)
+        """
+        plank_length, plank_width = LayoutCalculator.get_piece_size_m(material)
+        joint = pattern.joints_width_mm / 1000
+        segments, strip_areas = PlankSequencer.row_segments(room, plank_width + joint, plank_width)
+
+        state = _RowState(pool)
+        length_mm = int(round(plank_length * _MM_PER_M))
+        joint_mm = int(round(joint * _MM_PER_M))
+        stagger_mm = int(round(min_stagger_m * _MM_PER_M))
+        min_piece_mm = int(round(min_piece_m * _MM_PER_M))
+
+        covered_area = 0.0
+        for runs, strip_area in zip(segments, strip_areas.tolist()):
+            row_start = None
+            run_total = joint_total = 0
+            for run in runs:
+                run_mm = int(round(run * _MM_PER_M))
+                if run_mm <= 0:
+                    continue
+                start, joints = PlankSequencer._lay_run(
+                    run_mm, length_mm, joint_mm, stagger_mm, min_piece_mm, state
+                )
+                if row_start is None:
+                    row_start = start
+                run_total += run_mm
+                joint_total += joints * joint_mm
+            if row_start is not None:
+                state.prev_start = row_start
+                # Joints take their share of the row's floor area
+                covered_area += strip_area * (run_total - joint_total) / run_total
+
+        return LayoutCalculator.summarize_layout(
+            pattern, plank_length * plank_width, room.get_total_area() - room.additional_area_m2,
+            state.full, state.cut, covered_area, state.from_pool,
+        )
+
+    @staticmethod
+    def sequence_rooms(rooms: Sequence[RoomSpecification], material: FlooringMaterial,
+                       pattern: LayingPattern,
+                       min_stagger_m: float = DEFAULT_MIN_STAGGER_M,
+                       min_piece_m: float = DEFAULT_MIN_PIECE_M) -> Dict:
+        """
+        Sequence several rooms laid with the same material, sharing offcuts
+
+        Returns:
+            Totals dictionary (see LayoutCalculator) with per-room results under 'rooms'
+        """
+        pool: List[int] = []
+        results = [
+            PlankSequencer.sequence_room(room, material, pattern, min_stagger_m, min_piece_m, pool)
+            for room in rooms
+        ]
+        plank_length, plank_width = LayoutCalculator.get_piece_size_m(material)
+
+        totals = LayoutCalculator.summarize_layout(
+            pattern, plank_length * plank_width,
+            sum(r['room_area_m2'] for r in results),
+            sum(r['full_pieces'] for r in results),
+            sum(r['cut_pieces'] for r in results),
+            sum(r['covered_area_m2'] for r in results),
+            sum(r['reused_offcuts'] for r in results),
+        )
+        totals['rooms'] = results
+        return totals
+
+    @staticmethod
+    def _stagger_ok(start: int, prev_start: Optional[int], pitch: int, stagger: int) -> bool:
+        """Whether joints at start + k*pitch stay clear of the previous row's"""
+        if prev_start is None:
+            return True
+        offset = (start - prev_start) % pitch
+        return min(offset, pitch - offset) >= stagger
+
+    @staticmethod
+    def _lay_run(run: int, length: int, joint: int, stagger: int, min_piece: int,
+                 state: _RowState) -> Tuple[int, int]:
+        """Lay one continuous run of a row; returns (start piece length, joints)"""
+        pool = state.pool
+        pitch = length + joint
+
+        # Start piece: longest carried offcut that keeps the stagger
+        start = None
+        for idx in range(len(pool) - 1, max(-1, len(pool) - 1 - _START_CANDIDATES), -1):
+            candidate = pool[idx]
+            if candidate < min_piece:
+                break
+            if PlankSequencer._stagger_ok(candidate, state.prev_start, pitch, stagger):
+                start = candidate
+                del pool[idx]
+                state.from_pool += 1
+                state.cut += 1
+                break
+
+        if start is None:
+            if PlankSequencer._stagger_ok(length, state.prev_start, pitch, stagger):
+                start = length
+            else:
+                # Cut a new plank so this row's joints clear the previous row's
+                start = state.prev_start - stagger
+                if start < min_piece:
+                    start = state.prev_start + stagger
+                start = min(start, length)
+                PlankSequencer._keep_offcut(length - start, min_piece, pool)
+            if start == length and run >= length:
+                state.full += 1
+            else:
+                state.cut += 1
+
+        if run <= start:
+            PlankSequencer._keep_offcut(start - run, min_piece, pool)
+            return start, 0
+
+        remaining = run - start - joint
+        full_planks = max(0, (remaining + joint) // pitch)
+        state.full += full_planks
+        end = remaining - full_planks * pitch
+        if end <= 0:
+            return start, full_planks
+
+        # End piece: smallest carried offcut that fits, else a new plank
+        idx = bisect_left(pool, end)
+        if idx < len(pool):
+            source = pool.pop(idx)
+            state.from_pool += 1
+        else:
+            source = length
+        state.cut += 1
+        PlankSequencer._keep_offcut(source - end, min_piece, pool)
+        return start, full_planks + 1
+
+    @staticmethod
+    def _keep_offcut(offcut: int, min_piece: int, pool: List[int]) -> None:
+        """Carry an offcut forward if it is long enough to start a row"""
+        if offcut >= min_piece:
+            insort(pool, offcut)
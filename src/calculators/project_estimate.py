@@ -0,0 +1,238 @@
+"""Columnar project estimate that recomputes only what an edit invalidates"""
+
+from src.models import (CostResult, FlooringMaterial, LayingPattern, MaterialTable, PatternTable,
+                        PriceBook, ResultBatch, RoomSpecification)
+from .area_calculator import AreaCalculator
+from .cost_calculator import CostCalculator
+from .material_calculator import MaterialCalculator
+from .waste_calculator import WasteCalculator
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+import numpy as np
+
+
+# Stages in evaluation order and the stages that read each one's columns
+STAGES = ('area', 'waste', 'material', 'consumables', 'cost', 'totals')
+_DOWNSTREAM = {
+    'area': ('waste', 'material', 'consumables'),
+    'waste': ('totals',),
+    'material': ('cost',),
+    'consumables': ('cost',),
+    'cost': ('totals',),
+    'totals': (),
+}
+
+# Stages that read each model field directly
+MATERIAL_FIELD_STAGES = {
+    'name': (),
+    'material_type': ('consumables',),
+    'unit_cost': ('cost',),
+    'unit_measurement': ('material',),
+    'width_cm': ('material',),
+    'length_cm': ('material',),
+    'thickness_mm': (),
+    'units_per_box': ('material',),
+    'waste_factor': ('waste', 'material'),
+}
+PATTERN_FIELD_STAGES = {
+    'pattern_type': (),
+    'description': (),
+    'additional_waste_percentage': ('waste', 'material'),
+    'difficulty_level': (),
+    'joints_width_mm': (),
+    'grout_consumption_kg_per_m2': ('consumables',),
+}
+
+
+class ProjectEstimate:
+    """
+    Estimate for every room of a project, kept up to date incrementally
+
+    Each stage of the area -> waste/material/consumables -> cost chain is
+    held as NumPy columns over all rooms with a dirty flag. Edits mark the
+    stages that read the changed input, and everything downstream of them;
+    reading ``columns`` or ``totals`` recomputes only the dirty stages.
+    A price or labor change therefore reruns just the cost columns and the
+    totals, never geometry or waste; switching to another price book
+    version reruns consumables, cost and totals.
+
+    Args:
+        rooms: Rooms of the project
+        materials: Candidate materials, referenced by index
+        patterns: Candidate patterns, referenced by index
+        material_indices, pattern_indices: Per-room (or single) index
+        labor_cost_per_m2, additional_costs: Scalar or per room
+        price_book, region: Consumable rates per material type (default: DEFAULT_RATES)
+    """
+
+    def __init__(self, rooms: Sequence[RoomSpecification],
+                 materials: Sequence[FlooringMaterial], patterns: Sequence[LayingPattern],
+                 material_indices=0, pattern_indices=0,
+                 labor_cost_per_m2=0, additional_costs=0,
+                 price_book: Optional[PriceBook] = None, region: Optional[str] = None):
+        self.rooms = list(rooms)
+        self.materials = list(materials)
+        self.patterns = list(patterns)
+        self.material_table = MaterialTable.from_materials(self.materials)
+        self.pattern_table = PatternTable.from_patterns(self.patterns)
+
+        n = len(self.rooms)
+        self.material_indices = self._column(material_indices, np.intp, n)
+        self.pattern_indices = self._column(pattern_indices, np.intp, n)
+        self.labor_cost_per_m2 = self._column(labor_cost_per_m2, np.float64, n)
+        self.additional_costs = self._column(additional_costs, np.float64, n)
+        self.price_book = price_book
+        self.region = region
+
+        self._stages: Dict[str, Dict] = {}
+        self._totals: Dict[str, float] = {}
+        self._dirty = set(STAGES)
+        self.last_recomputed: Tuple[str, ...] = ()
+
+    @staticmethod
+    def _column(values, dtype, n: int) -> np.ndarray:
+        return np.array(np.broadcast_to(np.asarray(values, dtype=dtype), (n,)))
+
+    def mark_dirty(self, *stages: str) -> None:
+        """Flag stages, and every stage downstream of them, for recomputation"""
+        pending = list(stages)
+        while pending:
+            stage = pending.pop()
+            if stage not in self._dirty:
+                self._dirty.add(stage)
+                pending.extend(_DOWNSTREAM[stage])
+
+    def set_room(self, index: int, room: RoomSpecification) -> None:
+        """Replace one room; only its area is recomputed before the downstream stages"""
+        self.rooms[index] = room
+        if 'area' in self._dirty:
+            return
+        self._stages['area']['area_m2'][index] = AreaCalculator.calculate_room_area(room)
+        self.mark_dirty(*_DOWNSTREAM['area'])
+
+    def update_material(self, index: int, **fields) -> None:
+        """Change fields of one material (in place) and invalidate the stages reading them"""
+        self._update(self.materials[index], MATERIAL_FIELD_STAGES, fields)
+        self.material_table.set_row(index, self.materials[index])
+
+    def update_pattern(self, index: int, **fields) -> None:
+        """Change fields of one pattern (in place) and invalidate the stages reading them"""
+        self._update(self.patterns[index], PATTERN_FIELD_STAGES, fields)
+        self.pattern_table.set_row(index, self.patterns[index])
+
+    def _update(self, model, field_stages: Dict[str, Tuple[str, ...]], fields: Dict) -> None:
+        for key in fields:
+            if key not in field_stages:
+                raise ValueError(f"Unknown field '{key}' for {type(model).__name__}")
+        for key, value in fields.items():
+            setattr(model, key, value)
+            self.mark_dirty(*field_stages[key])
+
+    def assign(self, rooms: Optional[Iterable[int]] = None,
+               material_index: Optional[int] = None,
+               pattern_index: Optional[int] = None) -> None:
+        """Switch rooms (default: all) to another material and/or pattern"""
+        target = slice(None) if rooms is None else np.asarray(list(rooms), dtype=np.intp)
+        if material_index is not None:
+            self.material_indices[target] = material_index
+            self.mark_dirty('waste', 'material', 'consumables', 'cost')
+        if pattern_index is not None:
+            self.pattern_indices[target] = pattern_index
+            self.mark_dirty('waste', 'material', 'consumables')
+
+    def set_labor_rate(self, labor_cost_per_m2: float, rooms: Optional[Iterable[int]] = None) -> None:
+        """Change the labor rate of some rooms (default: all)"""
+        target = slice(None) if rooms is None else np.asarray(list(rooms), dtype=np.intp)
+        self.labor_cost_per_m2[target] = labor_cost_per_m2
+        self.mark_dirty('cost')
+
+    def set_additional_costs(self, additional_costs: float, rooms: Optional[Iterable[int]] = None) -> None:
+        """Change the fixed additional costs of some rooms (default: all)"""
+        target = slice(None) if rooms is None else np.asarray(list(rooms), dtype=np.intp)
+        self.additional_costs[target] = additional_costs
+        self.mark_dirty('cost')
+
+    def set_price_book(self, price_book: Optional[PriceBook], region: Optional[str] = None) -> None:
+        """Reprice consumables with another price book (or region); quantities are kept"""
+        self.price_book = price_book
+        self.region = region
+        self.mark_dirty('consumables')
+
+    def refresh(self) -> Tuple[str, ...]:
+        """Recompute the dirty stages in order; returns the stages that ran"""
+        ran = tuple(stage for stage in STAGES if stage in self._dirty)
+        for stage in ran:
+            getattr(self, '_compute_' + stage)()
+            self._dirty.discard(stage)
+        self.last_recomputed = ran
+        return ran
+
+    @property
+    def columns(self) -> ResultBatch:
+        """Per-room columns of every stage"""
+        self.refresh()
+        columns: Dict[str, np.ndarray] = {}
+        for stage in STAGES[:-1]:
+            columns.update(self._stages[stage])
+        return ResultBatch(CostResult, columns)
+
+    @property
+    def totals(self) -> Dict[str, float]:
+        """Project totals (see ResultBatch.summarize)"""
+        self.refresh()
+        return self._totals
+
+    def _compute_area(self) -> None:
+        self._stages['area'] = {'area_m2': AreaCalculator.calculate_room_area_batch(self.rooms)}
+
+    def _compute_waste(self) -> None:
+        waste = WasteCalculator.calculate_waste_quantity_batch(
+            self._stages['area']['area_m2'],
+            self.material_table.waste_factor[self.material_indices],
+            self.pattern_table.additional_waste_percentage[self.pattern_indices],
+        )
+        self._stages['waste'] = {
+            'total_waste_m2': waste['total_waste_m2'],
+            'waste_percentage': waste['waste_percentage'],
+        }
+
+    def _compute_material(self) -> None:
+        m, p = self.material_indices, self.pattern_indices
+        materials = self.material_table
+        self._stages['material'] = MaterialCalculator.calculate_material_needed_batch(
+            self._stages['area']['area_m2'],
+            materials.waste_factor[m],
+            self.pattern_table.additional_waste_percentage[p],
+            materials.area_per_unit[m],
+            materials.units_per_box[m],
+            materials.per_m2[m],
+        )
+
+    def _compute_consumables(self) -> None:
+        rates = None
+        if self.price_book is not None:
+            rates = self.price_book.rate_table([m.material_type for m in self.materials], self.region)
+            rates = rates.take(self.material_indices)
+        consumables = MaterialCalculator.calculate_consumables_batch(
+            self._stages['area']['area_m2'], self.pattern_table.grout_kg_per_m2[self.pattern_indices], rates
+        )
+        consumables['consumable_cost'] = CostCalculator.calculate_consumable_cost_batch(consumables, rates)
+        self._stages['consumables'] = consumables
+
+    def _compute_cost(self) -> None:
+        quantity_units = self._stages['material']['quantity_units']
+        costs = CostCalculator.combine_costs_batch(
+            self._stages['area']['area_m2'],
+            quantity_units * self.material_table.unit_cost[self.material_indices],
+            self._stages['consumables']['consumable_cost'],
+            self.labor_cost_per_m2,
+            self.additional_costs,
+        )
+        del costs['area_m2']
+        self._stages['cost'] = costs
+
+    def _compute_totals(self) -> None:
+        columns = {'area_m2': self._stages['area']['area_m2'],
+                   'total_waste_m2': self._stages['waste']['total_waste_m2'],
+                   'quantity_units': self._stages['material']['quantity_units']}
+        columns.update(self._stages['cost'])
+        self._totals = ResultBatch.summarize(columns, len(self.rooms))
@@ -0,0 +1,148 @@
+"""Sweep every material x pattern x labor option and keep the cheapest per room"""
+
+from src.models import ConsumableRates, FlooringMaterial, LayingPattern, MaterialTable, PatternTable
+from src.models.price_book import DEFAULT_RATES
+from typing import Dict, Optional, Sequence, Union
+import numpy as np
+
+
+# Upper bound on (rooms x materials x patterns) elements evaluated per chunk
+DEFAULT_CHUNK_ELEMENTS = 4_000_000
+
+
+class ScenarioCalculator:
+    """Evaluates the full option space for a set of rooms with broadcasting"""
+
+    @staticmethod
+    def cheapest_options(total_areas,
+                         materials: Union[Sequence[FlooringMaterial], MaterialTable],
+                         patterns: Union[Sequence[LayingPattern], PatternTable],
+                         labor_rates: Sequence[float] = (0.0,),
+                         additional_costs=0,
+                         k: int = 5,
+                         max_waste_percent: Optional[float] = None,
+                         chunk_elements: int = DEFAULT_CHUNK_ELEMENTS,
+                         rates: Optional[ConsumableRates] = None) -> Dict:
+        """
+        Find the k cheapest (material, pattern, labor) options for every room
+
+        Costs for all materials x patterns are broadcast per chunk of rooms
+        and reduced with a partial selection, never as per-option dicts. The
+        labor rate only adds a per-room term, so only the k cheapest labor
+        options are combined with the k cheapest material/pattern pairs.
+
+        Args:
+            total_areas: Flooring area of every room in m2
+            materials: Candidate materials, or a prebuilt MaterialTable
+            patterns: Candidate patterns, or a prebuilt PatternTable
+            labor_rates: Candidate labor costs per m2
+            additional_costs: Fixed costs, scalar or per room
+            k: Number of options to keep per room
+            max_waste_percent: Skip options whose total waste factor exceeds this
+            rates: Consumable rates, scalar or per material (PriceBook.rate_table)
+
+        Returns:
+            Dictionary of ``(rooms, k)`` arrays sorted cheapest first:
+            material_index, pattern_index, labor_index, total_cost and
+            waste_percent. Slots without a feasible option hold index -1 and
+            an infinite cost.
+        """
+        if not isinstance(materials, MaterialTable):
+            materials = MaterialTable.from_materials(materials)
+        if not isinstance(patterns, PatternTable):
+            patterns = PatternTable.from_patterns(patterns)
+
+        areas = np.asarray(total_areas, dtype=np.float64)
+        rooms = areas.shape[0]
+        additional = np.broadcast_to(np.asarray(additional_costs, dtype=np.float64), areas.shape)
+        labor = np.asarray(labor_rates, dtype=np.float64)
+        n_materials, n_patterns = len(materials), len(patterns)
+
+        # Waste factor of every (material, pattern) pair, as in get_total_waste_factor
+        wf = materials.waste_factor[:, None]
+        total_waste_factor = wf + (wf * patterns.additional_waste_percentage[None, :] / 100)
+        infeasible = np.zeros(total_waste_factor.shape, dtype=bool)
+        if max_waste_percent is not None:
+            infeasible = total_waste_factor * 100 > max_waste_percent
+
+        # A zero area per unit divides to zero units, as in the scalar path
+        unit_area = np.where(materials.area_per_unit > 0, materials.area_per_unit, np.inf)[:, None]
+        rounded = ~materials.per_m2
+        unit_cost = materials.unit_cost[:, None]
+
+        # Consumable rates along the material axis: (1, materials, 1) arrays, or scalars
+        rates = ConsumableRates(*(
+            value if np.ndim(value) == 0 else np.asarray(value, dtype=np.float64)[None, :, None]
+            for value in (rates or DEFAULT_RATES).take(np.arange(n_materials))
+        ))
+
+        k_pairs = min(k, n_materials * n_patterns)
+        labor_order = np.argsort(labor, kind='stable')[:min(k, labor.shape[0])]
+        k_out = min(k, k_pairs * labor_order.shape[0])
+
+        out_material = np.full((rooms, k), -1, dtype=np.int64)
+        out_pattern = np.full((rooms, k), -1, dtype=np.int64)
+        out_labor = np.full((rooms, k), -1, dtype=np.int64)
+        out_cost = np.full((rooms, k), np.inf)
+        out_waste = np.full((rooms, k), np.nan)
+
+        step = max(1, chunk_elements // max(1, n_materials * n_patterns))
+        for start in range(0, rooms, step):
+            sl = slice(start, start + step)
+            area = areas[sl, None, None]
+
+            # Material cost per (room, material, pattern), computed in place
+            base = area * (1 + total_waste_factor)
+            base /= unit_area
+            base[:, rounded] = np.ceil(base[:, rounded])
+            base *= unit_cost
+            material_cost = base.reshape(base.shape[0], -1).copy()
+
+            # Consumables per (room, material or 1, pattern), same terms as calculate_total_project_cost
+            area2 = areas[sl, None]
+            consumable_cost = (area * patterns.grout_kg_per_m2[None, None, :] * rates.grout_price_per_kg
+                               + area * rates.adhesive_kg_per_m2 * rates.adhesive_price_per_kg
+                               + area / rates.sealer_coverage_m2_per_liter * rates.sealer_price_per_liter)
+            base += consumable_cost
+            consumable_cost = np.broadcast_to(consumable_cost, base.shape)
+            base[:, infeasible] = np.inf
+            base = base.reshape(base.shape[0], -1)
+
+            pairs = np.argpartition(base, k_pairs - 1, axis=1)[:, :k_pairs]
+            pair_cost = np.take_along_axis(base, pairs, axis=1)
+            labor_cost = area2 * labor[labor_order][None, :]
+            combined = (pair_cost[:, :, None] + labor_cost[:, None, :]).reshape(pair_cost.shape[0], -1)
+
+            best = np.argpartition(combined, k_out - 1, axis=1)[:, :k_out]
+            pair_pick = np.take_along_axis(pairs, best // labor_order.shape[0], axis=1)
+            labor_pick = labor_order[best % labor_order.shape[0]]
+            m_pick, p_pick = np.divmod(pair_pick, n_patterns)
+
+            # Recompute the survivors in the scalar operation order for exact totals
+            rows = np.arange(pair_pick.shape[0])[:, None]
+            total = (material_cost[rows, pair_pick]
+                     + area2 * labor[labor_pick]
+                     + consumable_cost[rows, m_pick, p_pick]
+                     + additional[sl, None])
+            total = np.where(infeasible[m_pick, p_pick], np.inf, total)
+            # Equal totals among the survivors are ordered by option index
+            option_id = pair_pick * labor.shape[0] + labor_pick
+            order = np.lexsort((option_id, total), axis=1)
+
+            total = np.take_along_axis(total, order, axis=1)
+            feasible = np.isfinite(total)
+            out_cost[sl, :k_out] = total
+            out_material[sl, :k_out] = np.where(feasible, np.take_along_axis(m_pick, order, axis=1), -1)
+            out_pattern[sl, :k_out] = np.where(feasible, np.take_along_axis(p_pick, order, axis=1), -1)
+            out_labor[sl, :k_out] = np.where(feasible, np.take_along_axis(labor_pick, order, axis=1), -1)
+            m_sorted = np.take_along_axis(m_pick, order, axis=1)
+            p_sorted = np.take_along_axis(p_pick, order, axis=1)
+            out_waste[sl, :k_out] = np.where(feasible, total_waste_factor[m_sorted, p_sorted] * 100, np.nan)
+
+        return {
+            'material_index': out_material,
+            'pattern_index': out_pattern,
+            'labor_index': out_labor,
+            'total_cost': out_cost,
+            'waste_percent': out_waste,
+        }
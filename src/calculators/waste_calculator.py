@@ -1,6 +1,6 @@
 """Calculate material waste and cutting losses"""
 
-from src.models import FlooringMaterial, LayingPattern
+from src.models import FlooringMaterial, LayingPattern, ResultBatch, WasteResult
 from typing import Dict, Tuple
 
 
@@ -9,23 +9,76 @@ class WasteCalculator:
     
     @staticmethod
     def calculate_waste_quantity(total_area: float, material: FlooringMaterial, 
-                                 pattern: LayingPattern) -> Tuple[float, Dict]:
+                                 pattern: LayingPattern) -> Tuple[float, WasteResult]:
         """
         Calculate waste quantity based on material and pattern
         
         Returns:
-            Tuple of (waste_area_m2, waste_details_dict)
+            Tuple of (waste_area_m2, WasteResult details)
         """
         material_waste = total_area * material.waste_factor
         pattern_additional_waste = material_waste * pattern.additional_waste_percentage / 100
         total_waste = material_waste + pattern_additional_waste
         
-        details = {
+        details = WasteResult(
+            material_waste_m2=material_waste,
+            pattern_additional_waste_m2=pattern_additional_waste,
+            total_waste_m2=total_waste,
+            waste_percentage=(total_waste / total_area * 100) if total_area > 0 else 0
+        )
+        
+        return total_waste, details
+    
+    @staticmethod
+    def calculate_waste_quantity_batch(total_areas, waste_factors, pattern_waste_percentages) -> ResultBatch:
+        """
+        Calculate waste quantities for many rows at once
+        
+        Args:
+            total_areas: Flooring areas in m2
+            waste_factors: Material waste factors (FlooringMaterial.waste_factor)
+            pattern_waste_percentages: LayingPattern.additional_waste_percentage
+        
+        Returns:
+            ResultBatch of WasteResult columns, with every element matching the scalar result
+        """
+        import numpy as np
+        
+        total_areas = np.asarray(total_areas, dtype=np.float64)
+        material_waste = total_areas * np.asarray(waste_factors, dtype=np.float64)
+        pattern_additional_waste = material_waste * np.asarray(pattern_waste_percentages) / 100
+        total_waste = material_waste + pattern_additional_waste
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            waste_percentage = np.where(total_areas > 0, total_waste / total_areas * 100, 0.0)
+        
+        return ResultBatch(WasteResult, {
             'material_waste_m2': material_waste,
             'pattern_additional_waste_m2': pattern_additional_waste,
             'total_waste_m2': total_waste,
-            'waste_percentage': (total_waste / total_area * 100) if total_area > 0 else 0
-        }
+            'waste_percentage': waste_percentage,
+        })
+    
+    @staticmethod
+    def calculate_waste_from_layout(layout: Dict) -> Tuple[float, WasteResult]:
+        """
+        Calculate waste from a simulated layout instead of percentages
+        
+        Args:
+            layout: Result of LayoutCalculator.simulate_layout
+        
+        Returns:
+            Tuple of (waste_area_m2, WasteResult details)
+        """
+        total_waste = layout['pieces_required'] * layout['piece_area_m2'] - layout['covered_area_m2']
+        room_area = layout['room_area_m2']
+        
+        details = WasteResult(
+            material_waste_m2=total_waste,
+            pattern_additional_waste_m2=0.0,
+            total_waste_m2=total_waste,
+            waste_percentage=(total_waste / room_area * 100) if room_area > 0 else 0
+        )
         
         return total_waste, details
     
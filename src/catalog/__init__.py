@@ -0,0 +1,5 @@
+"""Supplier material catalogs"""
+
+from .material_catalog import MaterialCatalog
+
+__all__ = ['MaterialCatalog']
@@ -0,0 +1,349 @@
+"""Indexed in-memory store of supplier material SKUs"""
+
+from src.models import FlooringMaterial, FrozenFlooringMaterial, MaterialTable
+from src.utils.column_store import ColumnStore, ColumnWriter
+from src.utils.room_schedule import RoomSchedule
+from src.utils.unit_converter import UnitConverter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import math
+import os
+import numpy as np
+
+
+# Text fields, stored as codes into a list of distinct values
+TEXT_FIELDS = ('sku', 'name', 'material_type', 'unit_measurement')
+# Numeric fields; NaN (0 for units_per_box) stands for a value the SKU does not have
+NUMBER_FIELDS = ('unit_cost', 'units_per_box', 'thickness_mm', 'width_cm', 'length_cm', 'waste_factor')
+FIELDS = TEXT_FIELDS + NUMBER_FIELDS
+
+# Fields with a sorted index: exact match for text, closed ranges for numbers
+INDEXED_FIELDS = ('sku', 'material_type', 'unit_measurement',
+                  'unit_cost', 'thickness_mm', 'width_cm', 'length_cm')
+# Range fields also indexed per material type, as (material_type, value) order
+TYPED_FIELDS = ('unit_cost', 'thickness_mm', 'width_cm', 'length_cm')
+
+_ORDER = '{}.order'
+_SORTED = '{}.sorted'
+_TYPED = '{}.by_type'
+# Text fields in text order: rows by text, and each row's rank in the sorted distinct values
+_TEXT = '{}.text'
+
+
+class MaterialCatalog:
+    """
+    Supplier catalog held as columns, with a sorted index per queried field
+
+    Each index is the row order of its field plus the values in that
+    order, so a criterion is resolved by two binary searches. Range
+    fields are also indexed within each material type, which turns a
+    type plus a range into one contiguous block. ``query`` starts from the
+    narrowest block and filters only its rows against the other criteria.
+    Text values (a SKU, a material type) are found by binary search in the
+    sorted distinct values of their field. Indexes are built on first use,
+    or loaded with the catalog when it was saved with ``save``.
+
+    Args:
+        columns: Field name -> column (codes for text fields)
+        categories: Text field name -> distinct values, indexed by code
+        indexes: Optional prebuilt (order, sorted values) per field
+        texts: Optional sorted distinct values per text field, matching
+            the ranks of its prebuilt text index
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], categories: Dict[str, np.ndarray],
+                 indexes: Optional[Dict[str, Tuple[np.ndarray, np.ndarray]]] = None,
+                 texts: Optional[Dict[str, np.ndarray]] = None):
+        self.columns = columns
+        self.categories = categories
+        self._indexes = dict(indexes or {})
+        self._texts = dict(texts or {})
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]], size_unit: Optional[str] = None) -> "MaterialCatalog":
+        """
+        Build a catalog from SKU rows (dictionaries keyed by FIELDS)
+
+        Args:
+            rows: SKU rows
+            size_unit: Unit of thickness_mm, width_cm and length_cm when the
+                supplier does not use mm and cm, e.g. 'in'; the columns are
+                converted once here
+
+        Raises:
+            ValueError: If a row has no sku or an invalid number
+        """
+        codes: Dict[str, Dict[str, int]] = {field: {} for field in TEXT_FIELDS}
+        values: Dict[str, List] = {field: [] for field in FIELDS}
+        for number, row in enumerate(rows, 1):
+            if not row.get('sku'):
+                raise ValueError(f"row {number}: sku is required")
+            for field in TEXT_FIELDS:
+                text = row.get(field)
+                text = str(text if text not in (None, '') else _TEXT_DEFAULTS.get(field, row['sku']))
+                values[field].append(codes[field].setdefault(text, len(codes[field])))
+            for field in NUMBER_FIELDS:
+                values[field].append(_number(number, field, row.get(field)))
+
+        columns = {field: np.array(values[field], dtype=np.int32) for field in TEXT_FIELDS}
+        for field in NUMBER_FIELDS:
+            column = np.array(values[field], dtype=np.float64)
+            if field == 'units_per_box':
+                column = np.nan_to_num(column, nan=0).astype(np.int64)
+            elif field == 'unit_cost':
+                column = np.nan_to_num(column, nan=0.0)
+            elif field == 'waste_factor':
+                column[np.isnan(column)] = FlooringMaterial.waste_factor
+            columns[field] = column
+        if size_unit:
+            for field, unit in (('thickness_mm', 'mm'), ('width_cm', 'cm'), ('length_cm', 'cm')):
+                columns[field] = UnitConverter.convert_length(columns[field], size_unit, unit)
+        categories = {field: np.array(list(codes[field]) or [''], dtype=str) for field in TEXT_FIELDS}
+        return cls(columns, categories)
+
+    @classmethod
+    def from_materials(cls, materials: Sequence[FlooringMaterial],
+                       skus: Optional[Sequence[str]] = None) -> "MaterialCatalog":
+        """Build a catalog from material instances (SKUs default to their position)"""
+        if skus is None:
+            skus = [str(i) for i in range(len(materials))]
+        return cls.from_rows(
+            dict({field: getattr(material, field) for field in FIELDS[1:]}, sku=sku)
+            for sku, material in zip(skus, materials)
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, "os.PathLike"], fmt: Optional[str] = None,
+             size_unit: Optional[str] = None) -> "MaterialCatalog":
+        """Read a supplier catalog file (CSV or JSON Lines, one SKU per row; see from_rows)"""
+        path = os.fspath(path)
+        with open(path, newline='', encoding='utf-8') as stream:
+            rows = []
+            for line_no, raw, error in RoomSchedule.read_raw(stream, fmt or RoomSchedule.detect_format(path)):
+                if error is not None:
+                    raise ValueError(f"line {line_no}: {error}")
+                rows.append(raw)
+        return cls.from_rows(rows, size_unit)
+
+    def save(self, directory: Union[str, "os.PathLike"]) -> None:
+        """Persist columns and every index as .npy files (see ColumnStore)"""
+        columns: Dict[str, Any] = {}
+        for field in FIELDS:
+            columns[field] = (self.categories[field][self.columns[field]] if field in TEXT_FIELDS
+                              else self.columns[field])
+        for name in INDEXED_FIELDS + tuple(_TYPED.format(field) for field in TYPED_FIELDS):
+            order, ordered = self._index(name)
+            columns[_ORDER.format(name)] = order
+            columns[_SORTED.format(name)] = ordered
+        for field in TEXT_FIELDS:
+            # Stored as text, the ranks become codes into the sorted values
+            order, ranks = self._index(_TEXT.format(field))
+            columns[_ORDER.format(_TEXT.format(field))] = order
+            columns[_SORTED.format(_TEXT.format(field))] = self._texts[field][ranks]
+        with ColumnWriter(directory, record=None) as writer:
+            writer.append_columns(columns)
+
+    @classmethod
+    def open(cls, directory: Union[str, "os.PathLike"], mmap: bool = True) -> "MaterialCatalog":
+        """
+        Open a saved catalog; with mmap the columns and indexes are mapped, not read
+
+        Text codes are assigned in order of first appearance, both here and
+        when saving, so the saved text indexes stay valid.
+        """
+        stored = ColumnStore.read_columns(directory, mmap=mmap, decode=False)
+        columns = {field: stored[field] for field in FIELDS}
+        categories = {field: ColumnStore.categories(directory, field) for field in TEXT_FIELDS}
+        texts = {field: ColumnStore.categories(directory, _SORTED.format(_TEXT.format(field)))
+                 for field in TEXT_FIELDS if _ORDER.format(_TEXT.format(field)) in stored}
+        names = (INDEXED_FIELDS + tuple(_TYPED.format(field) for field in TYPED_FIELDS)
+                 + tuple(_TEXT.format(field) for field in texts))
+        indexes = {name: (stored[_ORDER.format(name)], stored[_SORTED.format(name)])
+                   for name in names if _ORDER.format(name) in stored}
+        return cls(columns, categories, indexes, texts)
+
+    def __len__(self) -> int:
+        return len(self.columns['unit_cost'])
+
+    def index(self, field: str, by_type: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (row order, values in that order) of an indexed field, built on first use
+
+        With by_type, rows are ordered by material type first; the rows of
+        each type form the same block as in the material_type index.
+        """
+        if field not in (TYPED_FIELDS if by_type else INDEXED_FIELDS):
+            raise ValueError(f"'{field}' is not indexed{' by type' if by_type else ''}")
+        return self._index(_TYPED.format(field) if by_type else field)
+
+    def _index(self, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        index = self._indexes.get(name)
+        if index is None:
+            field = name.split('.')[0]
+            column = self.columns[field]
+            if name == field:
+                order = np.argsort(column, kind='stable')
+            elif name == _TEXT.format(field):
+                by_text = np.argsort(self.categories[field], kind='stable')
+                self._texts[field] = self.categories[field][by_text]
+                rank = np.empty(len(by_text), dtype=np.int64)
+                rank[by_text] = np.arange(len(by_text))
+                column = rank[column]
+                if len(by_text) == len(column):
+                    # Every row distinct (SKUs): the ranks are a permutation, invert it
+                    order = np.empty_like(column)
+                    order[column] = np.arange(len(column))
+                else:
+                    order = np.argsort(column, kind='stable')
+            else:
+                order = np.lexsort((column, self.columns['material_type']))
+            order = order.astype(np.int64)
+            index = self._indexes[name] = (order, column[order])
+        return index
+
+    def code(self, field: str, value: str) -> Optional[int]:
+        """Code of a text value, or None when no SKU has it"""
+        row = self._text_row(field, value)
+        return None if row is None else int(self.columns[field][row])
+
+    def _text_row(self, field: str, value: str) -> Optional[int]:
+        """First row holding a text value, by binary search in the sorted values"""
+        if not isinstance(value, str):
+            return None
+        order, ranks = self._index(_TEXT.format(field))
+        texts = self._texts[field]
+        rank = int(np.searchsorted(texts, value))
+        if rank == len(texts) or texts[rank] != value:
+            return None
+        start = int(np.searchsorted(ranks, rank))
+        if start == len(ranks) or ranks[start] != rank:
+            return None
+        return int(order[start])
+
+    def query(self, **criteria) -> np.ndarray:
+        """
+        Rows matching every criterion, in catalog order
+
+        Text fields take a value to match exactly; numeric fields a closed
+        (low, high) range where either end may be None, or a single value.
+        SKUs without a value for a field (NaN) never match a range on it.
+
+        Example:
+            catalog.query(material_type='wood', width_cm=(12, 20), unit_cost=(None, 40))
+        """
+        ranges = {}
+        for field, value in criteria.items():
+            if field in TEXT_FIELDS:
+                code = self.code(field, value)
+                if code is None:
+                    return np.zeros(0, dtype=np.int64)
+                ranges[field] = (code, code)
+            elif field in NUMBER_FIELDS:
+                low, high = value if isinstance(value, (tuple, list)) else (value, value)
+                ranges[field] = (-math.inf if low is None else float(low),
+                                 math.inf if high is None else float(high))
+            else:
+                raise ValueError(f"Unknown catalog field '{field}'")
+        if not ranges:
+            return np.arange(len(self))
+
+        # Candidate blocks: (rows, index name, start, stop)
+        blocks = []
+        type_block = None
+        if 'material_type' in ranges:
+            type_block = self._block('material_type', *ranges['material_type'])
+            blocks.append(type_block)
+        for field, (low, high) in ranges.items():
+            if field == 'material_type':
+                continue
+            if type_block is not None and field in TYPED_FIELDS:
+                blocks.append(self._block(_TYPED.format(field), low, high, type_block[2:]))
+            elif field in INDEXED_FIELDS:
+                blocks.append(self._block(field, low, high))
+
+        if blocks:
+            _, name, start, stop = min(blocks, key=lambda block: block[0])
+            rows = self._index(name)[0][start:stop]
+            covered = {name.split('.')[0]}
+            if name.endswith(_TYPED.format('')):
+                covered.add('material_type')
+        else:
+            rows, covered = np.arange(len(self)), set()
+        for field, (low, high) in ranges.items():
+            if field in covered or not len(rows):
+                continue
+            values = self.columns[field][rows]
+            rows = rows[(values >= low) & (values <= high)]
+        return np.sort(rows)
+
+    def _block(self, name: str, low, high, within: Optional[Sequence[int]] = None) -> Tuple[int, str, int, int]:
+        """(size, name, start, stop) of the index positions holding values in [low, high]"""
+        ordered = self._index(name)[1]
+        if ordered.dtype.kind == 'i':
+            low, high = ordered.dtype.type(low), ordered.dtype.type(high)
+        first, last = within if within is not None else (0, len(ordered))
+        part = ordered[first:last]
+        start = first + int(np.searchsorted(part, low, side='left'))
+        stop = first + int(np.searchsorted(part, high, side='right'))
+        return stop - start, name, start, stop
+
+    def material(self, row: int) -> FrozenFlooringMaterial:
+        """Interned material of one row"""
+        cols, cats = self.columns, self.categories
+        return FrozenFlooringMaterial(
+            name=str(cats['name'][cols['name'][row]]),
+            material_type=str(cats['material_type'][cols['material_type'][row]]),
+            unit_cost=float(cols['unit_cost'][row]),
+            unit_measurement=str(cats['unit_measurement'][cols['unit_measurement'][row]]),
+            units_per_box=int(cols['units_per_box'][row]) or None,
+            thickness_mm=_optional(cols['thickness_mm'][row]),
+            width_cm=_optional(cols['width_cm'][row]),
+            length_cm=_optional(cols['length_cm'][row]),
+            waste_factor=float(cols['waste_factor'][row]),
+        )
+
+    def materials(self, rows: Iterable[int]) -> List[FrozenFlooringMaterial]:
+        return [self.material(row) for row in rows]
+
+    def sku(self, row: int) -> str:
+        return str(self.categories['sku'][self.columns['sku'][row]])
+
+    def find(self, sku: str) -> Optional[int]:
+        """Row of a SKU (the first, if repeated), or None"""
+        return self._text_row('sku', sku)
+
+    def material_table(self, rows: Optional[Sequence[int]] = None) -> MaterialTable:
+        """MaterialTable of some rows (default: all), for the batch calculators"""
+        take = slice(None) if rows is None else np.asarray(rows, dtype=np.int64)
+        cols = self.columns
+        width, length = cols['width_cm'][take], cols['length_cm'][take]
+        sized = (np.nan_to_num(width) != 0) & (np.nan_to_num(length) != 0)
+        per_m2_code = self.code('unit_measurement', 'm2')
+        return MaterialTable(
+            unit_cost=np.array(cols['unit_cost'][take], dtype=np.float64),
+            waste_factor=np.array(cols['waste_factor'][take], dtype=np.float64),
+            area_per_unit=np.where(sized, (width / 100) * (length / 100), 1.0),
+            units_per_box=np.array(cols['units_per_box'][take], dtype=np.float64),
+            per_m2=np.asarray(cols['unit_measurement'][take] == per_m2_code),
+        )
+
+    def __repr__(self) -> str:
+        return f"MaterialCatalog(skus={len(self)})"
+
+
+_TEXT_DEFAULTS = {'material_type': 'tile', 'unit_measurement': 'm2'}
+
+
+def _number(row: int, field: str, value: Any) -> float:
+    if value is None or value == '':
+        return math.nan
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"row {row}: invalid {field}: {value!r}") from None
+    if not math.isfinite(number):
+        raise ValueError(f"row {row}: invalid {field}: {value!r}")
+    return number
+
+
+def _optional(value) -> Optional[float]:
+    return None if math.isnan(value) else float(value)
@@ -1,7 +1,54 @@
 """Data models for flooring calculator"""
 
-from .flooring_material import FlooringMaterial
-from .laying_pattern import LayingPattern, PatternType
-from .room_specification import RoomSpecification
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ['FlooringMaterial', 'LayingPattern', 'PatternType', 'RoomSpecification']
+# Public name -> submodule defining it; submodules are imported on first
+# access, so scalar code paths never load NumPy (see src/__init__.py)
+_EXPORTS = {
+    'FlooringMaterial': '.flooring_material',
+    'LayingPattern': '.laying_pattern',
+    'PatternType': '.laying_pattern',
+    'RoomSpecification': '.room_specification',
+    'MaterialTable': '.tables',
+    'PatternTable': '.tables',
+    'RoomTable': '.tables',
+    'FrozenFlooringMaterial': '.frozen',
+    'FrozenLayingPattern': '.frozen',
+    'FrozenRoomSpecification': '.frozen',
+    'MaterialResult': '.results',
+    'WasteResult': '.results',
+    'ConsumablesResult': '.results',
+    'CostResult': '.results',
+    'EstimateResult': '.results',
+    'ResultBatch': '.results',
+    'ConsumableRates': '.price_book',
+    'PriceBook': '.price_book',
+    'PatternLibrary': '.pattern_library',
+    'PatternSpec': '.pattern_library',
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .flooring_material import FlooringMaterial
+    from .laying_pattern import LayingPattern, PatternType
+    from .room_specification import RoomSpecification
+    from .tables import MaterialTable, PatternTable, RoomTable
+    from .frozen import FrozenFlooringMaterial, FrozenLayingPattern, FrozenRoomSpecification
+    from .pattern_library import PatternLibrary, PatternSpec
+    from .price_book import ConsumableRates, PriceBook
+    from .results import (ConsumablesResult, CostResult, EstimateResult, MaterialResult, ResultBatch,
+                          WasteResult)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(import_module(module, __name__), name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
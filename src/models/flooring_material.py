@@ -24,5 +24,10 @@ class FlooringMaterial:
             return (self.width_cm / 100) * (self.length_cm / 100)  # Convert cm to m
         return 1.0  # Default 1 m2 if dimensions not specified
     
+    def freeze(self) -> "FrozenFlooringMaterial":
+        """Immutable, interned copy usable as a dict or cache key"""
+        from .frozen import FrozenFlooringMaterial
+        return FrozenFlooringMaterial.from_model(self)
+
     def __str__(self) -> str:
         return f"{self.name} ({self.material_type}) - {self.unit_cost} per {self.unit_measurement}"
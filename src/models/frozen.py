@@ -0,0 +1,156 @@
+"""Immutable, slotted, interned variants of the model dataclasses"""
+
+from dataclasses import MISSING, FrozenInstanceError, fields
+from typing import Any, ClassVar, Dict, Tuple
+from weakref import WeakValueDictionary
+
+from .flooring_material import FlooringMaterial
+from .laying_pattern import LayingPattern
+from .room_specification import RoomSpecification
+
+
+class _Frozen:
+    """
+    Base for value objects mirroring one of the model dataclasses
+
+    Fields and defaults are taken from the mutable dataclass. Instances are
+    interned by value: constructing an object equal to a live one returns
+    that same object, so materials and patterns repeated across a catalog
+    or a batch share memory and hash once.
+    """
+
+    __slots__ = ('_hash', '__weakref__')
+
+    _mutable: ClassVar[type]
+    _fields: ClassVar[Tuple[str, ...]]
+    _defaults: ClassVar[Dict[str, Any]]
+    _interned: ClassVar[WeakValueDictionary]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        model_fields = fields(cls._mutable)
+        cls._fields = tuple(f.name for f in model_fields)
+        cls._defaults = {f.name: f.default for f in model_fields if f.default is not MISSING}
+        cls._interned = WeakValueDictionary()
+
+    def __new__(cls, *args, **kwargs):
+        values = cls._bind(args, kwargs)
+        obj = cls._interned.get(values)
+        if obj is None:
+            obj = object.__new__(cls)
+            for name, value in zip(cls._fields, values):
+                object.__setattr__(obj, name, value)
+            object.__setattr__(obj, '_hash', hash(values))
+            cls._interned[values] = obj
+        return obj
+
+    @classmethod
+    def _bind(cls, args: tuple, kwargs: Dict[str, Any]) -> tuple:
+        """Map constructor arguments onto the field order, like the dataclass __init__"""
+        if len(args) > len(cls._fields):
+            raise TypeError(f"{cls.__name__} takes at most {len(cls._fields)} arguments")
+        values = dict(zip(cls._fields, args))
+        for name, value in kwargs.items():
+            if name not in cls._fields:
+                raise TypeError(f"{cls.__name__} got an unexpected argument '{name}'")
+            if name in values:
+                raise TypeError(f"{cls.__name__} got multiple values for argument '{name}'")
+            values[name] = value
+        for name in cls._fields:
+            if name not in values:
+                if name not in cls._defaults:
+                    raise TypeError(f"{cls.__name__} missing required argument '{name}'")
+                values[name] = cls._defaults[name]
+        return tuple(cls._normalize(name, values[name]) for name in cls._fields)
+
+    @classmethod
+    def _normalize(cls, name: str, value: Any) -> Any:
+        return value
+
+    @classmethod
+    def from_model(cls, model) -> "_Frozen":
+        """Interned frozen copy of a mutable model instance"""
+        return cls(*(getattr(model, name) for name in cls._fields))
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def freeze(self) -> "_Frozen":
+        return self
+
+    def thaw(self):
+        """Mutable dataclass copy"""
+        return self._mutable(*self._values())
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return (type(self), self._values())
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self) -> str:
+        body = ', '.join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({body})"
+
+
+class FrozenFlooringMaterial(_Frozen):
+    """Immutable, interned FlooringMaterial"""
+
+    _mutable = FlooringMaterial
+    __slots__ = tuple(f.name for f in fields(FlooringMaterial))
+
+    get_area_per_unit = FlooringMaterial.get_area_per_unit
+    __str__ = FlooringMaterial.__str__
+
+
+class FrozenLayingPattern(_Frozen):
+    """Immutable, interned LayingPattern"""
+
+    _mutable = LayingPattern
+    __slots__ = tuple(f.name for f in fields(LayingPattern))
+
+    get_total_waste_factor = LayingPattern.get_total_waste_factor
+    __str__ = LayingPattern.__str__
+
+
+class FrozenRoomSpecification(_Frozen):
+    """Immutable, interned RoomSpecification; vertices are stored as a tuple"""
+
+    _mutable = RoomSpecification
+    __slots__ = tuple(f.name for f in fields(RoomSpecification))
+
+    get_vertices = RoomSpecification.get_vertices
+    get_total_area = RoomSpecification.get_total_area
+    get_perimeter = RoomSpecification.get_perimeter
+    __str__ = RoomSpecification.__str__
+
+    @classmethod
+    def _normalize(cls, name: str, value: Any) -> Any:
+        if name == 'vertices' and value is not None:
+            return tuple((float(x), float(y)) for x, y in value)
+        return value
+
+    def thaw(self) -> RoomSpecification:
+        room = super().thaw()
+        if room.vertices is not None:
+            room.vertices = list(room.vertices)
+        return room
@@ -32,5 +32,10 @@ class LayingPattern:
         """Calculate total waste factor including pattern-specific waste"""
         return material_waste + (material_waste * self.additional_waste_percentage / 100)
     
+    def freeze(self) -> "FrozenLayingPattern":
+        """Immutable, interned copy usable as a dict or cache key"""
+        from .frozen import FrozenLayingPattern
+        return FrozenLayingPattern.from_model(self)
+
     def __str__(self) -> str:
         return f"{self.pattern_type.value.replace('_', ' ').title()} - {self.description}"
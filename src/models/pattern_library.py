@@ -0,0 +1,192 @@
+"""Built-in laying patterns and their waste coefficients"""
+
+from bisect import bisect_right
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, NamedTuple, Optional, Sequence
+
+from .frozen import FrozenLayingPattern
+from .laying_pattern import PatternType
+
+if TYPE_CHECKING:
+    import numpy as np
+    from .tables import PatternTable
+
+
+class PatternSpec(NamedTuple):
+    """Default properties of a laying pattern"""
+    description: str
+    additional_waste_percentage: float
+    difficulty_level: str
+    joints_width_mm: float
+    grout_consumption_kg_per_m2: float  # applied to grouted materials only
+
+
+PATTERN_LIBRARY: Dict[PatternType, PatternSpec] = {
+    PatternType.STRAIGHT: PatternSpec("Simple straight laying pattern", 5.0, "easy", 3.0, 1.8),
+    PatternType.DIAGONAL: PatternSpec("Straight rows at 45 degrees to the walls", 12.0, "medium", 3.0, 1.8),
+    PatternType.HERRINGBONE: PatternSpec("Classic V-shaped weaving pattern", 12.0, "hard", 2.0, 2.0),
+    PatternType.CHEVRON: PatternSpec("Zigzag of pieces cut at an angle", 15.0, "hard", 2.0, 2.0),
+    PatternType.BASKET_WEAVE: PatternSpec("Interlocking pairs at right angles", 10.0, "medium", 3.0, 2.0),
+    PatternType.RANDOM: PatternSpec("Random arrangement of pieces", 15.0, "medium", 3.0, 2.0),
+    PatternType.RUNNING_BOND: PatternSpec("Offset brick-like rows", 8.0, "easy", 3.0, 1.8),
+    PatternType.MIXED_SIZES: PatternSpec("Modular pattern of different sizes", 18.0, "medium", 3.0, 2.2),
+}
+
+# Materials laid with grout joints
+GROUTED_MATERIAL_TYPES = ('tile', 'stone', 'ceramic', 'porcelain', 'mosaic', 'terrazzo')
+
+# Axes of the coefficient table; unknown material types use 'other'
+PATTERN_TYPES = tuple(PatternType)
+MATERIAL_TYPES = ('tile', 'stone', 'wood', 'laminate', 'vinyl', 'other')
+# Piece aspect ratio (long side / short side) bucket edges: square, rectangle, plank, long plank
+ASPECT_EDGES = (1.5, 3.0, 6.0)
+
+# Pattern waste scale per material type: brittle stone breaks on cuts, click
+# floors reuse row offcuts
+_MATERIAL_SCALE = {'tile': 1.0, 'stone': 1.1, 'wood': 1.0, 'laminate': 0.9, 'vinyl': 0.8, 'other': 1.0}
+# Pattern waste scale per aspect bucket: longer pieces leave longer end cuts
+# in row patterns and more angled offcuts in diagonal and motif patterns
+_ASPECT_SCALE = {
+    PatternType.STRAIGHT: (1.0, 1.0, 1.1, 1.2),
+    PatternType.DIAGONAL: (1.0, 1.1, 1.2, 1.3),
+    PatternType.HERRINGBONE: (1.0, 1.0, 1.1, 1.25),
+    PatternType.CHEVRON: (1.0, 1.0, 1.1, 1.25),
+    PatternType.BASKET_WEAVE: (1.0, 1.0, 1.1, 1.2),
+    PatternType.RANDOM: (1.0, 1.0, 1.0, 1.0),
+    PatternType.RUNNING_BOND: (1.0, 1.0, 1.1, 1.2),
+    PatternType.MIXED_SIZES: (1.0, 1.0, 1.0, 1.0),
+}
+
+_PATTERN_INDEX = {pattern_type: i for i, pattern_type in enumerate(PATTERN_TYPES)}
+_MATERIAL_INDEX = {material_type: i for i, material_type in enumerate(MATERIAL_TYPES)}
+
+
+def _coefficient(pattern_type: PatternType, material_type: str, bucket: int) -> float:
+    """One WASTE_TABLE entry; PatternLibrary.pattern and the table both use it"""
+    return (PATTERN_LIBRARY[pattern_type].additional_waste_percentage * _MATERIAL_SCALE[material_type]
+            * _ASPECT_SCALE[pattern_type][bucket])
+
+
+def _aspect_bucket(width_cm: Optional[float], length_cm: Optional[float]) -> int:
+    """Scalar PatternLibrary.aspect_bucket"""
+    short, long = sorted((width_cm or 0.0, length_cm or 0.0))
+    return bisect_right(ASPECT_EDGES, long / short if short > 0 else 1.0)
+
+
+@lru_cache(maxsize=None)
+def _waste_table() -> "np.ndarray":
+    import numpy as np
+
+    table = np.array([
+        [[_coefficient(p, m, bucket) for bucket in range(len(ASPECT_EDGES) + 1)] for m in MATERIAL_TYPES]
+        for p in PATTERN_TYPES
+    ], dtype=np.float64)
+    table.setflags(write=False)
+    return table
+
+
+def __getattr__(name: str):
+    # WASTE_TABLE: additional waste percentage by [pattern, material type, aspect
+    # bucket], built on first use so that single patterns do not load NumPy
+    if name == 'WASTE_TABLE':
+        return _waste_table()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class PatternLibrary:
+    """
+    Default patterns for every PatternType and vectorized waste coefficient lookups
+
+    A pattern's additional waste is the WASTE_TABLE entry of its pattern
+    type, material type and piece aspect bucket, whether it is built one at
+    a time (``pattern``) or as a table (``pattern_table``).
+    """
+
+    @staticmethod
+    def pattern(pattern_type: PatternType, material_type: Optional[str] = None,
+                width_cm: Optional[float] = None, length_cm: Optional[float] = None,
+                **overrides) -> FrozenLayingPattern:
+        """
+        Interned pattern with the library defaults
+
+        Args:
+            pattern_type: Pattern to build
+            material_type: Selects the waste coefficient column; grout is
+                only included for grouted material types
+                (GROUTED_MATERIAL_TYPES). None includes grout and uses the
+                unscaled library waste
+            width_cm, length_cm: Piece size, for the aspect bucket of the
+                waste coefficient (square when unknown)
+            **overrides: LayingPattern fields replacing the defaults; None
+                values are ignored
+        """
+        spec = PATTERN_LIBRARY[pattern_type]
+        grouted = material_type is None or material_type.lower() in GROUTED_MATERIAL_TYPES
+        column = (material_type or 'other').lower()
+        fields = {
+            'pattern_type': pattern_type,
+            'description': spec.description,
+            'additional_waste_percentage': _coefficient(
+                pattern_type, column if column in _MATERIAL_INDEX else 'other', _aspect_bucket(width_cm, length_cm)),
+            'difficulty_level': spec.difficulty_level,
+            'joints_width_mm': spec.joints_width_mm,
+            'grout_consumption_kg_per_m2': spec.grout_consumption_kg_per_m2 if grouted else None,
+        }
+        fields.update((key, value) for key, value in overrides.items() if value is not None)
+        return FrozenLayingPattern(**fields)
+
+    @staticmethod
+    def pattern_index(pattern_types: Sequence[PatternType]) -> "np.ndarray":
+        """Row of each pattern in the coefficient table"""
+        import numpy as np
+
+        return np.fromiter((_PATTERN_INDEX[p] for p in pattern_types), dtype=np.intp, count=len(pattern_types))
+
+    @staticmethod
+    def material_index(material_types: Sequence[str]) -> "np.ndarray":
+        """Column of each material type in the coefficient table ('other' when unknown)"""
+        import numpy as np
+
+        other = _MATERIAL_INDEX['other']
+        return np.fromiter((_MATERIAL_INDEX.get(str(m).lower(), other) for m in material_types),
+                           dtype=np.intp, count=len(material_types))
+
+    @staticmethod
+    def aspect_bucket(width_cm, length_cm) -> "np.ndarray":
+        """Aspect ratio bucket of pieces; pieces without both sizes count as square"""
+        import numpy as np
+
+        width = np.nan_to_num(np.asarray(width_cm, dtype=np.float64))
+        length = np.nan_to_num(np.asarray(length_cm, dtype=np.float64))
+        short, long = np.minimum(width, length), np.maximum(width, length)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            aspect = np.where(short > 0, long / short, 1.0)
+        return np.searchsorted(ASPECT_EDGES, aspect, side='right')
+
+    @staticmethod
+    def additional_waste(pattern_index, material_index, aspect_bucket) -> "np.ndarray":
+        """Additional waste percentage per row, by indexing WASTE_TABLE"""
+        return _waste_table()[pattern_index, material_index, aspect_bucket]
+
+    @staticmethod
+    def pattern_table(pattern_types: Sequence[PatternType], material_types: Sequence[str],
+                      width_cm, length_cm) -> "PatternTable":
+        """
+        PatternTable with one row per (pattern, material) pair, for the batch calculators
+
+        Waste comes from the coefficient table and grout from the library,
+        for grouted materials only; no pattern objects are built.
+        """
+        import numpy as np
+        from .tables import PatternTable
+
+        p = PatternLibrary.pattern_index(pattern_types)
+        m = PatternLibrary.material_index(material_types)
+        grout = np.array([PATTERN_LIBRARY[pattern_type].grout_consumption_kg_per_m2 for pattern_type in PATTERN_TYPES])
+        grouted = np.fromiter((str(t).lower() in GROUTED_MATERIAL_TYPES for t in material_types),
+                              dtype=bool, count=len(material_types))
+        return PatternTable(
+            additional_waste_percentage=PatternLibrary.additional_waste(
+                p, m, PatternLibrary.aspect_bucket(width_cm, length_cm)),
+            grout_kg_per_m2=np.where(grouted, grout[p], 0.0),
+        )
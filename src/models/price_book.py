@@ -0,0 +1,123 @@
+"""Versioned consumable prices and usage rates"""
+
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional, Sequence, Tuple, Union
+import json
+import math
+import os
+
+
+class ConsumableRates(NamedTuple):
+    """
+    Prices and usage rates of consumables
+
+    Fields are scalars, or arrays with one entry per row when rates differ
+    between rows (see PriceBook.rate_table and ``take``).
+    """
+
+    grout_price_per_kg: Any = 2.5
+    adhesive_price_per_kg: Any = 0.8
+    sealer_price_per_liter: Any = 15.0
+    adhesive_kg_per_m2: Any = 1.5  # thin-set
+    sealer_coverage_m2_per_liter: Any = 10.0
+
+    def take(self, index) -> "ConsumableRates":
+        """Rates of the rows at ``index`` (scalar fields are kept as they are)"""
+        return ConsumableRates(*(value[index] if getattr(value, 'ndim', 0) else value for value in self))
+
+
+DEFAULT_RATES = ConsumableRates()
+
+# Key of an entry of the book: (material type, region), None matching any
+RateKey = Tuple[Optional[str], Optional[str]]
+
+
+class PriceBook:
+    """
+    Versioned consumable rates by material type and region
+
+    Entries override some fields of the default rates. Looking up a
+    material type and region merges, from least to most specific, the
+    defaults, the region entry, the material type entry and the entry for
+    both; each combination is resolved once and cached. A book is not
+    changed after it is built: new prices are a new version.
+
+    Args:
+        version: Identifies the prices, e.g. '2025-03'
+        default: Rates where no entry applies
+        entries: (material type, region) -> overridden fields
+    """
+
+    def __init__(self, version: str, default: ConsumableRates = DEFAULT_RATES,
+                 entries: Optional[Dict[RateKey, Dict[str, float]]] = None):
+        self.version = version
+        self.default = default
+        self.entries = {key: _validate(fields) for key, fields in (entries or {}).items()}
+        self._resolved: Dict[RateKey, ConsumableRates] = {}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PriceBook":
+        """
+        Build a book from its JSON form
+
+        ``{"version": "2025-03", "default": {...}, "rates": [{"material_type":
+        "wood", "region": "nordic", "adhesive_kg_per_m2": 1.0}, ...]}``
+        """
+        if not data.get('version'):
+            raise ValueError("price book version is required")
+        default = DEFAULT_RATES._replace(**_validate(data.get('default', {})))
+        entries = {}
+        for entry in data.get('rates', []):
+            entry = dict(entry)
+            key = (entry.pop('material_type', None), entry.pop('region', None))
+            entries[key] = entry
+        return cls(str(data['version']), default, entries)
+
+    @classmethod
+    def load(cls, path: Union[str, "os.PathLike"]) -> "PriceBook":
+        """Read a JSON price book; a file is parsed once until it changes"""
+        path = os.path.realpath(path)
+        return _load(path, os.stat(path).st_mtime_ns)
+
+    def rates(self, material_type: Optional[str] = None, region: Optional[str] = None) -> ConsumableRates:
+        """Rates that apply to a material type in a region"""
+        key = (material_type, region)
+        rates = self._resolved.get(key)
+        if rates is None:
+            fields: Dict[str, float] = {}
+            for entry in dict.fromkeys(((None, None), (None, region), (material_type, None), key)):
+                fields.update(self.entries.get(entry, {}))
+            rates = self._resolved[key] = self.default._replace(**fields)
+        return rates
+
+    def rate_table(self, material_types: Sequence[str], region: Optional[str] = None) -> ConsumableRates:
+        """Rates with one array entry per material type, for the batch calculators"""
+        import numpy as np
+
+        rows = [self.rates(material_type, region) for material_type in material_types]
+        return ConsumableRates(*(np.array(column, dtype=np.float64) for column in zip(*rows))
+                               if rows else (np.zeros(0),) * len(ConsumableRates._fields))
+
+    def __repr__(self) -> str:
+        return f"PriceBook(version={self.version!r}, entries={len(self.entries)})"
+
+
+def _validate(fields: Dict[str, Any]) -> Dict[str, float]:
+    rates = {}
+    for name, value in fields.items():
+        if name not in ConsumableRates._fields:
+            raise ValueError(f"Unknown consumable rate '{name}'")
+        try:
+            rate = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"invalid {name}: {value!r}") from None
+        if not math.isfinite(rate) or rate < 0 or (rate == 0 and name == 'sealer_coverage_m2_per_liter'):
+            raise ValueError(f"invalid {name}: {value!r}")
+        rates[name] = rate
+    return rates
+
+
+@lru_cache(maxsize=16)
+def _load(path: str, mtime_ns: int) -> PriceBook:
+    with open(path, encoding='utf-8') as fh:
+        return PriceBook.from_dict(json.load(fh))
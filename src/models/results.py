@@ -0,0 +1,204 @@
+"""Typed result records returned by the calculators, and their batch container"""
+
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+import math
+
+
+# Columns summed into the project totals (ResultBatch.summarize)
+TOTAL_COLUMNS = ('area_m2', 'total_waste_m2', 'quantity_units', 'material_cost',
+                 'labor_cost', 'consumable_cost', 'additional_costs', 'total_cost')
+
+
+class _Record:
+    """
+    Read-only mapping access for result records
+
+    Records are NamedTuples: fields are read as attributes without hashing,
+    and a record costs one tuple. ``record['field']``, ``get``, ``keys``,
+    ``items`` and ``in`` keep working for code written against the dicts
+    the calculators used to return. Fields that are None (not applicable,
+    such as grout for a pattern without joints) are left out of the keys.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            value = getattr(self, key, None) if key in self._fields else None
+            if value is None:
+                raise KeyError(key)
+            return value
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key) -> bool:
+        if isinstance(key, str):
+            return key in self._fields and getattr(self, key) is not None
+        return tuple.__contains__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> List[str]:
+        return [name for name in self._fields if getattr(self, name) is not None]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(name, getattr(self, name)) for name in self.keys()]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain dictionary of the applicable fields"""
+        return dict(self.items())
+
+
+class _MaterialFields(NamedTuple):
+    area_needed_m2: float
+    quantity_units: float
+    unit_measurement: Optional[str]
+    boxes_needed: int
+    total_waste_factor_percent: float
+
+
+class MaterialResult(_Record, _MaterialFields):
+    """Material quantities (MaterialCalculator.calculate_material_needed)"""
+
+    __slots__ = ()
+
+
+class _WasteFields(NamedTuple):
+    material_waste_m2: float
+    pattern_additional_waste_m2: float
+    total_waste_m2: float
+    waste_percentage: float
+
+
+class WasteResult(_Record, _WasteFields):
+    """Waste breakdown (WasteCalculator.calculate_waste_quantity)"""
+
+    __slots__ = ()
+
+
+class _ConsumablesFields(NamedTuple):
+    grout_kg: Optional[float]
+    adhesive_kg: float
+    sealer_liters: float
+
+
+class ConsumablesResult(_Record, _ConsumablesFields):
+    """Consumables (MaterialCalculator.calculate_consumables); grout_kg is None without grout"""
+
+    __slots__ = ()
+
+
+class _CostFields(NamedTuple):
+    area_m2: float
+    material_cost: float
+    labor_cost: float
+    labor_cost_per_m2: float
+    consumable_cost: float
+    additional_costs: float
+    total_cost: float
+    cost_per_m2: float
+
+
+class CostResult(_Record, _CostFields):
+    """Project cost breakdown (CostCalculator.calculate_total_project_cost)"""
+
+    __slots__ = ()
+
+
+class _EstimateFields(NamedTuple):
+    room_name: str
+    area_m2: float
+    material_name: str
+    quantity_units: float
+    unit_measurement: str
+    waste_percent: float
+    pattern_name: str
+    pattern_description: str
+    material_cost: float
+    labor_cost: float
+    consumable_cost: float
+    total_cost: float
+    cost_per_m2: float
+    boxes_needed: int
+
+
+class EstimateResult(_Record, _EstimateFields):
+    """One room's complete estimate, as shown in the project report"""
+
+    __slots__ = ()
+
+
+class ResultBatch:
+    """
+    Struct-of-arrays container for many results of one record type
+
+    Columns are NumPy arrays keyed by field name. ``batch['field']`` returns
+    a column, ``batch[i]`` rebuilds row ``i`` as a record, and iterating
+    yields records. Columns beyond the record's fields are kept and can be
+    read by name; record fields without a column are None in rows.
+    """
+
+    __slots__ = ('record', 'columns')
+
+    def __init__(self, record: type, columns: Dict[str, Any]):
+        self.record = record
+        self.columns = columns
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.columns[key]
+        if isinstance(key, slice):
+            return ResultBatch(self.record, {name: col[key] for name, col in self.columns.items()})
+        return self.record(*(self._cell(name, key) for name in self.record._fields))
+
+    def _cell(self, name: str, index: int) -> Any:
+        column = self.columns.get(name)
+        if column is None:
+            return None
+        value = column[index]
+        return value.item() if hasattr(value, 'item') else value
+
+    def __setitem__(self, key: str, column) -> None:
+        self.columns[key] = column
+
+    def __delitem__(self, key: str) -> None:
+        del self.columns[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.columns
+
+    def __len__(self) -> int:
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def __iter__(self) -> Iterator:
+        for index in range(len(self)):
+            yield self[index]
+
+    def keys(self):
+        return self.columns.keys()
+
+    def values(self):
+        return self.columns.values()
+
+    def items(self):
+        return self.columns.items()
+
+    @staticmethod
+    def summarize(columns, rooms: int) -> Dict[str, float]:
+        """Project totals of per-room columns, summed exactly with math.fsum"""
+        import numpy as np
+
+        # fsum reads the buffer directly; tolist() would box every value first
+        totals = {key: math.fsum(memoryview(np.ascontiguousarray(columns[key], dtype=np.float64)))
+                  for key in TOTAL_COLUMNS}
+        totals['rooms'] = rooms
+        totals['cost_per_m2'] = totals['total_cost'] / totals['area_m2'] if totals['area_m2'] > 0 else 0
+        return totals
+
+    def __repr__(self) -> str:
+        return f"ResultBatch({self.record.__name__}, rows={len(self)}, columns={list(self.columns)})"
@@ -1,29 +1,82 @@
 """Room and space specifications"""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
+import math
+
+
+Vertex = Tuple[float, float]
 
 
 @dataclass
 class RoomSpecification:
     """Represents room dimensions and specifications"""
-    
+
     length_m: float
     width_m: float
     height_m: Optional[float] = None
     room_name: str = "Room"
     shape: str = "rectangular"  # rectangular, l-shaped, irregular, etc.
     additional_area_m2: float = 0.0  # For irregular shapes or additional areas
-    
+    vertices: Optional[List[Vertex]] = None  # Floor outline in meters, any winding
+
+    @classmethod
+    def from_vertices(cls, vertices: Sequence[Vertex], room_name: str = "Room",
+                      shape: str = "polygon", height_m: Optional[float] = None,
+                      additional_area_m2: float = 0.0) -> "RoomSpecification":
+        """Build a room from its floor outline, using the bounding box as length x width"""
+        points = [(float(x), float(y)) for x, y in vertices]
+        if len(points) < 3:
+            raise ValueError("A room outline needs at least 3 vertices")
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        return cls(
+            length_m=max(xs) - min(xs),
+            width_m=max(ys) - min(ys),
+            height_m=height_m,
+            room_name=room_name,
+            shape=shape,
+            additional_area_m2=additional_area_m2,
+            vertices=points,
+        )
+
+    def get_vertices(self) -> List[Vertex]:
+        """Return the floor outline (the length x width rectangle if none was given)"""
+        if self.vertices:
+            return list(self.vertices)
+        return [(0.0, 0.0), (self.length_m, 0.0),
+                (self.length_m, self.width_m), (0.0, self.width_m)]
+
     def get_total_area(self) -> float:
         """Calculate total floor area"""
-        base_area = self.length_m * self.width_m
+        if self.vertices:
+            base_area = _shoelace_area(self.vertices)
+        else:
+            base_area = self.length_m * self.width_m
         return base_area + self.additional_area_m2
-    
+
     def get_perimeter(self) -> float:
         """Calculate perimeter for linear materials like baseboards"""
+        if self.vertices:
+            points = self.vertices
+            return sum(math.hypot(points[i - 1][0] - x, points[i - 1][1] - y)
+                       for i, (x, y) in enumerate(points))
         return 2 * (self.length_m + self.width_m)
-    
+
+    def freeze(self) -> "FrozenRoomSpecification":
+        """Immutable, interned copy usable as a dict or cache key"""
+        from .frozen import FrozenRoomSpecification
+        return FrozenRoomSpecification.from_model(self)
+
     def __str__(self) -> str:
         area = self.get_total_area()
         return f"{self.room_name}: {self.length_m}m x {self.width_m}m (Area: {area:.2f} m²)"
+
+
+def _shoelace_area(points: Sequence[Vertex]) -> float:
+    """Unsigned polygon area for a single outline"""
+    twice_area = 0.0
+    for i, (x, y) in enumerate(points):
+        px, py = points[i - 1]
+        twice_area += px * y - x * py
+    return abs(twice_area) / 2
@@ -0,0 +1,130 @@
+"""Columnar lookup tables of materials, patterns and rooms for batch calculations"""
+
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Sequence
+
+import numpy as np
+from src.utils.geometry import pack_polygons
+
+from .flooring_material import FlooringMaterial
+from .laying_pattern import LayingPattern
+from .room_specification import RoomSpecification
+
+
+@dataclass
+class MaterialTable:
+    """Material properties as columns, one row per material"""
+
+    unit_cost: np.ndarray
+    waste_factor: np.ndarray
+    area_per_unit: np.ndarray
+    units_per_box: np.ndarray  # 0 where the material is not boxed
+    per_m2: np.ndarray  # True where sold per m2 (quantities are not rounded)
+
+    @classmethod
+    def from_materials(cls, materials: Sequence[FlooringMaterial]) -> "MaterialTable":
+        """Build the table from material instances"""
+        return cls(
+            unit_cost=np.array([m.unit_cost for m in materials], dtype=np.float64),
+            waste_factor=np.array([m.waste_factor for m in materials], dtype=np.float64),
+            area_per_unit=np.array([m.get_area_per_unit() for m in materials], dtype=np.float64),
+            units_per_box=np.array([m.units_per_box or 0 for m in materials], dtype=np.float64),
+            per_m2=np.array([m.unit_measurement == 'm2' for m in materials], dtype=bool),
+        )
+
+    def set_row(self, index: int, material: FlooringMaterial) -> None:
+        """Overwrite one row in place after the material changed"""
+        self.unit_cost[index] = material.unit_cost
+        self.waste_factor[index] = material.waste_factor
+        self.area_per_unit[index] = material.get_area_per_unit()
+        self.units_per_box[index] = material.units_per_box or 0
+        self.per_m2[index] = material.unit_measurement == 'm2'
+
+    def __len__(self) -> int:
+        return self.unit_cost.shape[0]
+
+
+@dataclass
+class PatternTable:
+    """Pattern properties as columns, one row per pattern"""
+
+    additional_waste_percentage: np.ndarray
+    grout_kg_per_m2: np.ndarray  # 0 where the pattern uses no grout
+
+    @classmethod
+    def from_patterns(cls, patterns: Sequence[LayingPattern]) -> "PatternTable":
+        """Build the table from pattern instances"""
+        return cls(
+            additional_waste_percentage=np.array(
+                [p.additional_waste_percentage for p in patterns], dtype=np.float64
+            ),
+            grout_kg_per_m2=np.array(
+                [p.grout_consumption_kg_per_m2 or 0 for p in patterns], dtype=np.float64
+            ),
+        )
+
+    def set_row(self, index: int, pattern: LayingPattern) -> None:
+        """Overwrite one row in place after the pattern changed"""
+        self.additional_waste_percentage[index] = pattern.additional_waste_percentage
+        self.grout_kg_per_m2[index] = pattern.grout_consumption_kg_per_m2 or 0
+
+    def __len__(self) -> int:
+        return self.additional_waste_percentage.shape[0]
+
+
+@dataclass
+class RoomTable:
+    """
+    Room geometry as columns, one row per room
+
+    Rectangular rooms are fully described by length x width; only rooms
+    with an explicit outline have their vertices packed (see
+    src.utils.geometry), so a schedule of rectangles never builds per-room
+    vertex lists.
+    """
+
+    length_m: np.ndarray
+    width_m: np.ndarray
+    additional_area_m2: np.ndarray
+    outline_rows: np.ndarray  # sorted rows whose floor is given by vertices
+    coords: np.ndarray  # packed vertices of the outline rows
+    offsets: np.ndarray
+
+    @classmethod
+    def from_rooms(cls, rooms: Sequence[RoomSpecification]) -> "RoomTable":
+        """Build the table from room instances"""
+        n = len(rooms)
+
+        def column(name: str) -> np.ndarray:
+            return np.fromiter(map(attrgetter(name), rooms), dtype=np.float64, count=n)
+
+        vertices = list(map(attrgetter('vertices'), rooms))
+        if any(vertices):
+            outline_rows = np.flatnonzero(np.fromiter(map(bool, vertices), dtype=bool, count=n))
+            coords, offsets = pack_polygons([vertices[i] for i in outline_rows.tolist()])
+        else:
+            outline_rows = np.zeros(0, dtype=np.intp)
+            coords, offsets = np.zeros((0, 2)), np.zeros(1, dtype=np.int64)
+        return cls(column('length_m'), column('width_m'), column('additional_area_m2'),
+                   outline_rows, coords, offsets)
+
+    @classmethod
+    def from_rectangles(cls, length_m, width_m, additional_area_m2=0.0) -> "RoomTable":
+        """Build the table from columns of rectangle sides in metres"""
+        length_m = np.asarray(length_m, dtype=np.float64)
+        n = length_m.shape[0]
+        return cls(length_m, np.broadcast_to(np.asarray(width_m, dtype=np.float64), (n,)).copy(),
+                   np.broadcast_to(np.asarray(additional_area_m2, dtype=np.float64), (n,)).copy(),
+                   np.zeros(0, dtype=np.intp), np.zeros((0, 2)), np.zeros(1, dtype=np.int64))
+
+    def slice(self, start: int, stop: int) -> "RoomTable":
+        """Rows ``start:stop`` as a table of their own (outline arrays are views)"""
+        lo, hi = np.searchsorted(self.outline_rows, (start, stop))
+        first, last = self.offsets[lo], self.offsets[hi]
+        return RoomTable(self.length_m[start:stop], self.width_m[start:stop],
+                         self.additional_area_m2[start:stop], self.outline_rows[lo:hi] - start,
+                         self.coords[first:last], self.offsets[lo:hi + 1] - first)
+
+    def __len__(self) -> int:
+        return self.length_m.shape[0]
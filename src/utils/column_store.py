@@ -0,0 +1,219 @@
+"""Columnar binary export: one memory-mappable .npy file per estimate field"""
+
+from src.models import (ConsumablesResult, CostResult, EstimateResult, MaterialResult, ResultBatch,
+                        WasteResult)
+from typing import Any, Dict, Iterable, List, Optional, Union, get_type_hints
+import itertools
+import json
+import os
+import struct
+import numpy as np
+
+
+SCHEMA_FILE = 'schema.json'
+FORMAT_VERSION = 1
+
+# Records streamed per append by ColumnStore.write
+COLUMN_CHUNK_ROWS = 65536
+
+# Fixed .npy header size, so the row count can be written in place on close
+_HEADER_SIZE = 128
+
+_RECORDS = {record.__name__: record for record in (
+    MaterialResult, WasteResult, ConsumablesResult, CostResult, EstimateResult)}
+
+# Storage dtype per record field annotation; strings are dictionary-encoded
+_FIELD_DTYPES = {float: np.dtype('<f8'), Optional[float]: np.dtype('<f8'),
+                 int: np.dtype('<i8'), str: None, Optional[str]: None}
+_CODE_DTYPE = np.dtype('<i4')
+
+
+def _npy_header(dtype: np.dtype, rows: int) -> bytes:
+    """NPY 1.0 header padded to _HEADER_SIZE bytes"""
+    header = "{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" % (
+        np.lib.format.dtype_to_descr(dtype), rows)
+    header = header.ljust(_HEADER_SIZE - 11) + '\n'
+    return b'\x93NUMPY\x01\x00' + struct.pack('<H', len(header)) + header.encode('latin1')
+
+
+class ColumnWriter:
+    """
+    Appends chunks of rows to a column directory
+
+    Every field goes to its own ``<name>.npy`` file, appended in place;
+    text fields are stored as int32 codes into ``<name>.categories.npy``.
+    The files get their row count, and the directory its schema.json, on
+    ``close``, so a store without a schema is an unfinished export.
+
+    Args:
+        directory: Output directory (created if missing)
+        record: Result record type of the rows; None for plain columns
+    """
+
+    def __init__(self, directory: Union[str, "os.PathLike"], record: Optional[type] = EstimateResult):
+        self.directory = os.fspath(directory)
+        self.record = record
+        self.rows = 0
+        self._files: Dict[str, Any] = {}
+        self._dtypes: Dict[str, np.dtype] = {}
+        self._categories: Dict[str, Dict[str, int]] = {}
+        os.makedirs(self.directory, exist_ok=True)
+        schema = os.path.join(self.directory, SCHEMA_FILE)
+        if os.path.exists(schema):
+            os.remove(schema)
+
+    def append(self, records: List) -> None:
+        """Append a list of records"""
+        if not records:
+            return
+        hints = get_type_hints(self.record)
+        columns = {}
+        for name, values in zip(self.record._fields, zip(*records)):
+            dtype = _FIELD_DTYPES.get(hints.get(name), np.dtype('<f8'))
+            columns[name] = values if dtype is None else np.array(values, dtype=dtype)
+        self.append_columns(columns)
+
+    def append_columns(self, columns: Dict[str, Any]) -> None:
+        """Append equal-length columns (NumPy arrays, or sequences of strings)"""
+        rows = None
+        for name, values in columns.items():
+            if isinstance(values, np.ndarray) and values.dtype.kind not in 'OSU':
+                data = values
+            else:
+                index = self._categories.setdefault(name, {})
+                data = np.fromiter((index.setdefault('' if v is None else str(v), len(index)) for v in values),
+                                   dtype=_CODE_DTYPE)
+            if rows is None:
+                rows = len(data)
+            elif len(data) != rows:
+                raise ValueError(f"Column '{name}' has {len(data)} rows, expected {rows}")
+
+            fh = self._files.get(name)
+            if fh is None:
+                if self.rows:
+                    raise ValueError(f"Column '{name}' is not in the earlier chunks")
+                self._dtypes[name] = data.dtype.newbyteorder('<')
+                fh = self._files[name] = open(os.path.join(self.directory, name + '.npy'), 'wb')
+                fh.write(_npy_header(self._dtypes[name], 0))
+            np.ascontiguousarray(data, dtype=self._dtypes[name]).tofile(fh)
+
+        missing = set(self._files).difference(columns)
+        if missing:
+            raise ValueError(f"Columns missing from chunk: {sorted(missing)}")
+        self.rows += rows or 0
+
+    def close(self) -> Dict:
+        """Write the row counts, the category files and the schema; returns the schema"""
+        entries = []
+        for name, fh in self._files.items():
+            fh.seek(0)
+            fh.write(_npy_header(self._dtypes[name], self.rows))
+            fh.close()
+            entry = {'name': name, 'dtype': np.lib.format.dtype_to_descr(self._dtypes[name]),
+                     'file': name + '.npy'}
+            if name in self._categories:
+                entry['categories'] = name + '.categories.npy'
+                np.save(os.path.join(self.directory, entry['categories']),
+                        np.array(list(self._categories[name]) or [''], dtype=str))
+            entries.append(entry)
+        self._files = {}
+
+        schema = {'version': FORMAT_VERSION, 'record': self.record.__name__ if self.record else None,
+                  'rows': self.rows, 'columns': entries}
+        path = os.path.join(self.directory, SCHEMA_FILE)
+        with open(path + '.tmp', 'w', encoding='utf-8') as fh:
+            json.dump(schema, fh, indent=2)
+        os.replace(path + '.tmp', path)
+        return schema
+
+    def __enter__(self) -> "ColumnWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if exc[0] is None:
+            self.close()
+        else:
+            for fh in self._files.values():
+                fh.close()
+
+
+class ColumnStore:
+    """Typed columnar export of estimates, loaded with memory mapping instead of parsing"""
+
+    @staticmethod
+    def write(results: Union[ResultBatch, Iterable], directory: Union[str, "os.PathLike"],
+              chunk_rows: int = COLUMN_CHUNK_ROWS) -> int:
+        """
+        Export results as a directory of .npy columns plus schema.json
+
+        Args:
+            results: ResultBatch, or an iterable of result records of one
+                type (streamed ``chunk_rows`` at a time)
+            directory: Output directory
+            chunk_rows: Records converted per append
+
+        Returns:
+            Number of rows written
+        """
+        if isinstance(results, ResultBatch):
+            with ColumnWriter(directory, results.record) as writer:
+                writer.append_columns(results.columns)
+            return writer.rows
+
+        iterator = iter(results)
+        chunk = list(itertools.islice(iterator, chunk_rows))
+        with ColumnWriter(directory, type(chunk[0]) if chunk else EstimateResult) as writer:
+            while chunk:
+                writer.append(chunk)
+                chunk = list(itertools.islice(iterator, chunk_rows))
+        return writer.rows
+
+    @staticmethod
+    def schema(directory: Union[str, "os.PathLike"]) -> Dict:
+        """Schema of a finished export; raises FileNotFoundError for an unfinished one"""
+        with open(os.path.join(os.fspath(directory), SCHEMA_FILE), encoding='utf-8') as fh:
+            schema = json.load(fh)
+        if schema.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported column store version {schema.get('version')!r}")
+        return schema
+
+    @staticmethod
+    def read(directory: Union[str, "os.PathLike"], mmap: bool = True,
+             decode: bool = True) -> ResultBatch:
+        """
+        Load an export as a ResultBatch
+
+        Args:
+            directory: Export directory
+            mmap: Map numeric columns read-only instead of reading them
+            decode: Turn text columns back into strings; with False they
+                stay int32 codes (see ``categories``)
+        """
+        schema = ColumnStore.schema(directory)
+        columns = ColumnStore.read_columns(directory, mmap, decode)
+        return ResultBatch(_RECORDS.get(schema['record'], EstimateResult), columns)
+
+    @staticmethod
+    def read_columns(directory: Union[str, "os.PathLike"], mmap: bool = True,
+                     decode: bool = True) -> Dict[str, np.ndarray]:
+        """Load every column of an export by name (see ``read``)"""
+        directory = os.fspath(directory)
+        schema = ColumnStore.schema(directory)
+        columns = {}
+        for entry in schema['columns']:
+            column = np.load(os.path.join(directory, entry['file']), mmap_mode='r' if mmap else None)
+            if len(column) != schema['rows']:
+                raise ValueError(f"Column '{entry['name']}' has {len(column)} rows, expected {schema['rows']}")
+            if decode and 'categories' in entry:
+                column = np.load(os.path.join(directory, entry['categories']))[column]
+            columns[entry['name']] = column
+        return columns
+
+    @staticmethod
+    def categories(directory: Union[str, "os.PathLike"], name: str) -> np.ndarray:
+        """Strings of a text column, indexed by its codes"""
+        directory = os.fspath(directory)
+        for entry in ColumnStore.schema(directory)['columns']:
+            if entry['name'] == name and 'categories' in entry:
+                return np.load(os.path.join(directory, entry['categories']))
+        raise KeyError(name)
@@ -0,0 +1,136 @@
+"""Long-running estimate session answering JSON requests over stdin or a UNIX socket"""
+
+from src.calculators import EstimatePipeline
+from src.models import PriceBook
+from src.utils.report_generator import ReportGenerator
+from src.utils.room_schedule import RoomSchedule
+from typing import Any, Dict, Optional, TextIO, Union
+import json
+import os
+import socketserver
+import stat
+
+
+# Request keys that are not schedule columns
+ID_KEY = 'id'
+SKU_KEY = 'sku'
+REPORT_KEY = 'report'
+COMMAND_KEY = 'command'
+
+
+class EstimateSession:
+    """
+    One warm process answering estimate requests
+
+    A request is one JSON object per line, with the columns of a room
+    schedule (see room_schedule.FIELDS) plus optional ``id`` (echoed back),
+    ``sku`` (material from the catalog) and ``report`` (include the text
+    report). The answer is one JSON line with the EstimateResult fields, or
+    ``error``. ``{"command": "ping"}`` answers ``{"ok": true}``.
+
+    The catalog and price book are loaded once, and materials, patterns and
+    consumable rates are cached across requests, so an estimate costs the
+    pipeline evaluation and the JSON encoding only.
+
+    Args:
+        defaults: Values for columns a request leaves out (the CLI options)
+        catalog: Optional MaterialCatalog for ``sku`` requests
+        price_book: Optional PriceBook for consumable rates
+        region: Price book region
+    """
+
+    def __init__(self, defaults: Optional[Dict[str, Any]] = None, catalog=None,
+                 price_book: Optional[PriceBook] = None, region: Optional[str] = None):
+        self.defaults = dict(defaults or {})
+        self.catalog = catalog
+        self.price_book = price_book
+        self.region = region
+        self.requests = 0
+
+    def estimate(self, request: Dict[str, Any]):
+        """
+        Evaluated Estimate for one request
+
+        Raises:
+            ValueError: If the request is invalid or its SKU is unknown
+        """
+        material = None
+        sku = request.get(SKU_KEY)
+        if sku is not None:
+            if self.catalog is None:
+                raise ValueError("sku needs a catalog")
+            row = self.catalog.find(str(sku))
+            if row is None:
+                raise ValueError(f"unknown sku: {sku!r}")
+            material = self.catalog.material(row)
+            # The pattern defaults depend on the catalog material's type and piece size
+            request = dict(request, material_type=material.material_type, width_cm=material.width_cm,
+                           length_cm=material.length_cm, size_unit='cm')
+
+        row = RoomSchedule.parse_row(self.requests, request, self.defaults)
+        if material is not None:
+            row = row._replace(material=material)
+        rates = None
+        if self.price_book is not None:
+            rates = self.price_book.rates(row.material.material_type, self.region)
+        return EstimatePipeline.run(row.room, row.material, row.pattern, row.labor_cost_per_m2,
+                                    row.additional_costs, rates=rates)
+
+    def handle(self, line: Union[str, bytes]) -> str:
+        """Answer one request line with one JSON line (never raises for bad input)"""
+        self.requests += 1
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request is not a JSON object")
+            request_id = request.get(ID_KEY)
+            command = request.get(COMMAND_KEY)
+            if command is not None:
+                if command != 'ping':
+                    raise ValueError(f"unknown command: {command!r}")
+                answer: Dict[str, Any] = {'ok': True}
+            else:
+                estimate = self.estimate(request)
+                answer = estimate.report_data()._asdict()
+                if request.get(REPORT_KEY):
+                    answer[REPORT_KEY] = ReportGenerator.generate_estimate_report(estimate)
+            if request_id is not None:
+                answer = dict({ID_KEY: request_id}, **answer)
+            # Overflowing inputs give infinite or NaN results, which JSON has no numbers for
+            return json.dumps(answer, allow_nan=False) + '\n'
+        except (TypeError, ValueError, ArithmeticError) as exc:
+            answer = {'error': str(exc)}
+        if request_id is not None:
+            answer = dict({ID_KEY: request_id}, **answer)
+        return json.dumps(answer) + '\n'
+
+    def serve(self, stdin: TextIO, stdout: TextIO) -> int:
+        """Answer request lines until end of input, flushing every answer; returns the count"""
+        count = 0
+        for line in stdin:
+            if line.strip():
+                stdout.write(self.handle(line))
+                stdout.flush()
+                count += 1
+        return count
+
+    def server(self, path: str) -> "socketserver.BaseServer":
+        """
+        Threaded server on a UNIX socket at ``path``; each connection sends
+        request lines and reads the answers (call ``serve_forever``)
+        """
+        session = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for line in self.rfile:
+                    if line.strip():
+                        self.wfile.write(session.handle(line).encode('utf-8'))
+
+        # A socket left behind by a previous session is replaced; any other file is an error
+        if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+            os.remove(path)
+        server = socketserver.ThreadingUnixStreamServer(path, Handler)
+        server.daemon_threads = True
+        return server
@@ -0,0 +1,271 @@
+"""Stage timers and call counters around the calculator entry points"""
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+import functools
+import inspect
+import threading
+import time
+
+
+# Stage -> entry points, as 'module:Owner.attribute' (or 'module:function').
+# A module function is instrumented in the module that calls it.
+ENTRY_POINTS: Dict[str, Tuple[str, ...]] = {
+    'load': (
+        'src.catalog.material_catalog:MaterialCatalog.load',
+        'src.catalog.material_catalog:MaterialCatalog.open',
+        'src.models.price_book:PriceBook.load',
+    ),
+    'parse': (
+        'src.utils.room_schedule:RoomSchedule.read',
+        'src.utils.room_schedule:RoomSchedule.parse_row',
+    ),
+    'geometry': (
+        'src.models.tables:RoomTable.from_rooms',
+        'src.calculators.area_calculator:AreaCalculator.calculate_room_area',
+        'src.calculators.area_calculator:AreaCalculator.calculate_room_area_batch',
+        'src.calculators.area_calculator:AreaCalculator.calculate_perimeter',
+        'src.calculators.area_calculator:AreaCalculator.calculate_perimeter_batch',
+        'src.calculators.parallel_estimator:ParallelEstimator.pack_chunks',
+        'src.calculators.layout_calculator:LayoutCalculator.simulate_layout',
+        'src.calculators.motif_calculator:MotifCalculator.count_pieces',
+    ),
+    'waste': (
+        'src.calculators.waste_calculator:WasteCalculator.calculate_waste_quantity',
+        'src.calculators.waste_calculator:WasteCalculator.calculate_waste_quantity_batch',
+        'src.calculators.waste_calculator:WasteCalculator.calculate_waste_from_layout',
+    ),
+    'material': (
+        'src.calculators.material_calculator:MaterialCalculator.calculate_material_needed',
+        'src.calculators.material_calculator:MaterialCalculator.calculate_material_needed_batch',
+        'src.calculators.material_calculator:MaterialCalculator.calculate_consumables',
+        'src.calculators.material_calculator:MaterialCalculator.calculate_consumables_batch',
+    ),
+    'cost': (
+        'src.calculators.cost_calculator:CostCalculator.calculate_material_cost',
+        'src.calculators.cost_calculator:CostCalculator.calculate_consumable_cost',
+        'src.calculators.cost_calculator:CostCalculator.combine_costs',
+        'src.calculators.cost_calculator:CostCalculator.calculate_total_project_cost',
+        'src.calculators.cost_calculator:CostCalculator.calculate_portfolio_cost',
+        'src.calculators.cost_calculator:CostCalculator.calculate_consumable_cost_batch',
+        'src.calculators.cost_calculator:CostCalculator.combine_costs_batch',
+        'src.calculators.cost_calculator:CostCalculator.reprice_batch',
+    ),
+    'estimate': (
+        'src.calculators.estimate_pipeline:EstimatePipeline.run',
+        'src.calculators.parallel_estimator:ParallelEstimator.estimate_rooms',
+        'src.calculators.parallel_estimator:ParallelEstimator.estimate_stream',
+        'src.models.results:ResultBatch.summarize',
+    ),
+    'report': (
+        'src.utils.report_generator:ReportGenerator.generate_project_report',
+        'src.utils.report_generator:ReportGenerator.generate_estimate_report',
+        'src.utils.report_generator:ReportGenerator.render_reports',
+        'src.utils.report_generator:ReportGenerator.write_csv',
+        'src.utils.report_generator:ReportGenerator.write_reports',
+        'src.utils.column_store:ColumnStore.write',
+    ),
+}
+
+
+class StageTiming(NamedTuple):
+    """Calls and time of one entry point; self time excludes nested entry points"""
+    stage: str
+    name: str
+    calls: int
+    total_seconds: float
+    self_seconds: float
+
+
+class Profiler:
+    """
+    Times every entry point of ENTRY_POINTS while installed
+
+    Installing replaces the entry points with timing wrappers and
+    uninstalling puts the originals back, so nothing is measured (or
+    slowed down) outside a ``with Profiler()`` block. Each call adds to
+    the call count, total time and self time of its entry point; self
+    time leaves out the entry points it calls, so the self times of all
+    stages add up to the instrumented share of the wall time. Generators
+    (RoomSchedule.read, estimate_stream) are timed while they run, not
+    while their consumer holds them.
+
+    Work done in ParallelEstimator worker processes is not seen.
+
+    Args:
+        cprofile: Also run cProfile over the block (see ``dump_stats``)
+    """
+
+    _active: Optional["Profiler"] = None
+
+    def __init__(self, cprofile: bool = False):
+        self._stats: Dict[Tuple[str, str], List[float]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._patched: List[Tuple[Any, str, Any]] = []
+        self._cprofile = None
+        if cprofile:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+        self.wall_seconds = 0.0
+        self._started: Optional[float] = None
+
+    def __enter__(self) -> "Profiler":
+        self.install()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.uninstall()
+
+    def install(self) -> None:
+        """
+        Wrap the entry points and start the clock
+
+        Raises:
+            RuntimeError: If a profiler is already installed
+        """
+        if Profiler._active is not None:
+            raise RuntimeError("a Profiler is already installed")
+        Profiler._active = self
+        self._started = time.perf_counter()
+        try:
+            for stage, targets in ENTRY_POINTS.items():
+                for target in targets:
+                    owner, attribute, name = _resolve(target)
+                    raw = vars(owner)[attribute]
+                    self._patched.append((owner, attribute, raw))
+                    setattr(owner, attribute, self._wrap_raw(raw, (stage, name)))
+        except BaseException:
+            self.uninstall()
+            raise
+        self._started = time.perf_counter()
+        if self._cprofile is not None:
+            self._cprofile.enable()
+
+    def uninstall(self) -> None:
+        """Stop the clock and put the original entry points back"""
+        if Profiler._active is not self:
+            return
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        self.wall_seconds += time.perf_counter() - self._started
+        for owner, attribute, raw in reversed(self._patched):
+            setattr(owner, attribute, raw)
+        self._patched.clear()
+        Profiler._active = None
+
+    def _wrap_raw(self, raw: Any, key: Tuple[str, str]) -> Any:
+        if isinstance(raw, (staticmethod, classmethod)):
+            return type(raw)(self._wrap(raw.__func__, key))
+        return self._wrap(raw, key)
+
+    def _stack(self) -> List[float]:
+        """Time spent in nested entry points, one slot per open call of this thread"""
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def _record(self, key: Tuple[str, str], calls: int, elapsed: float, nested: float) -> None:
+        stack = self._stack()
+        if stack:
+            stack[-1] += elapsed
+        with self._lock:
+            entry = self._stats.get(key)
+            if entry is None:
+                entry = self._stats[key] = [0, 0.0, 0.0]
+            entry[0] += calls
+            entry[1] += elapsed
+            entry[2] += elapsed - nested
+
+    def _wrap(self, func: Callable, key: Tuple[str, str]) -> Callable:
+        clock = time.perf_counter
+
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def generator(*args, **kwargs):
+                iterator = func(*args, **kwargs)
+                calls = 1
+                while True:
+                    stack = self._stack()
+                    stack.append(0.0)
+                    start = clock()
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        self._record(key, calls, clock() - start, stack.pop())
+                        return
+                    except BaseException:
+                        self._record(key, calls, clock() - start, stack.pop())
+                        raise
+                    self._record(key, calls, clock() - start, stack.pop())
+                    calls = 0
+                    yield item
+            return generator
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stack = self._stack()
+            stack.append(0.0)
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._record(key, 1, clock() - start, stack.pop())
+        return wrapper
+
+    def timings(self) -> List[StageTiming]:
+        """Entry points that were called, in ENTRY_POINTS order"""
+        with self._lock:
+            stats = dict(self._stats)
+        order = {key: i for i, key in enumerate(
+            (stage, target.partition(':')[2]) for stage, targets in ENTRY_POINTS.items() for target in targets)}
+        return [StageTiming(stage, name, int(calls), total, own)
+                for (stage, name), (calls, total, own) in sorted(stats.items(), key=lambda item: order[item[0]])]
+
+    def stages(self) -> Dict[str, float]:
+        """Self time per stage, in ENTRY_POINTS order"""
+        totals = dict.fromkeys(ENTRY_POINTS, 0.0)
+        for timing in self.timings():
+            totals[timing.stage] += timing.self_seconds
+        return {stage: seconds for stage, seconds in totals.items() if seconds}
+
+    def report(self) -> str:
+        """Summary table of the entry points and stages, for stderr"""
+        wall = self.wall_seconds or sum(self.stages().values()) or 1.0
+        lines = [f"{'Stage':<10} {'Entry point':<52} {'Calls':>9} {'Total ms':>10} {'Self ms':>10} "
+                 f"{'Self %':>7} {'µs/call':>9}"]
+        for t in self.timings():
+            lines.append(f"{t.stage:<10} {t.name:<52} {t.calls:>9,d} {t.total_seconds * 1e3:>10.2f} "
+                         f"{t.self_seconds * 1e3:>10.2f} {t.self_seconds / wall:>7.1%} "
+                         f"{t.total_seconds / max(t.calls, 1) * 1e6:>9.1f}")
+        lines.append('')
+        stages = self.stages()
+        for stage, seconds in stages.items():
+            lines.append(f"{stage:<10} {seconds * 1e3:>10.2f} ms {seconds / wall:>7.1%}")
+        other = max(wall - sum(stages.values()), 0.0)
+        lines.append(f"{'other':<10} {other * 1e3:>10.2f} ms {other / wall:>7.1%}")
+        lines.append(f"{'wall':<10} {wall * 1e3:>10.2f} ms")
+        return '\n'.join(lines)
+
+    def dump_stats(self, path: str) -> None:
+        """
+        Write the cProfile statistics for ``python -m pstats``
+
+        Raises:
+            RuntimeError: If the profiler was created without cprofile
+        """
+        if self._cprofile is None:
+            raise RuntimeError("Profiler was created without cprofile=True")
+        self._cprofile.dump_stats(path)
+
+
+def _resolve(target: str) -> Tuple[Any, str, str]:
+    """(owner object, attribute, display name) of an ENTRY_POINTS target"""
+    module_name, _, name = target.partition(':')
+    owner = import_module(module_name)
+    *path, attribute = name.split('.')
+    for part in path:
+        owner = getattr(owner, part)
+    return owner, attribute, name
@@ -1,16 +1,32 @@
 """Generate reports for flooring projects"""
 
-from typing import Dict, Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
 from datetime import datetime
+import csv
+import io
+import itertools
+import os
+import re
+import string
+from operator import attrgetter, itemgetter
 
 
-class ReportGenerator:
-    """Generate comprehensive project reports"""
-    
-    @staticmethod
-    def generate_project_report(room_name: str, calculations: Dict[str, Any]) -> str:
-        """Generate a formatted project report"""
-        report = f"""
+# Columns of export_to_csv: (header, result key, format spec, default)
+CSV_COLUMNS = (
+    ('Room', 'room_name', '', 'N/A'),
+    ('Area_m2', 'area_m2', '.2f', 0),
+    ('Material', 'material_name', '', 'N/A'),
+    ('Quantity', 'quantity_units', '.2f', 0),
+    ('Waste%', 'waste_percent', '.1f', 0),
+    ('Total_Cost', 'total_cost', '.2f', 0),
+    ('Cost_per_m2', 'cost_per_m2', '.2f', 0),
+)
+
+# Rows formatted per write by write_csv
+CSV_CHUNK_ROWS = 4096
+
+# Project report layout: result keys, plus the time the reports were generated
+REPORT_TEMPLATE = """
 ╔════════════════════════════════════════════════════════════════╗
 ║               FLOORING PROJECT REPORT                          ║
 ╚════════════════════════════════════════════════════════════════╝
@@ -18,43 +34,283 @@ class ReportGenerator:
 PROJECT DETAILS
 ───────────────────────────────────────────────────────────────
 Room: {room_name}
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Generated: {generated}
 
 ROOM SPECIFICATIONS
 ───────────────────────────────────────────────────────────────
-Area: {calculations.get('area_m2', 0):.2f} m²
+Area: {area_m2:.2f} m²
 
 MATERIAL INFORMATION
 ───────────────────────────────────────────────────────────────
-Material: {calculations.get('material_name', 'N/A')}
-Quantity Needed: {calculations.get('quantity_units', 0):.2f} {calculations.get('unit_measurement', 'units')}
-Waste Factor: {calculations.get('waste_percent', 0):.1f}%
+Material: {material_name}
+Quantity Needed: {quantity_units:.2f} {unit_measurement}
+Waste Factor: {waste_percent:.1f}%
 
 LAYING PATTERN
 ───────────────────────────────────────────────────────────────
-Pattern: {calculations.get('pattern_name', 'N/A')}
-Description: {calculations.get('pattern_description', 'N/A')}
+Pattern: {pattern_name}
+Description: {pattern_description}
 
 COST BREAKDOWN
 ───────────────────────────────────────────────────────────────
-Material Cost: €{calculations.get('material_cost', 0):.2f}
-Labor Cost: €{calculations.get('labor_cost', 0):.2f}
-Consumables Cost: €{calculations.get('consumable_cost', 0):.2f}
+Material Cost: €{material_cost:.2f}
+Labor Cost: €{labor_cost:.2f}
+Consumables Cost: €{consumable_cost:.2f}
 ───────────────────────────────────────────────────────────────
-TOTAL PROJECT COST: €{calculations.get('total_cost', 0):.2f}
-Cost per m²: €{calculations.get('cost_per_m2', 0):.2f}
+TOTAL PROJECT COST: €{total_cost:.2f}
+Cost per m²: €{cost_per_m2:.2f}
 
 ════════════════════════════════════════════════════════════════
 """
-        return report
+REPORT_DEFAULTS = {
+    'room_name': 'N/A', 'area_m2': 0, 'material_name': 'N/A', 'quantity_units': 0,
+    'unit_measurement': 'units', 'waste_percent': 0, 'pattern_name': 'N/A',
+    'pattern_description': 'N/A', 'material_cost': 0, 'labor_cost': 0,
+    'consumable_cost': 0, 'total_cost': 0, 'cost_per_m2': 0,
+}
+REPORT_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Reports rendered and written per task by write_reports
+REPORT_CHUNK_ROWS = 256
+REPORT_WORKERS = 8
+
+# Reports repeat most of their text, so the fastest deflate level compresses them well
+REPORT_ZIP_LEVEL = 1
+
+
+class ReportTemplate:
+    """
+    Report layout compiled once for rendering many results
+    
+    Named fields are rewritten to positions at construction, so a report
+    is one ``str.format`` call on values fetched with a C-level getter.
+    ``{generated}`` is the only field passed per call.
+    
+    Args:
+        template: str.format layout with result keys as field names
+        defaults: Values for keys a result leaves out or sets to None
+    """
+    
+    def __init__(self, template: str = REPORT_TEMPLATE, defaults: Dict[str, Any] = REPORT_DEFAULTS):
+        parts: List[str] = []
+        keys: List[str] = []
+        for literal, key, spec, conversion in string.Formatter().parse(template):
+            parts.append(literal.replace('{', '{{').replace('}', '}}'))
+            if key is None:
+                continue
+            if key != 'generated':
+                parts.append('{%d' % len(keys))
+                keys.append(key)
+            else:
+                parts.append('{generated')
+            parts.append(('!' + conversion if conversion else '') + (':' + spec if spec else '') + '}')
+        self.keys = tuple(keys)
+        self.defaults = tuple(defaults.get(key) for key in keys)
+        self._format = ''.join(parts).format
+        self._getters: Dict[type, Any] = {}
+    
+    def render(self, calc: Any, generated: str) -> str:
+        """Report for one result record or dictionary"""
+        getter = self._getters.get(type(calc))
+        if getter is None:
+            getter = self._getters[type(calc)] = _row_getter(type(calc), self.keys)
+        try:
+            values = getter(calc)
+        except (AttributeError, KeyError):
+            values = None
+        if values is None or None in values:
+            values = [default if value is None else value
+                      for value, default in zip(_lookup(calc, self.keys), self.defaults)]
+        return self._format(*values, generated=generated)
+
+
+_PROJECT_REPORT = ReportTemplate()
+_UNSAFE_FILENAME = re.compile(r'[^A-Za-z0-9._-]+')
+
+
+class ReportGenerator:
+    """Generate comprehensive project reports"""
+    
+    @staticmethod
+    def generate_project_report(room_name: str, calculations: Dict[str, Any]) -> str:
+        """Generate a formatted project report"""
+        values = dict(calculations.items())
+        values['room_name'] = room_name
+        return _PROJECT_REPORT.render(values, datetime.now().strftime(REPORT_TIME_FORMAT))
+    
+    @staticmethod
+    def generate_estimate_report(estimate) -> str:
+        """Generate the project report for an evaluated Estimate"""
+        return ReportGenerator.generate_project_report(estimate.room.room_name, estimate.report_data())
+    
+    @staticmethod
+    def write_csv(results: Iterable[Any], dest: Union[str, "os.PathLike", TextIO],
+                  columns: Sequence[Tuple[str, str, str, Any]] = CSV_COLUMNS,
+                  chunk_rows: int = CSV_CHUNK_ROWS) -> int:
+        """
+        Stream results to CSV without holding the export in memory
+        
+        Rows are formatted ``chunk_rows`` at a time into one buffer that is
+        written out and reused, so memory stays at one chunk however many
+        results the iterator yields. Each row is formatted by one
+        precompiled template; rows with a missing value, or a name that
+        needs quoting, go through the csv module instead.
+        
+        Args:
+            results: Iterable of result records or dictionaries
+            dest: Path, or a file-like object opened in text mode
+            columns: (header, key, format spec, default) per column
+            chunk_rows: Rows per write
+        
+        Returns:
+            Number of rows written
+        """
+        if isinstance(dest, (str, os.PathLike)):
+            with open(dest, 'w', newline='', encoding='utf-8') as fh:
+                return ReportGenerator.write_csv(results, fh, columns, chunk_rows)
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow([header for header, _, _, _ in columns])
+        keys = [key for _, key, _, _ in columns]
+        formats = [(spec, default) for _, _, spec, default in columns]
+        template = ','.join('{%d:%s}' % (i, spec) for i, (spec, _) in enumerate(formats)) + '\n'
+        render = template.format
+        separators = len(columns) - 1
+        write = buffer.write
+        getters: Dict[type, Any] = {}
+        
+        count = 0
+        iterator = iter(results)
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_rows))
+            for calc in chunk:
+                getter = getters.get(type(calc))
+                if getter is None:
+                    getter = getters[type(calc)] = _row_getter(type(calc), keys)
+                try:
+                    values = getter(calc)
+                except (AttributeError, KeyError):
+                    values = None
+                if values is not None and None not in values:
+                    line = render(*values)
+                    # Plain rows (no quote, separator or newline in a field) skip the csv module
+                    if (line.count(',') == separators and line.count('\n') == 1
+                            and '"' not in line and '\r' not in line and line != '\n'):
+                        write(line)
+                        continue
+                writer.writerow([format(default if value is None else value, spec)
+                                 for value, (spec, default) in zip(_lookup(calc, keys), formats)])
+            count += len(chunk)
+            dest.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+            if len(chunk) < chunk_rows:
+                return count
     
     @staticmethod
     def export_to_csv(calculations_list: list) -> str:
         """Export multiple calculations to CSV format"""
-        csv = "Room,Area_m2,Material,Quantity,Waste%,Total_Cost,Cost_per_m2\n"
-        for calc in calculations_list:
-            csv += f"{calc.get('room_name', 'N/A')},{calc.get('area_m2', 0):.2f},"
-            csv += f"{calc.get('material_name', 'N/A')},{calc.get('quantity_units', 0):.2f},"
-            csv += f"{calc.get('waste_percent', 0):.1f},{calc.get('total_cost', 0):.2f},"
-            csv += f"{calc.get('cost_per_m2', 0):.2f}\n"
-        return csv
+        out = io.StringIO()
+        ReportGenerator.write_csv(calculations_list, out)
+        return out.getvalue()
+    
+    @staticmethod
+    def render_reports(results: Iterable[Any], generated: Optional[datetime] = None,
+                       template: Optional[ReportTemplate] = None) -> Iterator[str]:
+        """
+        Render the project report of every result, all stamped with one time
+        
+        Args:
+            results: Iterable of result records or dictionaries (with room_name)
+            generated: Generation time shown in the reports (default: now)
+            template: Compiled layout (default: the project report)
+        """
+        render = (template or _PROJECT_REPORT).render
+        stamp = (generated or datetime.now()).strftime(REPORT_TIME_FORMAT)
+        for calc in results:
+            yield render(calc, stamp)
+    
+    @staticmethod
+    def report_filename(index: int, calc: Any) -> str:
+        """File name of a result's report: its position and a safe form of the room name"""
+        name = _lookup(calc, ('room_name',))[0]
+        return '%06d_%s.txt' % (index, _UNSAFE_FILENAME.sub('_', str(name or '')).strip('._') or 'room')
+    
+    @staticmethod
+    def write_reports(results: Iterable[Any], dest: Union[str, "os.PathLike"],
+                      workers: int = REPORT_WORKERS, generated: Optional[datetime] = None,
+                      chunk_rows: int = REPORT_CHUNK_ROWS) -> int:
+        """
+        Write one text report per result into a directory or a .zip archive
+        
+        Results are taken ``chunk_rows`` at a time. For a directory, each
+        chunk is rendered and written by a thread pool, with at most two
+        chunks per worker in flight; a zip archive is written by one thread,
+        since entries have to be appended in turn.
+        
+        Args:
+            results: Iterable of result records or dictionaries (with room_name)
+            dest: Output directory, or a path ending in .zip
+            workers: Writer threads for directory output
+            generated: Generation time shown in the reports (default: now)
+            chunk_rows: Reports per task
+        
+        Returns:
+            Number of reports written
+        """
+        # Imported here: they take longer to load than a single report takes to render
+        from concurrent.futures import ThreadPoolExecutor
+        import zipfile
+        
+        stamp = (generated or datetime.now()).strftime(REPORT_TIME_FORMAT)
+        indexed = enumerate(results)
+        chunks = iter(lambda: list(itertools.islice(indexed, chunk_rows)), [])
+        dest = os.fspath(dest)
+        count = 0
+        
+        if dest.lower().endswith('.zip'):
+            with zipfile.ZipFile(dest, 'w', zipfile.ZIP_DEFLATED,
+                                 compresslevel=REPORT_ZIP_LEVEL) as archive:
+                for chunk in chunks:
+                    for index, calc in chunk:
+                        archive.writestr(ReportGenerator.report_filename(index, calc),
+                                         _PROJECT_REPORT.render(calc, stamp))
+                    count += len(chunk)
+            return count
+        
+        os.makedirs(dest, exist_ok=True)
+        
+        def write_chunk(chunk) -> int:
+            for index, calc in chunk:
+                path = os.path.join(dest, ReportGenerator.report_filename(index, calc))
+                with open(path, 'w', encoding='utf-8') as fh:
+                    fh.write(_PROJECT_REPORT.render(calc, stamp))
+            return len(chunk)
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            pending = []
+            for chunk in chunks:
+                pending.append(pool.submit(write_chunk, chunk))
+                if len(pending) >= 2 * workers:
+                    count += pending.pop(0).result()
+            for future in pending:
+                count += future.result()
+        return count
+
+
+def _row_getter(kind: type, keys: Sequence[str]):
+    """C-level getter returning the column values of one result as a tuple"""
+    if all(key in getattr(kind, '_fields', ()) for key in keys):
+        getter = attrgetter(*keys)
+    elif issubclass(kind, dict):
+        getter = itemgetter(*keys)
+    else:
+        return lambda calc: None
+    return getter if len(keys) > 1 else lambda calc: (getter(calc),)
+
+
+def _lookup(calc: Any, keys: Sequence[str]) -> list:
+    """Column values of a result, None where it has no value"""
+    get = calc.get if hasattr(calc, 'get') else lambda key: getattr(calc, key, None)
+    return [get(key) for key in keys]
@@ -0,0 +1,205 @@
+"""Stream room schedules (CSV or JSON Lines) into validated estimate inputs"""
+
+from src.models import (FrozenFlooringMaterial, FrozenLayingPattern, PatternLibrary, PatternType,
+                        RoomSpecification)
+from src.utils.unit_converter import UnitConverter
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, TextIO, Tuple
+from functools import lru_cache
+from operator import itemgetter
+import csv
+import json
+import math
+
+
+# Column names match the CLI options (with underscores), so options act as defaults
+ROOM_FIELDS = ('room_name', 'length', 'width', 'additional_area', 'vertices')
+MATERIAL_FIELDS = ('material_name', 'material_type', 'unit_cost', 'unit_measurement',
+                   'units_per_box', 'width_cm', 'length_cm', 'waste_factor')
+PATTERN_FIELDS = ('pattern', 'pattern_waste', 'grout_kg_per_m2')
+# Units of the room lengths (additional area in its square) and of the piece sizes
+UNIT_FIELDS = ('length_unit', 'size_unit')
+FIELDS = ROOM_FIELDS + MATERIAL_FIELDS + PATTERN_FIELDS + UNIT_FIELDS + ('labor', 'additional_costs')
+
+# Distinct raw material/pattern values whose frozen models are kept
+_MODEL_CACHE_SIZE = 4096
+
+_BLANK_ROW = dict.fromkeys(FIELDS)
+_material_key = itemgetter(*MATERIAL_FIELDS, 'size_unit')
+# Pattern defaults come from the library and depend on the material type (and piece size)
+_pattern_key = itemgetter(*PATTERN_FIELDS, 'material_type')
+
+_PATTERN_NAMES = {name: p for p in PatternType for name in (p.value, p.name.lower())}
+
+Reject = Callable[[int, Any, str], None]
+
+
+class ScheduleRow(NamedTuple):
+    """One validated schedule row, ready for the estimate calculators"""
+    line: int
+    room: RoomSpecification
+    material: FrozenFlooringMaterial
+    pattern: FrozenLayingPattern
+    labor_cost_per_m2: float
+    additional_costs: float
+
+
+class RoomSchedule:
+    """Reads room schedules row by row without loading the file"""
+
+    @staticmethod
+    def detect_format(path: str) -> str:
+        """'jsonl' for .jsonl/.ndjson/.json files, otherwise 'csv'"""
+        return 'jsonl' if path.lower().endswith(('.jsonl', '.ndjson', '.json')) else 'csv'
+
+    @staticmethod
+    def read_raw(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Any, Optional[str]]]:
+        """
+        Yield (line number, raw row, error) for every row of the stream
+
+        Rows that cannot be decoded are yielded with an error message
+        instead of stopping the stream.
+        """
+        if fmt == 'csv':
+            reader = csv.DictReader(stream)
+            for row in reader:
+                extra = row.pop(None, None)
+                yield reader.line_num, row, ('too many columns' if extra else None)
+            return
+
+        for line_no, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                yield line_no, line.rstrip('\n'), f"invalid JSON: {exc}"
+                continue
+            yield line_no, row, (None if isinstance(row, dict) else 'row is not a JSON object')
+
+    @staticmethod
+    def read(stream: TextIO, fmt: str, defaults: Dict[str, Any],
+             reject: Reject) -> Iterator[ScheduleRow]:
+        """
+        Yield validated rows; malformed ones are passed to ``reject`` and skipped
+
+        Args:
+            stream: Open text stream of the schedule
+            fmt: 'csv' or 'jsonl'
+            defaults: Values used where a row leaves a column out or empty
+            reject: Called with (line number, raw row, error message)
+        """
+        for line_no, raw, error in RoomSchedule.read_raw(stream, fmt):
+            if error is None:
+                try:
+                    yield RoomSchedule.parse_row(line_no, raw, defaults)
+                    continue
+                except (TypeError, ValueError) as exc:
+                    error = str(exc)
+            reject(line_no, raw, error)
+
+    @staticmethod
+    def parse_row(line_no: int, row: Dict[str, Any], defaults: Dict[str, Any]) -> ScheduleRow:
+        """Build the room, material and pattern of one row; raises ValueError if invalid"""
+        values = {**_BLANK_ROW, **defaults}
+        values.update({key: v for key, v in row.items() if v is not None and v != ''})
+
+        # Lengths are converted to metres here, so the estimators only see SI values
+        vertices = values['vertices']
+        room_name = str(values['room_name'] or 'Room')
+        scale = UnitConverter.length_factor(values['length_unit'] or 'm')
+        additional_area = _number('additional_area', values['additional_area'] or 0.0) * scale * scale
+        if vertices:
+            if isinstance(vertices, str):
+                vertices = json.loads(vertices)
+            if scale != 1.0:
+                vertices = [(x * scale, y * scale) for x, y in vertices]
+            room = RoomSpecification.from_vertices(vertices, room_name=room_name,
+                                                   additional_area_m2=additional_area)
+        else:
+            length, width = values['length'], values['width']
+            if length is None or width is None:
+                raise ValueError("length and width (or vertices) are required")
+            room = RoomSpecification(length_m=_length('length', length, scale),
+                                     width_m=_length('width', width, scale),
+                                     room_name=room_name, additional_area_m2=additional_area)
+        if room.length_m < 0 or room.width_m < 0 or room.get_total_area() < 0:
+            raise ValueError("room dimensions must not be negative")
+
+        # Schedules repeat a handful of materials and patterns; both are built once per raw value
+        material = _material(_material_key(values))
+        pattern = _pattern(_pattern_key(values), material.width_cm, material.length_cm)
+
+        return ScheduleRow(line_no, room, material, pattern,
+                           _number('labor', values['labor'] or 0.0),
+                           _number('additional_costs', values['additional_costs'] or 0.0))
+
+    @staticmethod
+    def reject_writer(stream: TextIO) -> Reject:
+        """Reject callback writing one JSON object per rejected row"""
+        def reject(line_no: int, raw: Any, error: str) -> None:
+            stream.write(json.dumps({'line': line_no, 'error': error, 'row': raw}) + '\n')
+        return reject
+
+
+def _number(key: str, value: Any) -> float:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid {key}: {value!r}") from None
+    if not math.isfinite(number):
+        raise ValueError(f"invalid {key}: {value!r}")
+    return number
+
+
+def _optional_number(key: str, value: Any) -> Optional[float]:
+    return None if value is None else _number(key, value)
+
+
+def _length(key: str, value: Any, scale: float, to_unit: str = 'm') -> float:
+    """Plain numbers times ``scale``; text with its own units such as 12ft 6in"""
+    try:
+        number = float(value) * scale
+    except (TypeError, ValueError):
+        try:
+            number = UnitConverter.parse_length(value, to_unit=to_unit)
+        except ValueError:
+            raise ValueError(f"invalid {key}: {value!r}") from None
+    if not math.isfinite(number):
+        raise ValueError(f"invalid {key}: {value!r}")
+    return number
+
+
+@lru_cache(maxsize=_MODEL_CACHE_SIZE)
+def _material(raw: tuple) -> FrozenFlooringMaterial:
+    (name, material_type, unit_cost, unit_measurement, units_per_box, width_cm, length_cm, waste_factor,
+     size_unit) = raw
+    scale = UnitConverter.length_factor(size_unit, 'cm') if size_unit else 1.0
+    return FrozenFlooringMaterial(
+        name=str(name or 'Material'),
+        material_type=str(material_type or 'tile'),
+        unit_cost=_number('unit_cost', unit_cost or 0.0),
+        unit_measurement=str(unit_measurement or 'm2'),
+        units_per_box=int(_number('units_per_box', units_per_box)) if units_per_box else None,
+        width_cm=None if width_cm is None else _length('width_cm', width_cm, scale, 'cm'),
+        length_cm=None if length_cm is None else _length('length_cm', length_cm, scale, 'cm'),
+        waste_factor=_number('waste_factor', waste_factor) if waste_factor is not None else 0.10,
+    )
+
+
+@lru_cache(maxsize=_MODEL_CACHE_SIZE)
+def _pattern(raw: tuple, width_cm: Optional[float], length_cm: Optional[float]) -> FrozenLayingPattern:
+    pattern, pattern_waste, grout_kg_per_m2, material_type = raw
+    return PatternLibrary.pattern(
+        _pattern_type(pattern or PatternType.STRAIGHT), str(material_type or 'tile'), width_cm, length_cm,
+        additional_waste_percentage=_optional_number('pattern_waste', pattern_waste),
+        grout_consumption_kg_per_m2=_optional_number('grout_kg_per_m2', grout_kg_per_m2),
+    )
+
+
+def _pattern_type(value: Any) -> PatternType:
+    if isinstance(value, PatternType):
+        return value
+    pattern_type = _PATTERN_NAMES.get(str(value).strip().lower().replace('-', '_').replace(' ', '_'))
+    if pattern_type is None:
+        raise ValueError(f"unknown pattern: {value!r}")
+    return pattern_type
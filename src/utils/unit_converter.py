@@ -1,5 +1,33 @@
 """Unit conversion utilities"""
 
+from typing import TYPE_CHECKING, Dict, Union
+import re
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Metres per unit; the first name of each unit is the one shown in messages
+_BASE_UNITS = {'mm': 0.001, 'cm': 0.01, 'm': 1.0, 'in': 0.0254, 'ft': 0.3048, 'yd': 0.9144}
+_ALIASES = {'"': 'in', 'inch': 'in', 'inches': 'in', "'": 'ft', 'foot': 'ft', 'feet': 'ft',
+            'yard': 'yd', 'yards': 'yd'}
+_ALIASES.update({prefix + 'met' + end: unit for prefix, unit in (('milli', 'mm'), ('centi', 'cm'), ('', 'm'))
+                 for end in ('er', 're', 'ers', 'res')})
+
+# Length unit -> metres per unit
+LENGTH_UNITS: Dict[str, float] = dict(_BASE_UNITS, **{alias: _BASE_UNITS[unit] for alias, unit in _ALIASES.items()})
+# Area unit -> square metres per unit ('ft2', 'sq_ft', 'sq ft' and 'ft²' alike)
+AREA_UNITS: Dict[str, float] = {
+    name: factor ** 2
+    for unit, factor in _BASE_UNITS.items()
+    for name in (unit + '2', unit + '²', 'sq_' + unit, 'sq ' + unit, 'sq' + unit)
+}
+
+# One "<number> <unit>" part of a length such as 12ft 6in or 12' 6"
+_LENGTH_PART = re.compile(
+    r"""\s*(\d+(?:\.\d*)?|\.\d+)\s*((?:milli|centi)?met(?:er|re)s?|mm|cm|m"""
+    r"""|inch(?:es)?|in|feet|foot|ft|yards?|yd|'|")\s*""", re.IGNORECASE)
+
 
 class UnitConverter:
     """Convert between different measurement units"""
@@ -43,3 +71,72 @@ class UnitConverter:
     def sq_m_to_sq_ft(sq_m: float) -> float:
         """Convert square meters to square feet"""
         return sq_m / 0.092903
+
+    @staticmethod
+    def length_factor(from_unit: str, to_unit: str = 'm') -> float:
+        """
+        Factor turning lengths in ``from_unit`` into ``to_unit``
+
+        Raises:
+            ValueError: If a unit is not in LENGTH_UNITS
+        """
+        return _unit(LENGTH_UNITS, from_unit, 'length') / _unit(LENGTH_UNITS, to_unit, 'length')
+
+    @staticmethod
+    def area_factor(from_unit: str, to_unit: str = 'm2') -> float:
+        """Factor turning areas in ``from_unit`` into ``to_unit`` (see AREA_UNITS)"""
+        return _unit(AREA_UNITS, from_unit, 'area') / _unit(AREA_UNITS, to_unit, 'area')
+
+    @staticmethod
+    def convert_length(values, from_unit: str, to_unit: str = 'm') -> "np.ndarray":
+        """
+        Convert a whole column of lengths in one array operation
+
+        Args:
+            values: Scalar, sequence or array (NaN stays NaN)
+            from_unit, to_unit: Units of LENGTH_UNITS
+
+        Returns:
+            float64 array; the input itself when no conversion is needed
+        """
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.float64)
+        factor = UnitConverter.length_factor(from_unit, to_unit)
+        return values if factor == 1.0 else values * factor
+
+    @staticmethod
+    def parse_length(value: Union[str, float], unit: str = 'm', to_unit: str = 'm') -> float:
+        """
+        Parse one length as typed by a user
+
+        Plain numbers are in ``unit``; text may give its own units, also
+        combined, e.g. ``12ft 6in``, ``12' 6"`` or ``3.5 m``.
+
+        Raises:
+            ValueError: If the value is not a length
+        """
+        factor = UnitConverter.length_factor(unit, to_unit)
+        try:
+            return float(value) * factor
+        except (TypeError, ValueError):
+            if not isinstance(value, str) or not value.strip():
+                raise ValueError(f"invalid length: {value!r}") from None
+        total, pos, text = 0.0, 0, value.strip()
+        while pos < len(text):
+            match = _LENGTH_PART.match(text, pos)
+            if match is None:
+                raise ValueError(f"invalid length: {value!r}")
+            total += float(match.group(1)) * _unit(LENGTH_UNITS, match.group(2), 'length')
+            pos = match.end()
+        return total / _unit(LENGTH_UNITS, to_unit, 'length')
+
+
+def _unit(units: Dict[str, float], name: str, kind: str) -> float:
+    factor = units.get(name)
+    if factor is None:
+        factor = units.get(str(name).strip().lower())
+    if factor is None:
+        names = _BASE_UNITS if kind == 'length' else [unit + '2' for unit in _BASE_UNITS]
+        raise ValueError(f"Unknown {kind} unit {name!r}. Use one of: " + ", ".join(names))
+    return factor
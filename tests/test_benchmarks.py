@@ -0,0 +1,51 @@
+"""Smoke tests for the benchmark suite and the baseline comparison"""
+
+import copy
+
+from benchmarks import __main__ as cli
+from benchmarks import suite
+
+
+def _document():
+    return suite.run(suite.select(['waste.*', 'cost.batch']), scale=0.001, repeat=1)
+
+
+class TestBenchmarks:
+    """Test running and comparing benchmarks"""
+
+    def test_select(self):
+        """Test shell-style selection over the registry"""
+        assert [b.name for b in suite.select(['cost.*'])] == ['cost.scalar', 'cost.batch']
+        assert len(suite.select()) == len(suite.BENCHMARKS)
+
+    def test_every_benchmark_runs(self):
+        """Test that each benchmark measures its items"""
+        document = suite.run(suite.select(), scale=0.001, repeat=1)
+        assert set(document['results']) == set(suite.BENCHMARKS)
+        for result in document['results'].values():
+            assert result['items'] >= 1 and result['seconds'] >= 0 and result['peak_bytes'] >= 0
+
+    def test_compare(self):
+        """Test that a slower or larger run regresses and an identical one does not"""
+        baseline = _document()
+        assert suite.compare(baseline, copy.deepcopy(baseline)) == []
+        slower = copy.deepcopy(baseline)
+        slower['results']['cost.batch']['seconds'] *= 2
+        slower['results']['waste.scalar']['peak_bytes'] += 10 * suite.MEMORY_FLOOR_BYTES
+        regressions = suite.compare(baseline, slower)
+        assert {(r.name, r.metric) for r in regressions} == {
+            ('cost.batch', 'seconds_per_item'), ('waste.scalar', 'peak_bytes_per_item')}
+        assert regressions[0].ratio > 1
+
+    def test_compare_command(self, tmp_path, capsys):
+        """Test the exit status of the compare command on saved files"""
+        baseline = _document()
+        slower = copy.deepcopy(baseline)
+        for result in slower['results'].values():
+            result['seconds'] *= 2
+        paths = [str(tmp_path / name) for name in ('base.json', 'same.json', 'slow.json')]
+        for path, document in zip(paths, (baseline, baseline, slower)):
+            suite.save(document, path)
+        assert cli.main(['compare', paths[0], paths[1]]) == 0
+        assert cli.main(['compare', paths[0], paths[2]]) == 1
+        assert 'REGRESSION cost.batch' in capsys.readouterr().out
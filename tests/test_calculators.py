@@ -1,7 +1,8 @@
 """Unit tests for calculator modules"""
 
 import pytest
-from src.models import FlooringMaterial, LayingPattern, RoomSpecification, PatternType
+import numpy as np
+from src.models import FlooringMaterial, LayingPattern, RoomSpecification, RoomTable, PatternType
 from src.calculators import AreaCalculator, MaterialCalculator, CostCalculator, WasteCalculator
 
 
@@ -26,6 +27,52 @@ class TestAreaCalculator:
         border_area = AreaCalculator.calculate_border_area(room, border_width_m=0.5)
         assert border_area == 9.0
 
+    def test_l_shaped_room_from_vertices(self):
+        """Test area and perimeter of a polygon room"""
+        room = RoomSpecification.from_vertices(
+            [(0, 0), (6, 0), (6, 3), (3, 3), (3, 5), (0, 5)], room_name="L Room"
+        )
+        assert room.length_m == 6.0
+        assert room.width_m == 5.0
+        assert AreaCalculator.calculate_room_area(room) == pytest.approx(24.0)
+        assert AreaCalculator.calculate_perimeter(room) == pytest.approx(22.0)
+
+    def test_batch_matches_scalar(self):
+        """Test vectorized area and perimeter against the per-room path"""
+        rooms = [
+            RoomSpecification(length_m=5.0, width_m=4.0, additional_area_m2=1.5),
+            RoomSpecification.from_vertices([(0, 0), (4, 0), (0, 3)]),
+            RoomSpecification.from_vertices([(0, 0), (0, 5), (3, 5), (3, 3), (6, 3), (6, 0)]),
+        ]
+        areas = AreaCalculator.calculate_room_area_batch(rooms)
+        perimeters = AreaCalculator.calculate_perimeter_batch(rooms)
+
+        assert list(areas) == pytest.approx([r.get_total_area() for r in rooms])
+        assert list(perimeters) == pytest.approx([r.get_perimeter() for r in rooms])
+
+    def test_room_table(self):
+        """Test packed room columns, their slices and the rectangle-column entry point"""
+        rooms = [
+            RoomSpecification(length_m=5.0, width_m=4.0),
+            RoomSpecification.from_vertices([(0, 0), (4, 0), (0, 3)], additional_area_m2=2.0),
+            RoomSpecification(length_m=2.0, width_m=3.0, additional_area_m2=0.5),
+            RoomSpecification.from_vertices([(0, 0), (0, 5), (3, 5), (3, 3), (6, 3), (6, 0)]),
+        ]
+        table = RoomTable.from_rooms(rooms)
+        assert table.outline_rows.tolist() == [1, 3]
+        assert len(table.coords) == 9
+        expected = [r.get_total_area() for r in rooms]
+        assert list(AreaCalculator.calculate_room_area_batch(table)) == pytest.approx(expected)
+        for start, stop in ((0, 2), (1, 3), (2, 4), (3, 3)):
+            part = AreaCalculator.calculate_room_area_batch(table.slice(start, stop))
+            assert list(part) == pytest.approx(expected[start:stop])
+            perimeters = AreaCalculator.calculate_perimeter_batch(table.slice(start, stop))
+            assert list(perimeters) == pytest.approx([r.get_perimeter() for r in rooms[start:stop]])
+
+        rectangles = RoomTable.from_rectangles(np.array([5.0, 2.0]), np.array([4.0, 3.0]), 0.5)
+        assert AreaCalculator.calculate_room_area_batch(rectangles).tolist() == [20.5, 6.5]
+        assert len(AreaCalculator.calculate_room_area_batch([])) == 0
+
 
 class TestWasteCalculator:
     """Test waste calculation functions"""
@@ -47,6 +94,29 @@ class TestWasteCalculator:
         assert waste > 10  # At least 10% waste
         assert 'waste_percentage' in details
         assert details['waste_percentage'] > 10
+    
+    def test_waste_batch_matches_scalar(self):
+        """Test vectorized waste against the per-row path"""
+        materials = [
+            FlooringMaterial(name="Tile", material_type="tile", unit_cost=10,
+                             unit_measurement="m2", waste_factor=0.10),
+            FlooringMaterial(name="Oak", material_type="wood", unit_cost=40,
+                             unit_measurement="m2", waste_factor=0.15),
+        ]
+        pattern = LayingPattern(
+            pattern_type=PatternType.DIAGONAL,
+            description="Diagonal", additional_waste_percentage=12.5
+        )
+        areas = [20.0, 0.0]
+        
+        batch = WasteCalculator.calculate_waste_quantity_batch(
+            areas, [m.waste_factor for m in materials], [pattern.additional_waste_percentage] * 2
+        )
+        
+        for i, (area, material) in enumerate(zip(areas, materials)):
+            waste, details = WasteCalculator.calculate_waste_quantity(area, material, pattern)
+            assert batch['total_waste_m2'][i] == waste
+            assert batch['waste_percentage'][i] == details['waste_percentage']
 
 
 class TestMaterialCalculator:
@@ -69,6 +139,38 @@ class TestMaterialCalculator:
         assert 'area_needed_m2' in material_info
         assert 'quantity_units' in material_info
         assert material_info['area_needed_m2'] > 50
+    
+    def test_material_batch_matches_scalar(self):
+        """Test vectorized material quantities and box rounding against the per-row path"""
+        materials = [
+            FlooringMaterial(name="Tile", material_type="tile", unit_cost=3,
+                             unit_measurement="piece", units_per_box=8,
+                             width_cm=30, length_cm=60, waste_factor=0.10),
+            FlooringMaterial(name="Oak", material_type="wood", unit_cost=40,
+                             unit_measurement="m2", units_per_box=None,
+                             width_cm=18, length_cm=120, waste_factor=0.15),
+            FlooringMaterial(name="Vinyl", material_type="vinyl", unit_cost=12,
+                             unit_measurement="m2", waste_factor=0.05),
+        ]
+        pattern = LayingPattern(
+            pattern_type=PatternType.STRAIGHT,
+            description="Straight", additional_waste_percentage=5
+        )
+        areas = [20.0, 13.7, 31.25]
+        
+        batch = MaterialCalculator.calculate_material_needed_batch(
+            areas,
+            [m.waste_factor for m in materials],
+            [pattern.additional_waste_percentage] * 3,
+            [m.get_area_per_unit() for m in materials],
+            [m.units_per_box or 0 for m in materials],
+            [m.unit_measurement == 'm2' for m in materials],
+        )
+        
+        for i, (area, material) in enumerate(zip(areas, materials)):
+            scalar = MaterialCalculator.calculate_material_needed(area, material, pattern)
+            for key in ('area_needed_m2', 'quantity_units', 'boxes_needed', 'total_waste_factor_percent'):
+                assert batch[key][i] == scalar[key]
 
 
 class TestCostCalculator:
@@ -112,6 +214,39 @@ class TestCostCalculator:
         assert cost['total_cost'] > 0
         assert 'cost_per_m2' in cost
         assert cost['cost_per_m2'] > 0
+    
+    def test_portfolio_cost_matches_scalar(self):
+        """Test vectorized portfolio pricing against the per-room path"""
+        materials = [
+            FlooringMaterial(name="Tile", material_type="tile", unit_cost=25,
+                             unit_measurement="m2", width_cm=30, length_cm=60, waste_factor=0.10),
+            FlooringMaterial(name="Mosaic", material_type="tile", unit_cost=0.4,
+                             unit_measurement="piece", units_per_box=100,
+                             width_cm=10, length_cm=10, waste_factor=0.12),
+        ]
+        patterns = [
+            LayingPattern(pattern_type=PatternType.STRAIGHT, description="Straight",
+                          grout_consumption_kg_per_m2=1.8),
+            LayingPattern(pattern_type=PatternType.DIAGONAL, description="Diagonal",
+                          additional_waste_percentage=15),
+        ]
+        areas = [20.0, 12.5, 0.0, 7.25]
+        material_indices = [0, 1, 0, 1]
+        pattern_indices = [1, 0, 0, 1]
+        labor = [15.0, 20.0, 10.0, 0.0]
+        
+        batch = CostCalculator.calculate_portfolio_cost(
+            areas, material_indices, pattern_indices, materials, patterns,
+            labor_cost_per_m2=labor, additional_costs=50.0
+        )
+        
+        for i, area in enumerate(areas):
+            scalar = CostCalculator.calculate_total_project_cost(
+                area, materials[material_indices[i]], patterns[pattern_indices[i]],
+                labor_cost_per_m2=labor[i], additional_costs=50.0
+            )
+            for key, value in scalar.items():
+                assert batch[key][i] == value
 
 
 if __name__ == "__main__":
@@ -0,0 +1,47 @@
+"""Import-time checks for CLI startup and the lazy package exports"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+import src
+import src.calculators
+import src.models
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules a single estimate must not import: they are most of the startup time
+HEAVY_MODULES = ('numpy', 'concurrent.futures.process', 'multiprocessing', 'zipfile',
+                 'src.calculators.parallel_estimator', 'src.catalog', 'src.utils.column_store')
+
+_PROBE = """
+import contextlib, io, runpy, sys
+sys.argv = ['cli.py', '--example', 'living-room']
+with contextlib.redirect_stdout(io.StringIO()) as out:
+    runpy.run_path('cli.py', run_name='__main__')
+assert 'TOTAL PROJECT COST' in out.getvalue()
+print(' '.join(sorted(sys.modules)))
+"""
+
+
+class TestStartup:
+    """Test what a CLI run and the packages import"""
+
+    def test_example_imports_no_heavy_modules(self):
+        """Test that a single estimate loads neither NumPy nor the batch modules"""
+        proc = subprocess.run([sys.executable, '-c', _PROBE], cwd=ROOT, capture_output=True,
+                              text=True, check=True)
+        loaded = set(proc.stdout.split())
+        assert 'src.calculators.estimate_pipeline' in loaded
+        assert loaded.isdisjoint(HEAVY_MODULES), sorted(loaded.intersection(HEAVY_MODULES))
+
+    def test_lazy_exports(self):
+        """Test that every exported name resolves on access"""
+        for package in (src.models, src.calculators):
+            for name in package.__all__:
+                assert getattr(package, name).__name__ == name
+            assert set(package.__all__) <= set(dir(package))
+            with pytest.raises(AttributeError):
+                package.NotAName
+        assert src.catalog.MaterialCatalog.__name__ == 'MaterialCatalog'
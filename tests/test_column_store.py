@@ -0,0 +1,58 @@
+"""Unit tests for the columnar estimate export"""
+
+import numpy as np
+import pytest
+from src.calculators import ParallelEstimator
+from src.models import (CostResult, EstimateResult, FlooringMaterial, LayingPattern, PatternType,
+                        RoomSpecification)
+from src.utils.column_store import ColumnStore, ColumnWriter
+
+
+def _result(i: int) -> EstimateResult:
+    return EstimateResult(f"Room {i}", 10.0 + i, "Oak" if i % 2 else "Tile", 11.0 + i, "m2", 10.0,
+                          "straight", "Straight", 100.0, 50.0, 5.0, 155.0, 155.0 / (10 + i), i + 1)
+
+
+class TestColumnStore:
+    """Test writing and memory-mapped reading of column directories"""
+
+    def test_records_round_trip(self, tmp_path):
+        """Test that streamed records come back typed and unchanged"""
+        results = [_result(i) for i in range(7)]
+        assert ColumnStore.write(iter(results), tmp_path, chunk_rows=3) == 7
+
+        batch = ColumnStore.read(tmp_path)
+        assert batch.record is EstimateResult
+        assert list(batch) == results
+        assert isinstance(batch['area_m2'], np.memmap)
+        assert batch['boxes_needed'].dtype == np.int64
+        assert list(ColumnStore.categories(tmp_path, 'material_name')) == ['Tile', 'Oak']
+        assert ColumnStore.read(tmp_path, decode=False)['material_name'].tolist() == [0, 1] * 3 + [0]
+
+    def test_columns_are_plain_npy(self, tmp_path):
+        """Test that each column loads with numpy alone"""
+        ColumnStore.write([_result(i) for i in range(4)], tmp_path)
+        area = np.load(tmp_path / 'area_m2.npy', mmap_mode='r')
+        assert area.tolist() == [10.0, 11.0, 12.0, 13.0]
+
+    def test_result_batch(self, tmp_path):
+        """Test exporting a vectorized estimate without building records"""
+        rooms = [RoomSpecification(length_m=4, width_m=3 + i) for i in range(5)]
+        material = FlooringMaterial(name="Tile", material_type="tile", unit_cost=20, unit_measurement="m2")
+        pattern = LayingPattern(pattern_type=PatternType.STRAIGHT, description="Straight")
+        batch = ParallelEstimator.estimate_rooms(rooms, [material], [pattern], workers=1)['rooms']
+
+        ColumnStore.write(batch, tmp_path)
+        loaded = ColumnStore.read(tmp_path, mmap=False)
+        assert loaded.record is CostResult
+        assert np.array_equal(loaded['total_cost'], batch['total_cost'])
+        assert np.array_equal(loaded['boxes_needed'], batch['boxes_needed'])
+
+    def test_unfinished_export_is_not_readable(self, tmp_path):
+        """Test that the schema only appears once the writer is closed"""
+        writer = ColumnWriter(tmp_path)
+        writer.append([_result(0)])
+        with pytest.raises(FileNotFoundError):
+            ColumnStore.read(tmp_path)
+        writer.close()
+        assert len(ColumnStore.read(tmp_path)) == 1
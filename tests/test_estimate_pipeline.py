@@ -0,0 +1,61 @@
+"""Unit tests for the estimate dependency graph"""
+
+import pytest
+from src.models import FlooringMaterial, LayingPattern, RoomSpecification, PatternType
+from src.calculators import (CostCalculator, Estimate, EstimatePipeline, MaterialCalculator,
+                             WasteCalculator)
+from src.utils.report_generator import ReportGenerator
+
+
+@pytest.fixture
+def estimate():
+    room = RoomSpecification(length_m=5.0, width_m=4.0, room_name="Living Room")
+    material = FlooringMaterial(name="Ceramic", material_type="tile", unit_cost=25.5,
+                                unit_measurement="m2", width_cm=30, length_cm=60, waste_factor=0.10)
+    pattern = LayingPattern(pattern_type=PatternType.STRAIGHT, description="Straight",
+                            additional_waste_percentage=5, grout_consumption_kg_per_m2=1.8)
+    return Estimate(room, material, pattern, labor_cost_per_m2=15.0, additional_costs=50.0)
+
+
+class TestEstimatePipeline:
+    """Test single-pass estimates"""
+
+    def test_matches_calculators(self, estimate):
+        """Test every node against the standalone calculators"""
+        estimate.evaluate()
+        material, pattern = estimate.material, estimate.pattern
+        assert estimate.area == 20.0
+        assert estimate.waste == WasteCalculator.calculate_waste_quantity(20.0, material, pattern)
+        assert estimate.material_info == MaterialCalculator.calculate_material_needed(20.0, material, pattern)
+        assert estimate.cost == CostCalculator.calculate_total_project_cost(20.0, material, pattern, 15.0, 50.0)
+
+    def test_each_node_computed_once(self, estimate, monkeypatch):
+        """Test that material and consumables are not recomputed for the cost"""
+        calls = []
+        original = MaterialCalculator.calculate_material_needed
+
+        def counting(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(MaterialCalculator, 'calculate_material_needed', staticmethod(counting))
+        estimate.evaluate()
+        estimate.evaluate()
+        assert len(calls) == 1
+
+    def test_update_drops_downstream_only(self, estimate):
+        """Test that a labor change keeps upstream nodes and reprices"""
+        estimate.evaluate()
+        material_info = estimate.material_info
+        estimate.update(labor_cost_per_m2=20.0)
+        assert estimate.material_info is material_info
+        assert estimate.cost['labor_cost'] == 400.0
+        assert EstimatePipeline.dependents(('labor_cost_per_m2',)) == ('cost',)
+        with pytest.raises(ValueError):
+            estimate.update(colour='red')
+
+    def test_report(self, estimate):
+        """Test the report generated from an estimate"""
+        report = ReportGenerator.generate_estimate_report(estimate)
+        assert "Living Room" in report
+        assert f"€{estimate.cost['total_cost']:.2f}" in report
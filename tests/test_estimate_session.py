@@ -0,0 +1,84 @@
+"""Unit tests for the warm estimate session"""
+
+import io
+import json
+import socket
+import threading
+
+import pytest
+from src.catalog import MaterialCatalog
+from src.calculators import EstimatePipeline
+from src.models import FlooringMaterial, PatternLibrary, PatternType, PriceBook, RoomSpecification
+from src.utils.estimate_session import EstimateSession
+
+DEFAULTS = {'unit_cost': 25.0, 'material_type': 'tile', 'labor': 10.0}
+
+
+class TestEstimateSession:
+    """Test request handling"""
+
+    def test_estimate_matches_pipeline(self):
+        """Test that an answer equals the scalar pipeline, with the id echoed"""
+        session = EstimateSession(DEFAULTS)
+        answer = json.loads(session.handle('{"id": "a", "length": 5, "width": 4, "pattern": "diagonal"}'))
+        material = FlooringMaterial(name="Material", material_type="tile", unit_cost=25.0, unit_measurement="m2")
+        expected = EstimatePipeline.run(RoomSpecification(length_m=5, width_m=4, room_name="Room"), material,
+                                        PatternLibrary.pattern(PatternType.DIAGONAL, 'tile'), 10.0).report_data()
+        assert answer.pop('id') == 'a'
+        assert answer == expected._asdict()
+
+    def test_errors_and_commands(self):
+        """Test that bad requests get an error answer instead of stopping the session"""
+        session = EstimateSession(DEFAULTS)
+        assert 'error' in json.loads(session.handle('not json'))
+        assert json.loads(session.handle('{"id": 3, "length": 5}')) == {
+            'id': 3, 'error': 'length and width (or vertices) are required'}
+        assert json.loads(session.handle('{"sku": "X", "length": 1, "width": 1}')) == {'error': 'sku needs a catalog'}
+        assert json.loads(session.handle('{"command": "ping"}')) == {'ok': True}
+        overflow = session.handle('{"id": 4, "length": 1e300, "width": 1e300}')
+        assert set(json.loads(overflow)) == {'id', 'error'}
+        assert 'Infinity' not in overflow and 'NaN' not in overflow
+        assert 'report' in json.loads(session.handle('{"length": 2, "width": 2, "report": true}'))
+
+    def test_catalog_and_price_book(self):
+        """Test SKU materials and price book rates loaded once for the session"""
+        catalog = MaterialCatalog.from_rows([{'sku': 'OAK', 'name': 'Oak', 'material_type': 'wood',
+                                              'unit_cost': 40, 'width_cm': 14, 'length_cm': 120}])
+        book = PriceBook.from_dict({'version': '1', 'rates': [{'material_type': 'wood', 'adhesive_price_per_kg': 0}]})
+        session = EstimateSession(DEFAULTS, catalog, book)
+        answer = json.loads(session.handle('{"sku": "OAK", "length": 4, "width": 3, "pattern": "herringbone"}'))
+        assert answer['material_name'] == 'Oak'
+        expected = EstimatePipeline.run(RoomSpecification(length_m=4, width_m=3, room_name="Room"),
+                                        catalog.material(0),
+                                        PatternLibrary.pattern(PatternType.HERRINGBONE, 'wood', 14, 120),
+                                        10.0, rates=book.rates('wood')).report_data()
+        assert answer == expected._asdict()
+        # Wood gets no grout and the book makes adhesive free: only sealer is left
+        assert answer['consumable_cost'] == pytest.approx(12 / 10.0 * 15.0)
+        assert json.loads(session.handle('{"sku": "ASH", "length": 1, "width": 1}')) == {'error': "unknown sku: 'ASH'"}
+
+    def test_serve_stdin(self):
+        """Test one flushed answer line per request line"""
+        stdout = io.StringIO()
+        count = EstimateSession(DEFAULTS).serve(io.StringIO('{"length": 1, "width": 1}\n\n{"length": 2}\n'), stdout)
+        assert count == 2
+        assert len(stdout.getvalue().splitlines()) == 2
+
+    @pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="needs UNIX sockets")
+    def test_socket_server(self, tmp_path):
+        """Test several requests over one socket connection"""
+        path = str(tmp_path / 'estimates.sock')
+        with EstimateSession(DEFAULTS).server(path) as server:
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                with socket.socket(socket.AF_UNIX) as client:
+                    client.connect(path)
+                    answers = client.makefile('rb')
+                    for i in range(3):
+                        client.sendall(json.dumps({'id': i, 'length': 3, 'width': 2}).encode() + b'\n')
+                        answer = json.loads(answers.readline())
+                        assert answer['id'] == i
+                        assert answer['area_m2'] == 6.0
+            finally:
+                server.shutdown()
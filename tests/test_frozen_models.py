@@ -0,0 +1,66 @@
+"""Unit tests for frozen, interned models and memoized calculations"""
+
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
+from src.models import (FlooringMaterial, FrozenFlooringMaterial, FrozenLayingPattern,
+                        FrozenRoomSpecification, LayingPattern, PatternType, RoomSpecification)
+from src.calculators import CostCalculator, MaterialCalculator
+
+
+def make_material():
+    return FlooringMaterial(name="Ceramic", material_type="tile", unit_cost=25.5,
+                            unit_measurement="m2", width_cm=30, length_cm=60)
+
+
+class TestFrozenModels:
+    """Test immutability, interning and round trips"""
+
+    def test_interned_by_value(self):
+        """Test that equal materials share one object"""
+        frozen = make_material().freeze()
+        again = FrozenFlooringMaterial("Ceramic", "tile", 25.5, "m2", width_cm=30, length_cm=60)
+        assert frozen is again
+        assert {frozen: 1}[again] == 1
+        assert not hasattr(frozen, '__dict__')
+        assert pickle.loads(pickle.dumps(frozen)) is frozen
+
+    def test_immutable(self):
+        """Test that fields cannot be reassigned"""
+        pattern = LayingPattern(pattern_type=PatternType.STRAIGHT, description="Straight").freeze()
+        with pytest.raises(FrozenInstanceError):
+            pattern.additional_waste_percentage = 5
+        with pytest.raises(TypeError):
+            FrozenLayingPattern(description="missing pattern type")
+
+    def test_methods_and_thaw(self):
+        """Test that model methods work and thaw returns an equal dataclass"""
+        room = RoomSpecification.from_vertices([(0, 0), (6, 0), (6, 3), (3, 3), (3, 5), (0, 5)])
+        frozen = room.freeze()
+        assert isinstance(frozen, FrozenRoomSpecification)
+        assert frozen.get_total_area() == room.get_total_area()
+        assert frozen.get_perimeter() == room.get_perimeter()
+        assert frozen.thaw() == room
+        assert make_material().freeze().get_area_per_unit() == pytest.approx(0.18)
+
+
+class TestMemoizedCalculators:
+    """Test the LRU layers over MaterialCalculator and CostCalculator"""
+
+    def test_cached_results_match(self):
+        """Test cached results against the direct calculation and their reuse"""
+        MaterialCalculator.clear_cache()
+        CostCalculator.clear_cache()
+        material = make_material()
+        pattern = LayingPattern(pattern_type=PatternType.STRAIGHT, description="Straight",
+                                grout_consumption_kg_per_m2=1.8)
+
+        for _ in range(3):
+            needed = MaterialCalculator.calculate_material_needed_cached(20.0, material, pattern)
+            cost = CostCalculator.calculate_total_project_cost_cached(20.0, material, pattern, 15.0, 50.0)
+        assert needed == MaterialCalculator.calculate_material_needed(20.0, material, pattern)
+        assert cost == CostCalculator.calculate_total_project_cost(20.0, material, pattern, 15.0, 50.0)
+        assert MaterialCalculator.cache_info().hits == 2
+        assert CostCalculator.cache_info().hits == 2
+        assert MaterialCalculator.calculate_material_needed_cached(20.0, material.freeze(), pattern) is needed
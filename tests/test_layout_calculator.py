@@ -0,0 +1,115 @@
+"""Unit tests for the piece layout simulator"""
+
+import pytest
+from src.models import FlooringMaterial, LayingPattern, RoomSpecification, PatternType
+from src.calculators import LayoutCalculator, MaterialCalculator, MotifCalculator, WasteCalculator
+
+
+def make_tile(width_cm=30, length_cm=60):
+    return FlooringMaterial(
+        name="Tile", material_type="tile",
+        unit_cost=25, unit_measurement="m2",
+        width_cm=width_cm, length_cm=length_cm
+    )
+
+
+def make_pattern(pattern_type, joints_width_mm=3.0):
+    return LayingPattern(
+        pattern_type=pattern_type, description=pattern_type.value,
+        joints_width_mm=joints_width_mm
+    )
+
+
+class TestLayoutCalculator:
+    """Test grid layout simulation"""
+
+    def test_straight_exact_fit_has_no_cuts(self):
+        """Test a room that is an exact multiple of the piece size"""
+        room = RoomSpecification(length_m=3.0, width_m=2.0)
+        layout = LayoutCalculator.simulate_layout(
+            room, make_tile(50, 50), make_pattern(PatternType.STRAIGHT, joints_width_mm=0)
+        )
+        assert layout['full_pieces'] == 24
+        assert layout['cut_pieces'] == 0
+        assert layout['offcut_area_m2'] == pytest.approx(0.0, abs=1e-9)
+
+    def test_straight_counts_edge_cuts(self):
+        """Test full and cut piece counts with joints"""
+        room = RoomSpecification(length_m=5.0, width_m=4.0)
+        layout = LayoutCalculator.simulate_layout(room, make_tile(), make_pattern(PatternType.STRAIGHT))
+        assert layout['full_pieces'] == 8 * 13
+        assert layout['cut_pieces'] == 9 * 14 - 8 * 13
+        covered = layout['covered_area_m2']
+        assert covered == pytest.approx(
+            layout['pieces_required'] * layout['piece_area_m2'] - layout['offcut_area_m2']
+        )
+
+    def test_l_shaped_room_covers_its_area(self):
+        """Test that covered area plus joints matches a polygon room"""
+        room = RoomSpecification.from_vertices([(0, 0), (6, 0), (6, 3), (3, 3), (3, 5), (0, 5)])
+        layout = LayoutCalculator.simulate_layout(
+            room, make_tile(50, 50), make_pattern(PatternType.RUNNING_BOND, joints_width_mm=0)
+        )
+        assert layout['covered_area_m2'] == pytest.approx(24.0)
+
+    def test_diagonal_cuts_more_than_straight(self):
+        """Test diagonal laying produces more offcuts than straight"""
+        room = RoomSpecification(length_m=5.0, width_m=4.0)
+        straight = LayoutCalculator.simulate_layout(room, make_tile(), make_pattern(PatternType.STRAIGHT))
+        diagonal = LayoutCalculator.simulate_layout(room, make_tile(), make_pattern(PatternType.DIAGONAL))
+        assert diagonal['offcut_area_m2'] > straight['offcut_area_m2']
+        assert diagonal['covered_area_m2'] == pytest.approx(straight['covered_area_m2'], rel=1e-3)
+
+    def test_layout_feeds_material_and_waste(self):
+        """Test that calculators use the simulated piece count"""
+        room = RoomSpecification(length_m=5.0, width_m=4.0)
+        material = make_tile()
+        pattern = make_pattern(PatternType.STRAIGHT)
+        layout = LayoutCalculator.simulate_layout(room, material, pattern)
+
+        material_info = MaterialCalculator.calculate_material_needed(20.0, material, pattern, layout=layout)
+        waste, details = WasteCalculator.calculate_waste_from_layout(layout)
+
+        assert material_info['quantity_units'] == layout['pieces_required']
+        assert waste == pytest.approx(layout['offcut_area_m2'])
+        assert details['waste_percentage'] == pytest.approx(layout['waste_percentage'])
+
+    def test_requires_piece_dimensions(self):
+        """Test that materials without dimensions are rejected"""
+        material = FlooringMaterial(name="Vinyl", material_type="vinyl", unit_cost=10, unit_measurement="m2")
+        with pytest.raises(ValueError):
+            LayoutCalculator.simulate_layout(
+                RoomSpecification(length_m=2, width_m=2), material, make_pattern(PatternType.STRAIGHT)
+            )
+
+
+class TestMotifCalculator:
+    """Test herringbone and chevron piece counting"""
+
+    @pytest.mark.parametrize("pattern_type", [PatternType.HERRINGBONE, PatternType.CHEVRON])
+    def test_motif_covers_room_without_overlap(self, pattern_type):
+        """Test that the motif covers the room exactly when joints are zero"""
+        room = RoomSpecification(length_m=5.0, width_m=4.0)
+        layout = LayoutCalculator.simulate_layout(
+            room, make_tile(9, 60), make_pattern(pattern_type, joints_width_mm=0)
+        )
+        assert layout['covered_area_m2'] == pytest.approx(20.0)
+        assert layout['full_pieces'] > 0
+        assert layout['cut_pieces'] > 0
+        assert layout['offcut_area_m2'] > 0
+
+    def test_similar_rooms_hit_the_cache(self):
+        """Test that identical rooms at different positions reuse the motif count"""
+        MotifCalculator.clear_cache()
+        material = make_tile(9, 60)
+        pattern = make_pattern(PatternType.HERRINGBONE)
+        first = RoomSpecification.from_vertices([(0, 0), (4, 0), (4, 3), (0, 3)])
+        shifted = RoomSpecification.from_vertices([(10, 5), (14, 5), (14, 8), (10, 8)])
+
+        a = MotifCalculator.count_pieces(first, material, pattern)
+        b = MotifCalculator.count_pieces(shifted, material, pattern)
+
+        assert a == b
+        info = MotifCalculator.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
@@ -0,0 +1,85 @@
+"""Unit tests for the indexed material catalog"""
+
+import numpy as np
+import pytest
+from src.catalog import MaterialCatalog
+from src.models import FlooringMaterial, MaterialTable
+
+
+ROWS = [
+    {'sku': 'OAK-14', 'name': 'Oak plank', 'material_type': 'wood', 'unit_cost': 38.0,
+     'width_cm': 14, 'length_cm': 120, 'thickness_mm': 14},
+    {'sku': 'OAK-22', 'name': 'Wide oak', 'material_type': 'wood', 'unit_cost': 52.0,
+     'width_cm': 22, 'length_cm': 180},
+    {'sku': 'ASH-12', 'name': 'Ash strip', 'material_type': 'wood', 'unit_cost': 29.5,
+     'width_cm': 12, 'length_cm': 90, 'units_per_box': 20},
+    {'sku': 'TIL-30', 'name': 'Grey tile', 'material_type': 'tile', 'unit_cost': 19.0,
+     'width_cm': 30, 'length_cm': 60, 'unit_measurement': 'piece'},
+    {'sku': 'LAM-19', 'name': 'Laminate', 'material_type': 'laminate', 'unit_cost': 12.0,
+     'width_cm': 19, 'length_cm': 128},
+]
+
+
+@pytest.fixture
+def catalog():
+    return MaterialCatalog.from_rows(ROWS)
+
+
+class TestMaterialCatalog:
+    """Test indexed queries, materials and persistence"""
+
+    def test_query(self, catalog):
+        """Test a type, a range and an upper bound together"""
+        rows = catalog.query(material_type='wood', width_cm=(12, 20), unit_cost=(None, 40))
+        assert [catalog.sku(row) for row in rows] == ['OAK-14', 'ASH-12']
+        assert catalog.query(material_type='stone').size == 0
+        assert catalog.query(thickness_mm=(None, 20)).tolist() == [0]
+        assert catalog.find('LAM-19') == 4
+        with pytest.raises(ValueError):
+            catalog.query(colour='red')
+
+    def test_matches_full_scan(self, catalog):
+        """Test that indexed answers equal a scan of the columns"""
+        rng = np.random.default_rng(3)
+        rows = [{'sku': str(i), 'material_type': str(rng.choice(['wood', 'tile', 'stone'])),
+                 'unit_cost': float(rng.integers(5, 80)), 'width_cm': float(rng.choice([10, 15, 20, 30]))}
+                for i in range(2000)]
+        big = MaterialCatalog.from_rows(rows)
+        expected = [i for i, row in enumerate(rows)
+                    if row['material_type'] == 'tile' and 15 <= row['width_cm'] <= 20 and row['unit_cost'] <= 40]
+        assert big.query(material_type='tile', width_cm=(15, 20), unit_cost=(None, 40)).tolist() == expected
+
+    def test_material(self, catalog):
+        """Test that rows come back as the materials they describe"""
+        material = catalog.material(2)
+        assert material.thaw() == FlooringMaterial(name='Ash strip', material_type='wood', unit_cost=29.5,
+                                                   unit_measurement='m2', units_per_box=20,
+                                                   width_cm=12.0, length_cm=90.0)
+        assert catalog.material(2) is material
+
+    def test_material_table(self, catalog):
+        """Test the vectorized table against one built from materials"""
+        table = catalog.material_table([0, 3])
+        expected = MaterialTable.from_materials(catalog.materials([0, 3]))
+        for field in ('unit_cost', 'waste_factor', 'area_per_unit', 'units_per_box', 'per_m2'):
+            assert np.array_equal(getattr(table, field), getattr(expected, field))
+
+    def test_save_and_open(self, catalog, tmp_path):
+        """Test that a saved catalog opens memory-mapped with its indexes"""
+        catalog.save(tmp_path)
+        opened = MaterialCatalog.open(tmp_path)
+        assert isinstance(opened.columns['unit_cost'], np.memmap)
+        assert isinstance(opened.index('width_cm', by_type=True)[0], np.memmap)
+        assert opened.query(material_type='wood', unit_cost=(30, 60)).tolist() == [0, 1]
+        assert opened.material(3) == catalog.material(3)
+        assert [opened.find(sku) for sku in ('ASH-12', 'OAK-14', 'TIL-30', 'ZZZ', '')] == [2, 0, 3, None, None]
+        assert opened.code('material_type', 'laminate') == catalog.code('material_type', 'laminate') == 2
+
+    def test_load_file(self, tmp_path):
+        """Test reading a supplier CSV and rejecting bad numbers"""
+        path = tmp_path / 'skus.csv'
+        path.write_text('sku,name,material_type,unit_cost\nA1,Oak,wood,30\nB2,Tile,tile,12.5\n', encoding='utf-8')
+        assert MaterialCatalog.load(path).query(unit_cost=12.5).tolist() == [1]
+        path.write_text('sku,unit_cost\nA1,cheap\n', encoding='utf-8')
+        with pytest.raises(ValueError):
+            MaterialCatalog.load(path)
@@ -0,0 +1,67 @@
+"""Unit tests for the offcut reuse optimizer"""
+
+import pytest
+from src.models import FlooringMaterial, LayingPattern, RoomSpecification, PatternType
+from src.calculators import LayoutCalculator, MaterialCalculator
+from src.calculators.offcut_optimizer import OffcutOptimizer
+
+
+class TestOffcutOptimizer:
+    """Test guillotine offcut matching"""
+
+    def test_half_pieces_pair_up(self):
+        """Test that two half-width cuts come from a single piece"""
+        plan = OffcutOptimizer.optimize([0.15, 0.15], [0.6, 0.6], 0.3, 0.6)
+        assert plan['new_pieces'] == 1
+        assert plan['reused_offcuts'] == 1
+
+    def test_kerf_prevents_exact_reuse(self):
+        """Test that saw kerf is taken out of the offcut"""
+        plan = OffcutOptimizer.optimize([0.15, 0.15], [0.6, 0.6], 0.3, 0.6, kerf_m=0.003)
+        assert plan['new_pieces'] == 2
+        assert plan['reused_offcuts'] == 0
+
+    def test_rotated_offcut_is_used(self):
+        """Test that an offcut can be turned to fit a piece"""
+        plan = OffcutOptimizer.optimize([0.4, 0.2], [0.3, 0.3], 0.3, 0.6)
+        assert plan['new_pieces'] == 1
+        assert plan['reused_offcuts'] == 1
+
+    def test_oversized_pieces_are_rejected(self):
+        """Test that a piece larger than the stock is not cut from one board"""
+        with pytest.raises(ValueError):
+            OffcutOptimizer.optimize([0.127] * 4, [0.3] * 4, 0.09, 1.2)
+
+    @pytest.mark.parametrize("pattern_type", [PatternType.HERRINGBONE, PatternType.CHEVRON])
+    def test_motif_reuse_never_gives_negative_waste(self, pattern_type):
+        """Test that motif cuts are matched to offcuts in board sizes"""
+        room = RoomSpecification(length_m=4.0, width_m=3.5)
+        oak = FlooringMaterial(name="Oak", material_type="wood", unit_cost=45, unit_measurement="m2",
+                               width_cm=9, length_cm=120)
+        pattern = LayingPattern(pattern_type=pattern_type, description="Motif")
+        plain = LayoutCalculator.simulate_layout(room, oak, pattern)
+        reused = LayoutCalculator.simulate_layout(room, oak, pattern, reuse_offcuts=True)
+        assert 0 < reused['reused_offcuts']
+        assert 0 <= reused['offcut_area_m2'] < plain['offcut_area_m2']
+        assert reused['pieces_required'] * reused['piece_area_m2'] >= reused['covered_area_m2']
+
+    def test_reuse_lowers_purchased_quantity(self):
+        """Test that offcut reuse lowers units and boxes in the material calculation"""
+        room = RoomSpecification(length_m=5.0, width_m=4.0)
+        material = FlooringMaterial(
+            name="Tile", material_type="tile", unit_cost=3, unit_measurement="piece",
+            units_per_box=8, width_cm=30, length_cm=60
+        )
+        pattern = LayingPattern(pattern_type=PatternType.STRAIGHT, description="Straight")
+
+        plain = LayoutCalculator.simulate_layout(room, material, pattern)
+        reused = LayoutCalculator.simulate_layout(room, material, pattern, reuse_offcuts=True)
+        assert reused['reused_offcuts'] > 0
+        assert reused['pieces_required'] == plain['pieces_required'] - reused['reused_offcuts']
+        assert reused['offcut_area_m2'] < plain['offcut_area_m2']
+
+        before = MaterialCalculator.calculate_material_needed(20.0, material, pattern, layout=plain)
+        after = MaterialCalculator.calculate_material_needed(20.0, material, pattern, layout=reused)
+        assert after['quantity_units'] < before['quantity_units']
+        assert after['boxes_needed'] <= before['boxes_needed']
+        assert after['quantity_units'] * material.get_area_per_unit() >= reused['covered_area_m2']
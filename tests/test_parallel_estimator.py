@@ -0,0 +1,83 @@
+"""Unit tests for the process-pool estimate runner"""
+
+import pytest
+from src.models import FlooringMaterial, LayingPattern, RoomSpecification, RoomTable, PatternType
+from src.calculators import AreaCalculator, CostCalculator, ParallelEstimator, WasteCalculator
+
+
+MATERIALS = [
+    FlooringMaterial(name="Ceramic", material_type="tile", unit_cost=25,
+                     unit_measurement="m2", width_cm=30, length_cm=60, waste_factor=0.10),
+    FlooringMaterial(name="Oak", material_type="wood", unit_cost=4.5,
+                     unit_measurement="piece", units_per_box=10,
+                     width_cm=18, length_cm=120, waste_factor=0.15),
+]
+PATTERNS = [
+    LayingPattern(pattern_type=PatternType.STRAIGHT, description="Straight",
+                  grout_consumption_kg_per_m2=1.8),
+]
+
+
+def make_rooms(count):
+    rooms = []
+    for i in range(count):
+        if i % 3 == 0:
+            rooms.append(RoomSpecification.from_vertices(
+                [(0, 0), (6, 0), (6, 3), (3, 3), (3, 5 + i % 4), (0, 5 + i % 4)]
+            ))
+        else:
+            rooms.append(RoomSpecification(length_m=3 + i % 5, width_m=2.5 + i % 3,
+                                           additional_area_m2=0.5 * (i % 2)))
+    return rooms
+
+
+class TestParallelEstimator:
+    """Test sharded estimates"""
+
+    def test_matches_per_room_calculators(self):
+        """Test each room against the scalar calculator chain"""
+        rooms = make_rooms(12)
+        material_indices = [i % 2 for i in range(12)]
+        result = ParallelEstimator.estimate_rooms(
+            rooms, MATERIALS, PATTERNS, material_indices, 0,
+            labor_cost_per_m2=15.0, additional_costs=30.0, workers=1
+        )
+        for i, room in enumerate(rooms):
+            area = AreaCalculator.calculate_room_area(room)
+            material = MATERIALS[material_indices[i]]
+            cost = CostCalculator.calculate_total_project_cost(area, material, PATTERNS[0], 15.0, 30.0)
+            waste, _ = WasteCalculator.calculate_waste_quantity(area, material, PATTERNS[0])
+            assert result['rooms']['area_m2'][i] == pytest.approx(area)
+            assert result['rooms']['total_cost'][i] == pytest.approx(cost['total_cost'])
+            assert result['rooms']['total_waste_m2'][i] == pytest.approx(waste)
+
+    def test_pool_matches_serial(self):
+        """Test that sharding across processes does not change any result"""
+        rooms = make_rooms(60)
+        material_indices = [i % 2 for i in range(60)]
+        serial = ParallelEstimator.estimate_rooms(
+            rooms, MATERIALS, PATTERNS, material_indices, 0, 15.0, 30.0, workers=1
+        )
+        pooled = ParallelEstimator.estimate_rooms(
+            rooms, MATERIALS, PATTERNS, material_indices, 0, 15.0, 30.0, workers=2, chunk_size=7
+        )
+        assert pooled['totals'] == serial['totals']
+        for key, column in serial['rooms'].items():
+            assert (pooled['rooms'][key] == column).all()
+
+    def test_room_table_input(self):
+        """Test that a prebuilt RoomTable gives the same result as the rooms, in any chunking"""
+        rooms = make_rooms(30)
+        material_indices = [i % 2 for i in range(30)]
+        expected = ParallelEstimator.estimate_rooms(rooms, MATERIALS, PATTERNS, material_indices, workers=1)
+        result = ParallelEstimator.estimate_rooms(RoomTable.from_rooms(rooms), MATERIALS, PATTERNS,
+                                                  material_indices, workers=1, chunk_size=4)
+        assert result['totals'] == expected['totals']
+        for key, column in expected['rooms'].items():
+            assert (result['rooms'][key] == column).all()
+
+    def test_empty_building(self):
+        """Test that no rooms yields zero totals"""
+        result = ParallelEstimator.estimate_rooms([], MATERIALS, PATTERNS)
+        assert result['totals']['rooms'] == 0
+        assert result['totals']['total_cost'] == 0
@@ -0,0 +1,87 @@
+"""Unit tests for the built-in pattern library"""
+
+import io
+
+import numpy as np
+from src.models import PatternLibrary, PatternType
+from src.models.pattern_library import MATERIAL_TYPES, PATTERN_LIBRARY, WASTE_TABLE
+from src.utils.room_schedule import RoomSchedule
+
+import cli
+
+
+class TestPatternLibrary:
+    """Test default patterns and the coefficient table"""
+
+    def test_every_pattern_has_defaults(self):
+        """Test that the library and the table cover every PatternType"""
+        assert set(PATTERN_LIBRARY) == set(PatternType)
+        assert WASTE_TABLE.shape == (len(PatternType), len(MATERIAL_TYPES), 4)
+        for pattern_type in PatternType:
+            pattern = PatternLibrary.pattern(pattern_type)
+            assert pattern.additional_waste_percentage > 0
+            assert pattern.grout_consumption_kg_per_m2 > 0
+
+    def test_overrides_and_grout(self):
+        """Test that overrides replace defaults and grout follows the material type"""
+        pattern = PatternLibrary.pattern(PatternType.HERRINGBONE, 'wood', additional_waste_percentage=0.0)
+        assert pattern.additional_waste_percentage == 0.0
+        assert pattern.grout_consumption_kg_per_m2 is None
+        assert pattern.difficulty_level == 'hard'
+        tile = PatternLibrary.pattern(PatternType.HERRINGBONE, 'Tile', grout_consumption_kg_per_m2=None)
+        assert tile.grout_consumption_kg_per_m2 == 2.0
+        assert PatternLibrary.pattern(PatternType.STRAIGHT, 'tile') is PatternLibrary.pattern(PatternType.STRAIGHT)
+
+    def test_pattern_matches_table(self):
+        """Test that single patterns take the table coefficient of their material and piece size"""
+        # Straight-laid vinyl planks, 20 x 150 cm: long plank bucket, vinyl column
+        vinyl = PatternLibrary.pattern(PatternType.STRAIGHT, 'vinyl', 20.0, 150.0)
+        table = PatternLibrary.pattern_table([PatternType.STRAIGHT], ['vinyl'], [20.0], [150.0])
+        assert vinyl.additional_waste_percentage == table.additional_waste_percentage[0]
+        for p, pattern_type in enumerate(PatternType):
+            for m, material_type in enumerate(MATERIAL_TYPES):
+                for size, bucket in (((30, 30), 0), ((20, 40), 1), ((20, 100), 2), ((9, 120), 3)):
+                    pattern = PatternLibrary.pattern(pattern_type, material_type, *size)
+                    assert pattern.additional_waste_percentage == WASTE_TABLE[p, m, bucket]
+
+    def test_pattern_table(self):
+        """Test table lookups against the library defaults and the aspect buckets"""
+        patterns = [PatternType.DIAGONAL, PatternType.DIAGONAL, PatternType.RANDOM]
+        table = PatternLibrary.pattern_table(patterns, ['tile', 'wood', 'carpet'],
+                                             [30.0, 9.0, np.nan], [30.0, 120.0, np.nan])
+        np.testing.assert_allclose(table.additional_waste_percentage, [12.0, 12.0 * 1.3, 15.0])
+        np.testing.assert_allclose(table.grout_kg_per_m2, [1.8, 0.0, 0.0])
+
+        square = PatternLibrary.pattern(PatternType.DIAGONAL)
+        assert square.additional_waste_percentage == WASTE_TABLE[1, 0, 0]
+        np.testing.assert_array_equal(PatternLibrary.aspect_bucket([10, 20, 20, 10, 0], [10, 40, 60, 70, 50]), [0, 1, 2, 3, 0])
+
+
+class TestPatternDefaults:
+    """Test that the CLI and schedules start from the library"""
+
+    def test_cli_pattern_waste(self):
+        """Test that a pattern without --pattern-waste gets its default waste"""
+        args = cli.build_parser().parse_args(
+            ['--length', '4', '--width', '3', '--unit-cost', '20', '--material-type', 'wood',
+             '--pattern', 'herringbone'])
+        report = cli.run_from_args(args)
+        assert 'Waste Factor: 11.2%' in report
+
+    def test_schedule_defaults(self):
+        """Test library defaults and explicit values in schedule rows"""
+        stream = io.StringIO('length,width,material_type,pattern,pattern_waste\n'
+                             '4,3,tile,chevron,\n4,3,vinyl,chevron,0\n')
+        first, second = RoomSchedule.read(stream, 'csv', {}, lambda *row: None)
+        assert first.pattern.additional_waste_percentage == 15.0
+        assert first.pattern.grout_consumption_kg_per_m2 == 2.0
+        assert second.pattern.additional_waste_percentage == 0.0
+        assert second.pattern.grout_consumption_kg_per_m2 is None
+
+    def test_schedule_uses_piece_size(self):
+        """Test that schedule rows get the coefficient of their piece size"""
+        stream = io.StringIO('length,width,material_type,pattern,width_cm,length_cm\n'
+                             '4,3,vinyl,straight,20,150\n4,3,vinyl,straight,,\n')
+        planks, unknown = RoomSchedule.read(stream, 'csv', {}, lambda *row: None)
+        assert planks.pattern.additional_waste_percentage == WASTE_TABLE[0, MATERIAL_TYPES.index('vinyl'), 3] == 4.8
+        assert unknown.pattern.additional_waste_percentage == WASTE_TABLE[0, MATERIAL_TYPES.index('vinyl'), 0]
@@ -0,0 +1,78 @@
+"""Unit tests for the row-by-row plank sequencer"""
+
+import pytest
+from src.models import FlooringMaterial, LayingPattern, RoomSpecification, PatternType
+from src.calculators import EstimatePipeline, LayoutCalculator, MaterialCalculator, PlankSequencer
+
+
+def make_oak():
+    return FlooringMaterial(
+        name="Oak Plank", material_type="wood",
+        unit_cost=45, unit_measurement="m2",
+        width_cm=18, length_cm=120, waste_factor=0.15
+    )
+
+
+def make_pattern():
+    return LayingPattern(pattern_type=PatternType.STRAIGHT, description="Straight", joints_width_mm=0)
+
+
+class TestPlankSequencer:
+    """Test plank sequencing with offcut carry-over"""
+
+    def test_exact_rows_use_whole_planks(self):
+        """Test a room whose rows are exact plank multiples"""
+        room = RoomSpecification(length_m=3.6, width_m=1.8)
+        result = PlankSequencer.sequence_room(room, make_oak(), make_pattern(), min_stagger_m=0)
+        assert result['pieces_required'] == 30
+        assert result['offcut_area_m2'] == pytest.approx(0.0, abs=1e-9)
+
+    def test_offcuts_start_later_rows(self):
+        """Test that row-end offcuts are carried over"""
+        room = RoomSpecification(length_m=4.0, width_m=3.5)
+        result = PlankSequencer.sequence_room(room, make_oak(), make_pattern())
+        assert result['reused_offcuts'] > 0
+        assert result['covered_area_m2'] == pytest.approx(14.0)
+        assert result['pieces_required'] * result['piece_area_m2'] >= result['covered_area_m2']
+        assert result['waste_percentage'] < 15
+
+    def test_rooms_share_offcuts(self):
+        """Test that sequencing rooms together never needs more planks"""
+        rooms = [
+            RoomSpecification(length_m=4.0, width_m=3.5),
+            RoomSpecification.from_vertices([(0, 0), (6, 0), (6, 3), (3, 3), (3, 5), (0, 5)]),
+        ]
+        separate = sum(
+            PlankSequencer.sequence_room(room, make_oak(), make_pattern())['pieces_required']
+            for room in rooms
+        )
+        together = PlankSequencer.sequence_rooms(rooms, make_oak(), make_pattern())
+        assert len(together['rooms']) == 2
+        assert together['pieces_required'] <= separate
+        assert together['covered_area_m2'] == pytest.approx(38.0)
+
+    def test_wood_layout_feeds_material_calculator(self):
+        """Test that wood layouts replace the flat waste factor"""
+        room = RoomSpecification(length_m=4.0, width_m=3.5)
+        layout = LayoutCalculator.simulate_layout(room, make_oak(), make_pattern())
+        assert 'reused_offcuts' in layout
+
+        flat = MaterialCalculator.calculate_material_needed(14.0, make_oak(), make_pattern())
+        exact = MaterialCalculator.calculate_material_needed(14.0, make_oak(), make_pattern(), layout=layout)
+        assert exact['quantity_units'] == layout['pieces_required']
+        assert exact['area_needed_m2'] < flat['area_needed_m2']
+
+    def test_pipeline_sequences_wood_by_default(self):
+        """Test that estimates of wood with a known plank size use the sequencer"""
+        room = RoomSpecification(length_m=4.0, width_m=3.5)
+        estimate = EstimatePipeline.run(room, make_oak(), make_pattern())
+        layout = PlankSequencer.sequence_room(room, make_oak(), make_pattern())
+        assert estimate['layout'] == layout
+        assert estimate.material_info == MaterialCalculator.calculate_material_needed(
+            14.0, make_oak(), make_pattern(), layout=layout)
+        assert estimate.waste[1]['waste_percentage'] == pytest.approx(layout['waste_percentage'])
+
+        # Without a plank size the flat factor still applies
+        vague = make_oak()
+        vague.width_cm = None
+        assert EstimatePipeline.run(room, vague, make_pattern())['layout'] is None
@@ -0,0 +1,95 @@
+"""Unit tests for price books and repricing"""
+
+import json
+
+import numpy as np
+import pytest
+from src.models import (ConsumableRates, FlooringMaterial, LayingPattern, PatternType, PriceBook,
+                        RoomSpecification)
+from src.calculators import CostCalculator, EstimatePipeline, ParallelEstimator, ProjectEstimate
+
+BOOK = {
+    'version': '2025-03',
+    'default': {'grout_price_per_kg': 3.0},
+    'rates': [
+        {'material_type': 'wood', 'adhesive_kg_per_m2': 1.0, 'adhesive_price_per_kg': 4.0},
+        {'region': 'nordic', 'sealer_price_per_liter': 20},
+        {'material_type': 'wood', 'region': 'nordic', 'adhesive_price_per_kg': 5.0},
+    ],
+}
+
+TILE = FlooringMaterial(name="Tile", material_type="tile", unit_cost=25, unit_measurement="m2")
+OAK = FlooringMaterial(name="Oak", material_type="wood", unit_cost=40, unit_measurement="m2")
+GROUTED = LayingPattern(pattern_type=PatternType.STRAIGHT, description="Straight",
+                        grout_consumption_kg_per_m2=1.8)
+
+
+class TestPriceBook:
+    """Test rate lookup"""
+
+    def test_most_specific_entry_wins(self):
+        """Test merging defaults, region, material type and both"""
+        book = PriceBook.from_dict(BOOK)
+        rates = book.rates('wood', 'nordic')
+        assert rates == ConsumableRates(grout_price_per_kg=3.0, adhesive_price_per_kg=5.0,
+                                        sealer_price_per_liter=20.0, adhesive_kg_per_m2=1.0)
+        assert book.rates('tile') == ConsumableRates(grout_price_per_kg=3.0)
+        assert book.rates('wood', 'nordic') is rates
+
+    def test_invalid_rates(self):
+        """Test that unknown fields and negative rates are rejected"""
+        with pytest.raises(ValueError):
+            PriceBook.from_dict({'version': '1', 'default': {'glue_price': 1}})
+        with pytest.raises(ValueError):
+            PriceBook.from_dict({'version': '1', 'rates': [{'sealer_price_per_liter': -1}]})
+
+    def test_load_once(self, tmp_path):
+        """Test that a file is parsed once until it changes"""
+        path = tmp_path / 'prices.json'
+        path.write_text(json.dumps(BOOK), encoding='utf-8')
+        assert PriceBook.load(path) is PriceBook.load(path)
+        assert PriceBook.load(path).version == '2025-03'
+
+
+class TestRepricing:
+    """Test rates in the calculators and repricing without recomputing quantities"""
+
+    def test_pipeline_recomputes_only_costs(self):
+        """Test that new rates drop only consumables and cost"""
+        book = PriceBook.from_dict(BOOK)
+        room = RoomSpecification(length_m=5, width_m=4)
+        estimate = EstimatePipeline.run(room, OAK, GROUTED, 10.0)
+        material_info = estimate.material_info
+        estimate.update(rates=book.rates('wood'))
+        assert estimate.material_info is material_info
+        expected = CostCalculator.calculate_total_project_cost(20.0, OAK, GROUTED, 10.0, rates=book.rates('wood'))
+        assert estimate.cost == expected
+        assert estimate.cost.consumable_cost == pytest.approx(20 * 1.8 * 3.0 + 20 * 1.0 * 4.0 + 2 * 15.0)
+
+    def test_project_price_book_version(self):
+        """Test switching book versions in an incremental project"""
+        rooms = [RoomSpecification(length_m=3 + i % 3, width_m=2 + i % 2) for i in range(10)]
+        project = ProjectEstimate(rooms, [TILE, OAK], [GROUTED], [i % 2 for i in range(10)], 0, 12.0)
+        project.refresh()
+        project.set_price_book(PriceBook.from_dict(BOOK), 'nordic')
+        assert project.refresh() == ('consumables', 'cost', 'totals')
+        book = PriceBook.from_dict(BOOK)
+        for i, room in enumerate(rooms):
+            material = [TILE, OAK][i % 2]
+            cost = CostCalculator.calculate_total_project_cost(
+                room.get_total_area(), material, GROUTED, 12.0,
+                rates=book.rates(material.material_type, 'nordic'))
+            assert project.columns['total_cost'][i] == pytest.approx(cost.total_cost)
+
+    def test_reprice_stored_batch(self):
+        """Test that repricing stored columns equals estimating with the new rates"""
+        book = PriceBook.from_dict(BOOK)
+        rooms = [RoomSpecification(length_m=2 + i, width_m=3) for i in range(6)]
+        indices = [i % 2 for i in range(6)]
+        stored = ParallelEstimator.estimate_rooms(rooms, [TILE, OAK], [GROUTED], indices, 0, 8.0, workers=1)
+        table = book.rate_table(['tile', 'wood'], 'nordic')
+        fresh = ParallelEstimator.estimate_rooms(rooms, [TILE, OAK], [GROUTED], indices, 0, 8.0,
+                                                 workers=1, rates=table)['rooms']
+        repriced = CostCalculator.reprice_batch(stored['rooms'], table.take(np.array(indices)))
+        assert np.allclose(repriced['total_cost'], fresh['total_cost'])
+        assert repriced['quantity_units'] is stored['rooms']['quantity_units']
@@ -0,0 +1,89 @@
+"""Unit tests for the stage profiler"""
+
+import io
+import os
+import pstats
+import subprocess
+import sys
+
+import pytest
+from src.calculators import AreaCalculator, EstimatePipeline
+from src.models import FlooringMaterial, PatternLibrary, PatternType, RoomSpecification
+from src.utils.profiler import ENTRY_POINTS, Profiler
+from src.utils.room_schedule import RoomSchedule
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _estimate():
+    material = FlooringMaterial(name="Tile", material_type="tile", unit_cost=25.0, unit_measurement="m2")
+    return EstimatePipeline.run(RoomSpecification(length_m=5, width_m=4), material,
+                                PatternLibrary.pattern(PatternType.DIAGONAL, 'tile'), 15.0).report_data()
+
+
+class TestProfiler:
+    """Test stage timings and installation"""
+
+    def test_counts_and_self_time(self):
+        """Test call counts, nesting and unchanged results"""
+        expected = _estimate()
+        with Profiler() as profiler:
+            assert _estimate() == expected
+            _estimate()
+        timings = {t.name: t for t in profiler.timings()}
+        assert timings['AreaCalculator.calculate_room_area'].calls == 2
+        assert timings['EstimatePipeline.run'].stage == 'estimate'
+        for t in timings.values():
+            assert 0 <= t.self_seconds <= t.total_seconds
+        # Every calculator runs inside the pipeline: self times add up to its total time
+        assert sum(t.self_seconds for t in timings.values()) == pytest.approx(
+            timings['EstimatePipeline.run'].total_seconds)
+        assert sum(profiler.stages().values()) <= profiler.wall_seconds
+        assert 'EstimatePipeline.run' in profiler.report()
+
+    def test_uninstall_restores_entry_points(self):
+        """Test that nothing stays wrapped outside the block"""
+        original = vars(AreaCalculator)['calculate_room_area']
+        with Profiler():
+            assert vars(AreaCalculator)['calculate_room_area'] is not original
+            with pytest.raises(RuntimeError):
+                Profiler().install()
+        assert vars(AreaCalculator)['calculate_room_area'] is original
+        with Profiler() as profiler:
+            pass
+        assert profiler.timings() == []
+
+    def test_generators(self):
+        """Test that a generator entry point counts one call and times only its own work"""
+        rows = 'length,width\n' + '3,2\n' * 10
+        with Profiler() as profiler:
+            parsed = list(RoomSchedule.read(io.StringIO(rows), 'csv', {}, lambda *args: None))
+        assert len(parsed) == 10
+        timings = {t.name: t for t in profiler.timings()}
+        assert timings['RoomSchedule.read'].calls == 1
+        assert timings['RoomSchedule.parse_row'].calls == 10
+        assert timings['RoomSchedule.read'].total_seconds >= timings['RoomSchedule.parse_row'].total_seconds
+
+    def test_every_entry_point_resolves(self):
+        """Test that ENTRY_POINTS names existing attributes"""
+        with Profiler() as profiler:
+            assert len(profiler._patched) == sum(len(targets) for targets in ENTRY_POINTS.values())
+
+    def test_dump_stats(self, tmp_path):
+        """Test the cProfile dump"""
+        path = str(tmp_path / 'estimate.pstats')
+        with Profiler(cprofile=True) as profiler:
+            _estimate()
+        profiler.dump_stats(path)
+        assert pstats.Stats(path).total_calls > 0
+        with pytest.raises(RuntimeError):
+            Profiler().dump_stats(path)
+
+    def test_cli_profile(self, tmp_path):
+        """Test that --profile prints the stage table to stderr and --profile-dump writes stats"""
+        path = str(tmp_path / 'cli.pstats')
+        proc = subprocess.run([sys.executable, 'cli.py', '--example', 'bedroom', '--profile', '--profile-dump', path],
+                              cwd=ROOT, capture_output=True, text=True, check=True)
+        assert 'TOTAL PROJECT COST' in proc.stdout
+        assert 'EstimatePipeline.run' in proc.stderr and 'wall' in proc.stderr
+        assert os.path.exists(path)
@@ -0,0 +1,71 @@
+"""Unit tests for incremental project estimates"""
+
+import pytest
+from src.models import FlooringMaterial, LayingPattern, RoomSpecification, PatternType
+from src.calculators import CostCalculator, ProjectEstimate
+
+
+@pytest.fixture
+def project():
+    rooms = [RoomSpecification(length_m=3 + i % 4, width_m=2.5 + i % 3) for i in range(40)]
+    materials = [
+        FlooringMaterial(name="Ceramic", material_type="tile", unit_cost=25, unit_measurement="m2",
+                         width_cm=30, length_cm=60, waste_factor=0.10),
+        FlooringMaterial(name="Oak", material_type="wood", unit_cost=4.5, unit_measurement="piece",
+                         units_per_box=10, width_cm=18, length_cm=120, waste_factor=0.15),
+    ]
+    patterns = [
+        LayingPattern(pattern_type=PatternType.STRAIGHT, description="Straight",
+                      grout_consumption_kg_per_m2=1.8),
+        LayingPattern(pattern_type=PatternType.DIAGONAL, description="Diagonal",
+                      additional_waste_percentage=10),
+    ]
+    return ProjectEstimate(rooms, materials, patterns, [i % 2 for i in range(40)], 0,
+                           labor_cost_per_m2=15.0, additional_costs=30.0)
+
+
+def assert_matches_scalar(project):
+    columns = project.columns
+    for i, room in enumerate(project.rooms):
+        cost = CostCalculator.calculate_total_project_cost(
+            room.get_total_area(), project.materials[project.material_indices[i]],
+            project.patterns[project.pattern_indices[i]],
+            project.labor_cost_per_m2[i], project.additional_costs[i],
+        )
+        assert columns['total_cost'][i] == pytest.approx(cost['total_cost'])
+
+
+class TestProjectEstimate:
+    """Test dirty-flag propagation"""
+
+    def test_initial_and_repeated_reads(self, project):
+        """Test that the first read computes everything and a second read nothing"""
+        assert_matches_scalar(project)
+        assert project.last_recomputed == ('area', 'waste', 'material', 'consumables', 'cost', 'totals')
+        project.totals
+        assert project.last_recomputed == ()
+
+    def test_price_change_recomputes_cost_only(self, project):
+        """Test labor and unit cost edits"""
+        before = project.totals['total_cost']
+        project.set_labor_rate(20.0)
+        project.update_material(0, unit_cost=30)
+        after = project.totals['total_cost']
+        assert project.last_recomputed == ('cost', 'totals')
+        assert after > before
+        assert_matches_scalar(project)
+
+    def test_structural_edits(self, project):
+        """Test pattern, assignment and room edits against a full recomputation"""
+        project.totals
+        project.update_pattern(0, grout_consumption_kg_per_m2=2.5)
+        project.totals
+        assert project.last_recomputed == ('consumables', 'cost', 'totals')
+        project.assign([0, 1, 2], pattern_index=1)
+        project.set_room(5, RoomSpecification(length_m=10, width_m=10))
+        project.totals
+        assert 'area' not in project.last_recomputed
+        assert project.columns['area_m2'][5] == 100.0
+        assert_matches_scalar(project)
+        with pytest.raises(ValueError):
+            project.update_material(0, colour='red')
@@ -0,0 +1,96 @@
+"""Unit tests for report generation and CSV export"""
+
+import csv
+import io
+import zipfile
+from datetime import datetime
+
+from src.models import EstimateResult
+from src.utils.report_generator import ReportGenerator
+
+
+def _result(room_name: str, total_cost: float = 460.0) -> EstimateResult:
+    return EstimateResult(room_name, 12.5, "Tile", 13.75, "m2", 10.0, "straight", "Straight",
+                          300.0, 120.0, 40.0, total_cost, total_cost / 12.5, 1)
+
+
+class TestCsvExport:
+    """Test streaming CSV export"""
+
+    def test_export_formats_rows(self):
+        """Test header, number formatting and defaults for missing values"""
+        lines = ReportGenerator.export_to_csv([_result("Kitchen"), {'room_name': 'Hall', 'total_cost': 5}])
+        assert lines.splitlines() == [
+            'Room,Area_m2,Material,Quantity,Waste%,Total_Cost,Cost_per_m2',
+            'Kitchen,12.50,Tile,13.75,10.0,460.00,36.80',
+            'Hall,0.00,N/A,0.00,0.0,5.00,0.00',
+        ]
+
+    def test_names_are_quoted(self):
+        """Test that separators, quotes and newlines in names round-trip"""
+        name = 'Living, "open"\nplan'
+        rows = list(csv.reader(io.StringIO(ReportGenerator.export_to_csv([_result(name)]))))
+        assert len(rows) == 2
+        assert rows[1][0] == name
+
+    def test_streams_iterator_in_chunks(self, tmp_path):
+        """Test that a generator is written to a path a chunk at a time"""
+        consumed = []
+
+        def results():
+            for i in range(10):
+                consumed.append(i)
+                yield _result(f"Room {i}", total_cost=i)
+
+        path = tmp_path / 'rooms.csv'
+        assert ReportGenerator.write_csv(results(), path, chunk_rows=3) == 10
+        assert consumed == list(range(10))
+        rows = list(csv.reader(path.open(newline='')))
+        assert len(rows) == 11
+        assert rows[-1][0] == 'Room 9'
+        assert rows[-1][5] == '9.00'
+
+    def test_custom_columns(self):
+        """Test full-precision columns with an empty default"""
+        out = io.StringIO()
+        columns = (('room', 'room_name', '', ''), ('cost', 'total_cost', '', ''))
+        ReportGenerator.write_csv([_result("A", 1.125), {'total_cost': 2}], out, columns)
+        assert out.getvalue() == 'room,cost\nA,1.125\n,2\n'
+
+
+class TestBulkReports:
+    """Test rendering and writing many reports"""
+
+    def test_template_matches_single_report(self):
+        """Test that bulk rendering produces the same text as generate_project_report"""
+        result = _result("Kitchen")
+        generated = datetime(2024, 5, 1, 9, 30)
+        report = ReportGenerator.generate_project_report("Kitchen", result)
+        rendered, = ReportGenerator.render_reports([result], generated=generated)
+        assert 'Generated: 2024-05-01 09:30:00' in rendered
+        without_time = lambda text: [line for line in text.splitlines() if not line.startswith('Generated:')]
+        assert without_time(rendered) == without_time(report)
+        assert 'Quantity Needed: 13.75 m2' in rendered
+
+    def test_defaults_for_missing_values(self):
+        """Test that absent keys fall back to the report defaults"""
+        rendered, = ReportGenerator.render_reports([{'room_name': 'Hall'}])
+        assert 'Room: Hall' in rendered
+        assert 'Quantity Needed: 0.00 units' in rendered
+
+    def test_write_directory(self, tmp_path):
+        """Test one file per result, named by position and room"""
+        results = (_result(f"Room {i}/B") for i in range(5))
+        assert ReportGenerator.write_reports(results, tmp_path, workers=2, chunk_rows=2) == 5
+        names = sorted(p.name for p in tmp_path.iterdir())
+        assert names[0] == '000000_Room_0_B.txt'
+        assert len(names) == 5
+        assert 'Room: Room 4/B' in (tmp_path / '000004_Room_4_B.txt').read_text(encoding='utf-8')
+
+    def test_write_zip(self, tmp_path):
+        """Test writing every report into one archive"""
+        path = tmp_path / 'reports.zip'
+        assert ReportGenerator.write_reports([_result("A"), _result("B")], path) == 2
+        with zipfile.ZipFile(path) as archive:
+            assert archive.namelist() == ['000000_A.txt', '000001_B.txt']
+            assert 'Room: B' in archive.read('000001_B.txt').decode('utf-8')
@@ -0,0 +1,57 @@
+"""Unit tests for result records and batches"""
+
+import sys
+
+import pytest
+from src.models import (CostResult, FlooringMaterial, LayingPattern, MaterialResult, PatternType,
+                        ResultBatch)
+from src.calculators import CostCalculator, MaterialCalculator
+
+
+class TestResultRecords:
+    """Test record field and mapping access"""
+
+    def test_material_record(self):
+        """Test attribute, key and dict access on a calculator result"""
+        material = FlooringMaterial(name="Tile", material_type="tile", unit_cost=25,
+                                    unit_measurement="m2", waste_factor=0.10)
+        pattern = LayingPattern(pattern_type=PatternType.STRAIGHT, description="Straight")
+        result = MaterialCalculator.calculate_material_needed(100, material, pattern)
+        assert isinstance(result, MaterialResult)
+        assert result.quantity_units == result['quantity_units'] == pytest.approx(110)
+        assert result.as_dict()['unit_measurement'] == 'm2'
+        assert sys.getsizeof(result) < sys.getsizeof(result.as_dict())
+
+    def test_missing_grout_is_not_a_key(self):
+        """Test that not applicable fields behave like absent dict keys"""
+        pattern = LayingPattern(pattern_type=PatternType.STRAIGHT, description="Straight")
+        consumables = MaterialCalculator.calculate_consumables(10, pattern)
+        assert consumables.grout_kg is None
+        assert 'grout_kg' not in consumables
+        assert consumables.get('grout_kg', 0) == 0
+        assert [key for key, _ in consumables.items()] == ['adhesive_kg', 'sealer_liters']
+        with pytest.raises(KeyError):
+            consumables['grout_kg']
+
+
+class TestResultBatch:
+    """Test struct-of-arrays access"""
+
+    def test_rows_match_scalar_records(self):
+        """Test that batch rows equal the scalar cost records"""
+        materials = [FlooringMaterial(name="Tile", material_type="tile", unit_cost=25,
+                                      unit_measurement="m2", width_cm=30, length_cm=60)]
+        patterns = [LayingPattern(pattern_type=PatternType.STRAIGHT, description="Straight",
+                                  grout_consumption_kg_per_m2=1.8)]
+        areas = [20.0, 12.5, 7.25]
+        batch = CostCalculator.calculate_portfolio_cost(areas, 0, 0, materials, patterns, 15.0, 50.0)
+
+        assert isinstance(batch, ResultBatch)
+        assert len(batch) == 3
+        rows = list(batch)
+        for area, row in zip(areas, rows):
+            assert isinstance(row, CostResult)
+            assert row == CostCalculator.calculate_total_project_cost(area, materials[0], patterns[0], 15.0, 50.0)
+        assert batch[1] == rows[1]
+        assert list(batch[1:]['area_m2']) == [12.5, 7.25]
+        assert 'boxes_needed' in batch
@@ -0,0 +1,78 @@
+"""Unit tests for streaming room schedule estimates"""
+
+import csv
+import io
+import json
+
+import pytest
+import cli
+from src.calculators import EstimatePipeline, ParallelEstimator
+from src.utils.room_schedule import RoomSchedule
+
+
+SCHEDULE = """room_name,length,width,material_name,unit_cost,width_cm,length_cm,pattern,labor
+"Kitchen, ground floor",5,4,Ceramic,25.5,30,60,straight,15
+Hall,3,2,Ceramic,25.5,30,60,diagonal,15
+Broken,abc,2,Ceramic,25.5,30,60,straight,15
+Study,4,3.5,,,,,herringbone,
+Loft,2,2,Ceramic,25.5,30,60,zigzag,15
+"""
+
+
+class TestRoomSchedule:
+    """Test schedule parsing and the chunked estimate stream"""
+
+    def test_rows_and_rejects(self):
+        """Test that malformed rows are rejected without stopping the stream"""
+        rejects = []
+        rows = list(RoomSchedule.read(io.StringIO(SCHEDULE), 'csv', {'unit_cost': 40.0},
+                                      lambda *reject: rejects.append(reject)))
+        assert [row.room.room_name for row in rows] == ["Kitchen, ground floor", "Hall", "Study"]
+        assert [(line, error) for line, _, error in rejects] == [
+            (4, "invalid length: 'abc'"), (6, "unknown pattern: 'zigzag'")
+        ]
+        assert rows[0].material is rows[1].material
+        assert rows[2].material.unit_cost == 40.0
+
+    def test_stream_matches_pipeline(self):
+        """Test chunked estimates against the single-room pipeline"""
+        rows = list(RoomSchedule.read(io.StringIO(SCHEDULE), 'csv', {}, lambda *reject: None))
+        results = list(ParallelEstimator.estimate_stream(rows, chunk_size=2))
+        assert len(results) == 3
+        for row, result in zip(rows, results):
+            estimate = EstimatePipeline.run(row.room, row.material, row.pattern,
+                                            row.labor_cost_per_m2, row.additional_costs)
+            for key, value in estimate.report_data().items():
+                assert result[key] == pytest.approx(value)
+
+    def test_stream_lays_out_wood_like_pipeline(self):
+        """Test that wood rooms are priced from the same layout as single estimates"""
+        schedule = "room_name,length,width,pattern\nBedroom,4,3.5,herringbone\nHall,3,2,straight\n"
+        defaults = {'material_type': 'wood', 'unit_cost': 45.0, 'width_cm': 9, 'length_cm': 120}
+        rows = list(RoomSchedule.read(io.StringIO(schedule), 'csv', defaults, lambda *reject: None))
+        results = list(ParallelEstimator.estimate_stream(rows))
+        for row, result in zip(rows, results):
+            assert EstimatePipeline.simulates(row.room, row.material)
+            estimate = EstimatePipeline.run(row.room, row.material, row.pattern)
+            assert estimate['layout'] is not None
+            assert result == estimate.report_data()
+
+    def test_jsonl_batch_cli(self, tmp_path):
+        """Test the --batch mode end to end with a polygon room"""
+        source = tmp_path / "rooms.jsonl"
+        source.write_text(
+            json.dumps({"room_name": "L", "vertices": [[0, 0], [6, 0], [6, 3], [3, 3], [3, 5], [0, 5]]})
+            + "\n{not json\n"
+        )
+        output = tmp_path / "out.csv"
+        args = cli.build_parser().parse_args(
+            ['--batch', str(source), '--output', str(output), '--unit-cost', '20']
+        )
+        summary = cli.run_batch(args)
+
+        assert summary['rooms'] == 1 and summary['rejected'] == 1
+        with open(output, newline='') as fh:
+            rows = list(csv.DictReader(fh))
+        assert float(rows[0]['area_m2']) == pytest.approx(24.0)
+        reject = json.loads((tmp_path / "rooms.jsonl.rejects.jsonl").read_text())
+        assert reject['line'] == 2
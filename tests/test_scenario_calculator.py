@@ -0,0 +1,86 @@
+"""Unit tests for the scenario sweep engine"""
+
+import itertools
+import pytest
+from src.models import FlooringMaterial, LayingPattern, PatternType, PriceBook
+from src.calculators import CostCalculator, ScenarioCalculator
+
+
+MATERIALS = [
+    FlooringMaterial(name="Ceramic", material_type="tile", unit_cost=25,
+                     unit_measurement="m2", width_cm=30, length_cm=60, waste_factor=0.10),
+    FlooringMaterial(name="Mosaic", material_type="tile", unit_cost=0.45,
+                     unit_measurement="piece", units_per_box=100,
+                     width_cm=10, length_cm=10, waste_factor=0.12),
+    FlooringMaterial(name="Oak", material_type="wood", unit_cost=45,
+                     unit_measurement="m2", width_cm=18, length_cm=120, waste_factor=0.15),
+]
+PATTERNS = [
+    LayingPattern(pattern_type=PatternType.STRAIGHT, description="Straight",
+                  grout_consumption_kg_per_m2=1.8),
+    LayingPattern(pattern_type=PatternType.DIAGONAL, description="Diagonal",
+                  additional_waste_percentage=15),
+    LayingPattern(pattern_type=PatternType.HERRINGBONE, description="Herringbone",
+                  additional_waste_percentage=40),
+]
+LABOR = [22.0, 15.0, 18.5]
+
+
+def brute_force(area, additional, max_waste_percent=None, book=None):
+    options = []
+    for (mi, material), (pi, pattern), (li, labor) in itertools.product(
+            enumerate(MATERIALS), enumerate(PATTERNS), enumerate(LABOR)):
+        if max_waste_percent is not None and \
+                pattern.get_total_waste_factor(material.waste_factor) * 100 > max_waste_percent:
+            continue
+        rates = book.rates(material.material_type) if book else None
+        cost = CostCalculator.calculate_total_project_cost(area, material, pattern, labor, additional, rates=rates)
+        options.append((cost['total_cost'], mi, pi, li))
+    return sorted(options)
+
+
+class TestScenarioCalculator:
+    """Test top-k option selection"""
+
+    def test_top_k_matches_brute_force(self):
+        """Test that the sweep returns the cheapest options in order"""
+        areas = [20.0, 7.5, 42.0]
+        result = ScenarioCalculator.cheapest_options(
+            areas, MATERIALS, PATTERNS, LABOR, additional_costs=50.0, k=4, chunk_elements=10
+        )
+        for i, area in enumerate(areas):
+            expected = brute_force(area, 50.0)[:4]
+            assert list(result['total_cost'][i]) == [e[0] for e in expected]
+            assert list(result['material_index'][i]) == [e[1] for e in expected]
+            assert list(result['pattern_index'][i]) == [e[2] for e in expected]
+            assert list(result['labor_index'][i]) == [e[3] for e in expected]
+
+    def test_waste_cap_excludes_options(self):
+        """Test cheapest options under a waste cap"""
+        result = ScenarioCalculator.cheapest_options(
+            [20.0], MATERIALS, PATTERNS, LABOR, k=30, max_waste_percent=12
+        )
+        expected = brute_force(20.0, 0.0, max_waste_percent=12)
+        feasible = result['material_index'][0] >= 0
+
+        assert feasible.sum() == len(expected)
+        assert (result['waste_percent'][0][feasible] <= 12).all()
+        assert list(result['total_cost'][0][feasible]) == pytest.approx([e[0] for e in expected])
+
+    def test_price_book_rates(self):
+        """Test that per-material rates rank and price options like the scalar path"""
+        book = PriceBook.from_dict({'version': '1', 'rates': [
+            {'material_type': 'tile', 'grout_price_per_kg': 40.0, 'adhesive_kg_per_m2': 4.0},
+            {'material_type': 'wood', 'adhesive_price_per_kg': 0.0, 'sealer_price_per_liter': 1.0},
+        ]})
+        rates = book.rate_table([m.material_type for m in MATERIALS])
+        result = ScenarioCalculator.cheapest_options(
+            [20.0, 7.5], MATERIALS, PATTERNS, LABOR, additional_costs=50.0, k=5, chunk_elements=10, rates=rates
+        )
+        for i, area in enumerate([20.0, 7.5]):
+            expected = brute_force(area, 50.0, book=book)[:5]
+            assert list(result['total_cost'][i]) == [e[0] for e in expected]
+            assert list(result['material_index'][i]) == [e[1] for e in expected]
+            assert list(result['pattern_index'][i]) == [e[2] for e in expected]
+        assert list(result['total_cost'][0]) != list(ScenarioCalculator.cheapest_options(
+            [20.0], MATERIALS, PATTERNS, LABOR, additional_costs=50.0, k=5)['total_cost'][0])
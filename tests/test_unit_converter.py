@@ -0,0 +1,64 @@
+"""Unit tests for unit conversion and imperial inputs"""
+
+import io
+
+import numpy as np
+import pytest
+from src.catalog import MaterialCatalog
+from src.utils.room_schedule import RoomSchedule
+from src.utils.unit_converter import UnitConverter
+
+
+class TestUnitConverter:
+    """Test column conversion and length parsing"""
+
+    def test_convert_columns(self):
+        """Test whole-array conversion between length and area units"""
+        np.testing.assert_allclose(UnitConverter.convert_length([1, 10, np.nan], 'ft'), [0.3048, 3.048, np.nan])
+        np.testing.assert_allclose(UnitConverter.convert_length([12], 'in', 'cm'), [30.48])
+        assert UnitConverter.area_factor('sq ft') == pytest.approx(0.09290304)
+        metres = np.array([1.0, 2.0])
+        assert UnitConverter.convert_length(metres, 'M') is metres
+
+    def test_parse_length(self):
+        """Test plain numbers in a unit and text with its own units"""
+        assert UnitConverter.parse_length('4', 'ft') == pytest.approx(1.2192)
+        assert UnitConverter.parse_length('12ft 6in') == pytest.approx(3.81)
+        assert UnitConverter.parse_length('12\' 6"') == pytest.approx(3.81)
+        assert UnitConverter.parse_length('3.5 m', 'ft') == 3.5
+        assert UnitConverter.parse_length('30 cm', to_unit='mm') == pytest.approx(300)
+        for value in ('', '12 6', '3 furlongs', None):
+            with pytest.raises(ValueError):
+                UnitConverter.parse_length(value)
+        with pytest.raises(ValueError, match='Unknown length unit'):
+            UnitConverter.length_factor('furlong')
+
+
+class TestImperialInputs:
+    """Test that schedules and catalogs are converted to SI at ingestion"""
+
+    def test_schedule_units(self):
+        """Test row units, unit defaults and lengths with their own units"""
+        stream = io.StringIO('room_name,length,width,additional_area,vertices,width_cm,length_cm,length_unit\n'
+                             'A,10,12,5,,,,\n'
+                             'B,,,,"[[0,0],[10,0],[10,10],[0,10]]",12,24,\n'
+                             'C,3 m,12ft 6in,,,,,m\n')
+        rejects = []
+        rows = list(RoomSchedule.read(stream, 'csv', {'length_unit': 'ft', 'size_unit': 'in'},
+                                      lambda *row: rejects.append(row)))
+        assert rejects == []
+        a, b, c = (row.room for row in rows)
+        assert a.length_m == pytest.approx(3.048)
+        assert a.get_total_area() == pytest.approx(125 * 0.09290304)
+        assert b.get_total_area() == pytest.approx(100 * 0.09290304)
+        assert rows[1].material.width_cm == pytest.approx(30.48)
+        assert (c.length_m, c.width_m) == pytest.approx((3.0, 3.81))
+
+    def test_catalog_size_unit(self):
+        """Test that catalog piece sizes are converted to mm and cm"""
+        catalog = MaterialCatalog.from_rows([{'sku': 'P1', 'width_cm': 5, 'length_cm': 48, 'thickness_mm': 0.5}],
+                                            size_unit='in')
+        material = catalog.material(0)
+        assert (material.width_cm, material.length_cm) == pytest.approx((12.7, 121.92))
+        assert material.thickness_mm == pytest.approx(12.7)
+        assert len(catalog.query(width_cm=(12, 13))) == 1